@@ -0,0 +1,7 @@
+# app_analyzer/__main__.py
+
+import sys
+from app_analyzer.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
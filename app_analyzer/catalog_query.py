@@ -0,0 +1,138 @@
+# app_analyzer/catalog_query.py
+
+import numpy as np
+
+from app_analyzer.name_index import normalize_query
+from app_analyzer.rating_analytics import RATING_BIN_LABELS
+from app_analyzer.streaming import RATING_BINS
+
+# Faceta de puntuación para los juegos sin puntuar.
+UNRATED_LABEL = "Sin puntuación"
+
+class CatalogQuery:
+    """
+    Consulta combinada sobre un catálogo. Todos los predicados se cumplen
+    a la vez (AND): el nombre contiene 'text'; el juego tiene todos los
+    géneros de 'all_of', al menos uno de 'any_of' y ninguno de 'none_of';
+    y su puntuación está entre 'min_rating' y 'max_rating' (incluidos; si
+    se indica un límite, los juegos sin puntuación quedan fuera).
+    """
+
+    def __init__(self, text='', all_of=(), any_of=(), none_of=(), min_rating=None, max_rating=None):
+        self.text = normalize_query(text) if text else ''
+        self.all_of = tuple(sorted(set(all_of)))
+        self.any_of = tuple(sorted(set(any_of)))
+        self.none_of = tuple(sorted(set(none_of)))
+        self.min_rating = None if min_rating is None else float(min_rating)
+        self.max_rating = None if max_rating is None else float(max_rating)
+
+    @property
+    def has_genres(self):
+        return bool(self.all_of or self.any_of or self.none_of)
+
+    @property
+    def has_rating(self):
+        return self.min_rating is not None or self.max_rating is not None
+
+    def is_empty(self):
+        return not (self.text or self.has_genres or self.has_rating)
+
+    def key(self):
+        """Tupla que identifica la consulta (para la caché de consultas)."""
+        return (self.text, self.all_of, self.any_of, self.none_of, self.min_rating, self.max_rating)
+
+class QueryResult:
+    """
+    Resultado de una consulta: posiciones de las filas (en el orden del
+    catálogo), facetas sobre esas filas (juegos por género y por intervalo
+    de puntuación) y el orden en que se evaluaron los predicados.
+    """
+
+    def __init__(self, positions, genre_counts, rating_counts, plan):
+        self.positions = positions
+        self.genre_counts = genre_counts
+        self.rating_counts = rating_counts
+        self.plan = plan
+
+    def __len__(self):
+        return len(self.positions)
+
+    @classmethod
+    def empty(cls):
+        return cls(np.empty(0, dtype=np.int64), {}, {}, [])
+
+def genre_estimate(query, analytics, rows):
+    """Cota superior de los juegos que cumplen los géneros, con los tamaños ya conocidos."""
+    estimate = rows
+    if query.all_of:
+        estimate = min(analytics.genre_size(name) for name in query.all_of)
+    if query.any_of:
+        estimate = min(estimate, sum(analytics.genre_size(name) for name in query.any_of))
+    return estimate
+
+def plan_query(query, analytics, name_index, rows):
+    """
+    Predicados de 'query' ordenados del más al menos selectivo. Las
+    estimaciones no recorren el catálogo: la puntuación es exacta por
+    búsqueda binaria, el nombre sale de la lista de trigramas más corta y
+    los géneros del tamaño de cada género.
+    """
+    estimates = []
+    if query.text:
+        estimates.append((name_index.estimate(query.text), 'name'))
+    if query.has_rating:
+        start, end = analytics.rating_span(query.min_rating, query.max_rating)
+        estimates.append((end - start, 'rating'))
+    if query.has_genres:
+        estimates.append((genre_estimate(query, analytics, rows), 'genres'))
+    return [step for _, step in sorted(estimates)]
+
+def run_query(query, plan, masks, ratings, name_index, analytics, genre_index, search_names):
+    """
+    Evalúa los predicados en el orden de 'plan'. El primero usa su índice
+    (búsqueda por trigramas, tramo de puntuaciones o máscaras de géneros)
+    para obtener los candidatos; los siguientes solo revisan esos
+    candidatos. 'search_names' devuelve las posiciones del texto (con caché).
+    """
+    positions = None
+    for step in plan:
+        if step == 'name':
+            if positions is None:
+                positions = search_names(query.text)
+            else:
+                positions = name_index.contains(query.text, positions)
+        elif step == 'rating':
+            if positions is None:
+                start, end = analytics.rating_span(query.min_rating, query.max_rating)
+                positions = np.sort(analytics.positions[start:end]).astype(np.int64)
+            else:
+                values = ratings[positions]
+                keep = np.ones(len(positions), dtype=bool)
+                if query.min_rating is not None:
+                    keep &= values >= query.min_rating
+                if query.max_rating is not None:
+                    keep &= values <= query.max_rating
+                positions = positions[keep]
+        else:
+            if positions is None:
+                positions = np.flatnonzero(
+                    genre_index.query(masks, query.all_of, query.any_of, query.none_of)).astype(np.int64)
+            else:
+                positions = positions[
+                    genre_index.query(masks[positions], query.all_of, query.any_of, query.none_of)]
+        if len(positions) == 0:
+            break
+    if positions is None:
+        positions = np.arange(len(masks), dtype=np.int64)
+    return positions
+
+def facet_counts(positions, masks, ratings, genre_index, genre_map):
+    """Juegos por género y por intervalo de puntuación entre las filas 'positions'."""
+    totals = genre_index.count_all(masks[positions]) if len(positions) else {}
+    genre_counts = {genre_map[gid]: count for gid, count in totals.items() if gid in genre_map}
+    values = ratings[positions]
+    rated = values[~np.isnan(values)]
+    bins = np.bincount(np.digitize(rated, RATING_BINS[1:-1]), minlength=len(RATING_BIN_LABELS))
+    rating_counts = {label: int(count) for label, count in zip(RATING_BIN_LABELS, bins)}
+    rating_counts[UNRATED_LABEL] = len(values) - len(rated)
+    return genre_counts, rating_counts
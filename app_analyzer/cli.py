@@ -0,0 +1,241 @@
+# app_analyzer/cli.py
+#
+# Punto de entrada de línea de comandos, sin interfaz gráfica.
+# No importa PyQt6 ni matplotlib, así que funciona en servidores y en cron.
+#
+# Ejemplos (desde la raíz del proyecto):
+#   python -m app_analyzer search --platform PC "zelda"
+#   python -m app_analyzer count --input "catalogos/*/all_games_*.csv" Strategy "Role-playing (RPG)"
+#   python -m app_analyzer report --format json --output reporte.json
+#   python -m app_analyzer search --platform PC "" --format parquet --output pc.parquet
+#   python -m app_analyzer count --platform PC --stream Strategy   (catálogos que no caben en memoria)
+#   python -m app_analyzer favorites
+
+import argparse
+import contextlib
+import glob
+import multiprocessing
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from app_analyzer.cross_platform import STAT_COLUMNS, genre_platform_stats
+from app_analyzer.export import export_frame
+from app_analyzer.favorites_store import SQLiteFavoritesStore
+from app_analyzer.info_data import DataManager
+from app_analyzer.my_favorite_game import FavoritesManager
+
+CATALOG_FILE_PATTERN = re.compile(r'all_games_(.+)\.csv$')
+RANKED_LIMIT = 20
+# 'json' es una lista de objetos; 'jsonl', un objeto por línea.
+OUTPUT_FORMATS = ['csv', 'json', 'jsonl', 'parquet']
+
+def resolve_targets(args):
+    """
+    Lista de (carpeta, plataforma) a procesar, a partir de --input (globs de
+    archivos all_games_<plataforma>.csv) y/o --platform (en --data-dir).
+    """
+    targets = []
+    for pattern in args.input or []:
+        for path in sorted(glob.glob(pattern)):
+            match = CATALOG_FILE_PATTERN.search(os.path.basename(path))
+            if match:
+                targets.append((os.path.dirname(path) or '.', match.group(1)))
+    for platform in args.platform or []:
+        targets.append((args.data_dir, platform))
+    if not targets and not args.input:
+        targets = [(args.data_dir, platform) for platform in DataManager.PLATFORMS]
+    return list(dict.fromkeys(targets))
+
+def _search_job(base_path, platform, query, limit, ranked=False, stream=False):
+    # Los mensajes de DataManager van a stderr para no mezclarse con el resultado.
+    with contextlib.redirect_stdout(sys.stderr):
+        manager = DataManager(base_path=base_path)
+        if stream:
+            # Por bloques: solo se leen del disco las filas encontradas.
+            catalog = manager.stream_catalog(platform)
+            if catalog is None:
+                return pd.DataFrame()
+            positions = catalog.search_positions(query)
+            result = catalog.fetch_rows(positions[:limit] if limit else positions)
+        elif ranked:
+            result = manager.search_ranked(platform, query, limit or RANKED_LIMIT)
+        else:
+            result = manager.search_game_name(platform, query)
+    if limit:
+        result = result.head(limit)
+    result = result.drop(columns=['genre_mask'], errors='ignore').copy()
+    result.insert(0, 'platform', platform)
+    return result
+
+def _count_job(base_path, platform, genres, all_of, any_of, none_of, stream=False):
+    with contextlib.redirect_stdout(sys.stderr):
+        manager = DataManager(base_path=base_path)
+        if stream:
+            catalog = manager.stream_catalog(platform)
+            if catalog is None:
+                return pd.DataFrame()
+            counts = catalog.count_games_by_genre(genres)
+        elif manager.load_new_data(platform):
+            counts = manager.count_games_by_genre(platform, genres)
+        else:
+            return pd.DataFrame()
+        rows = [{'platform': platform, 'query': genre, 'games': count} for genre, count in counts.items()]
+        if all_of or any_of or none_of:
+            if stream:
+                games = len(catalog.genre_positions(all_of, any_of, none_of))
+            else:
+                games = manager.count_games_by_genre_query(platform, all_of, any_of, none_of)
+            rows.append({'platform': platform, 'query': describe_query(all_of, any_of, none_of), 'games': games})
+    return pd.DataFrame(rows)
+
+def _report_job(base_path, platform):
+    with contextlib.redirect_stdout(sys.stderr):
+        manager = DataManager(base_path=base_path)
+        df = manager.read_catalog(platform)
+        if df is None:
+            return pd.DataFrame(columns=STAT_COLUMNS)
+        return genre_platform_stats(df, manager.genre_index, manager.genre_map, platform)
+
+def describe_query(all_of, any_of, none_of):
+    parts = []
+    if all_of:
+        parts.append(" AND ".join(all_of))
+    if any_of:
+        parts.append("(" + " OR ".join(any_of) + ")")
+    if none_of:
+        parts.append(" AND ".join(f"NOT {genre}" for genre in none_of))
+    return " AND ".join(parts)
+
+def run_parallel(job, targets, job_args, jobs):
+    """Ejecuta 'job' para cada objetivo, en paralelo si hay más de uno."""
+    if jobs <= 1 or len(targets) <= 1:
+        results = [job(base_path, platform, *job_args) for base_path, platform in targets]
+    else:
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=min(jobs, len(targets)), mp_context=context) as pool:
+            futures = [pool.submit(job, base_path, platform, *job_args) for base_path, platform in targets]
+            results = [future.result() for future in futures]
+    results = [result for result in results if not result.empty]
+    if not results:
+        return pd.DataFrame()
+    return pd.concat(results, ignore_index=True)
+
+def write_output(df, output_format, output):
+    """
+    Escribe el resultado en CSV, JSON (una lista de objetos), JSON Lines o
+    Parquet a un archivo o a stdout. A archivo, los formatos por filas se
+    escriben por bloques con export_frame.
+    """
+    if output and output_format != 'json':
+        export_frame(df, output, file_format=output_format)
+        return
+    if output_format == 'parquet':
+        raise SystemExit("Error: el formato parquet necesita --output.")
+    if output_format == 'json':
+        text = df.to_json(orient='records', force_ascii=False, indent=2)
+    elif output_format == 'jsonl':
+        text = df.to_json(orient='records', lines=True, force_ascii=False)
+    else:
+        text = df.to_csv(index=False)
+    if output:
+        with open(output, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+        if not text.endswith('\n'):
+            sys.stdout.write('\n')
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m app_analyzer',
+        description="Super Analizador sin interfaz gráfica: búsquedas, conteos y reportes.",
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--data-dir', default='data_base_game',
+                        help="Carpeta con all_games_<plataforma>.csv y genres.csv.")
+    common.add_argument('--platform', action='append',
+                        help="Plataforma a procesar (se puede repetir). Por defecto, todas.")
+    common.add_argument('--input', action='append',
+                        help="Glob de archivos all_games_<plataforma>.csv (se puede repetir).")
+    common.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help="Procesos en paralelo al procesar varios archivos.")
+    common.add_argument('--format', choices=OUTPUT_FORMATS, default='csv')
+    common.add_argument('--output', help="Archivo de salida (por defecto, stdout).")
+
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    stream = argparse.ArgumentParser(add_help=False)
+    stream.add_argument('--stream', action='store_true',
+                        help="Lee el CSV por bloques con memoria acotada, sin cargar el catálogo completo "
+                             "(para archivos que no caben en memoria).")
+
+    search = subparsers.add_parser('search', parents=[common, stream], help="Busca juegos por nombre.")
+    search.add_argument('query')
+    search.add_argument('--limit', type=int, default=0, help="Máximo de resultados por plataforma.")
+    search.add_argument('--fuzzy', action='store_true',
+                        help=f"Búsqueda aproximada ordenada por relevancia (por defecto, {RANKED_LIMIT} resultados).")
+
+    count = subparsers.add_parser('count', parents=[common, stream], help="Cuenta juegos por género.")
+    count.add_argument('genres', nargs='*')
+    count.add_argument('--all-of', nargs='+', default=[], help="Géneros que deben estar todos (AND).")
+    count.add_argument('--any-of', nargs='+', default=[], help="Géneros de los que basta uno (OR).")
+    count.add_argument('--none-of', nargs='+', default=[], help="Géneros excluidos (NOT).")
+
+    subparsers.add_parser('report', parents=[common],
+                          help="Estadísticas de géneros por plataforma (conteos, proporciones y puntuaciones).")
+
+    favorites = subparsers.add_parser('favorites', help="Lista los juegos favoritos.")
+    favorites.add_argument('--db', default='data_base_game/favorites.db')
+    favorites.add_argument('--format', choices=OUTPUT_FORMATS, default='csv')
+    favorites.add_argument('--output')
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.command == 'favorites':
+        # Solo lectura: listar nunca crea la base de datos ni migra favoritos antiguos.
+        if not os.path.exists(args.db):
+            print(f"Error: no existe la base de datos de favoritos '{args.db}'.", file=sys.stderr)
+            return 1
+        store = SQLiteFavoritesStore(args.db, FavoritesManager.COLUMNS, read_only=True)
+        try:
+            favorites = FavoritesManager.clean(store.load_all())
+        finally:
+            store.close()
+        write_output(favorites, args.format, args.output)
+        return 0
+
+    targets = resolve_targets(args)
+    if not targets:
+        print("Error: no se encontraron archivos all_games_<plataforma>.csv.", file=sys.stderr)
+        return 1
+    if args.command in ('count', 'report'):
+        # Sin genres.csv no hay géneros que contar: cada trabajo devolvería una tabla vacía.
+        missing = [base_path for base_path in dict.fromkeys(base_path for base_path, _ in targets)
+                   if not os.path.exists(os.path.join(base_path, "genres.csv"))]
+        for base_path in missing:
+            print(f"Error: no se encontró genres.csv en '{base_path}'.", file=sys.stderr)
+        if missing:
+            return 1
+
+    if args.command == 'search':
+        if args.fuzzy and args.stream:
+            print("Error: --fuzzy no se puede combinar con --stream.", file=sys.stderr)
+            return 1
+        result = run_parallel(_search_job, targets, (args.query, args.limit, args.fuzzy, args.stream), args.jobs)
+    elif args.command == 'count':
+        if not (args.genres or args.all_of or args.any_of or args.none_of):
+            print("Error: indica al menos un género.", file=sys.stderr)
+            return 1
+        result = run_parallel(_count_job, targets,
+                              (args.genres, args.all_of, args.any_of, args.none_of, args.stream), args.jobs)
+    else:
+        result = run_parallel(_report_job, targets, (), args.jobs)
+
+    write_output(result, args.format, args.output)
+    return 0
@@ -0,0 +1,73 @@
+# app_analyzer/cross_platform.py
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+STAT_COLUMNS = [
+    'platform', 'genre_id', 'genre', 'games', 'share',
+    'rated_games', 'rating_mean', 'rating_median', 'rating_min', 'rating_max',
+]
+
+def genre_platform_stats(df, genre_index, genre_map, platform):
+    """
+    Estadísticas por género de un catálogo ya cargado, en formato largo:
+    una fila por género con el número de juegos, su proporción sobre el
+    total de la plataforma y las estadísticas de puntuación.
+    """
+    genre_ids = sorted(genre_map.keys())
+    total = len(df)
+    if 'genre_mask' in df.columns and total:
+        ratings = pd.to_numeric(df['rating'], errors='coerce') if 'rating' in df.columns \
+            else pd.Series(float('nan'), index=df.index)
+        exploded = genre_index.explode(df['genre_mask'].to_numpy())
+        exploded['rating'] = ratings.to_numpy()[exploded['position'].to_numpy()]
+        stats = exploded.groupby('genre_id')['rating'].agg(
+            games='size', rated_games='count', rating_mean='mean',
+            rating_median='median', rating_min='min', rating_max='max',
+        )
+    else:
+        stats = pd.DataFrame(columns=['games', 'rated_games', 'rating_mean',
+                                      'rating_median', 'rating_min', 'rating_max'])
+
+    stats = stats.reindex(genre_ids)
+    stats[['games', 'rated_games']] = stats[['games', 'rated_games']].fillna(0).astype('int64')
+    stats.index.name = 'genre_id'
+    stats = stats.reset_index()
+    stats['platform'] = platform
+    stats['genre'] = stats['genre_id'].map(genre_map)
+    stats['share'] = stats['games'] / total if total else 0.0
+    return stats[STAT_COLUMNS]
+
+def _summarize_platform(base_path, platform):
+    """Se ejecuta en un proceso del pool: carga un catálogo y lo resume."""
+    # Import local para evitar un import circular con info_data.
+    from app_analyzer.info_data import DataManager
+    manager = DataManager(base_path=base_path)
+    df = manager.read_catalog(platform)
+    if df is None:
+        return None
+    return genre_platform_stats(df, manager.genre_index, manager.genre_map, platform)
+
+def summarize_in_pool(base_path, platforms, max_workers=None):
+    """
+    Resume varias plataformas en paralelo, una por proceso.
+    Devuelve un diccionario plataforma -> DataFrame (o None si falló la carga).
+    """
+    if not platforms:
+        return {}
+    max_workers = max_workers or min(len(platforms), os.cpu_count() or 1)
+    # 'spawn' evita heredar los hilos de Qt del proceso principal.
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+        futures = {platform: pool.submit(_summarize_platform, base_path, platform) for platform in platforms}
+        return {platform: future.result() for platform, future in futures.items()}
+
+def to_matrix(stats, value='games'):
+    """Convierte las estadísticas largas en una matriz género × plataforma."""
+    if stats.empty:
+        return pd.DataFrame()
+    platforms = list(dict.fromkeys(stats['platform']))
+    return stats.pivot(index='genre', columns='platform', values=value)[platforms]
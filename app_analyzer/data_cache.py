@@ -0,0 +1,161 @@
+# app_analyzer/data_cache.py
+
+import pandas as pd
+import os
+import json
+import hashlib
+import tempfile
+
+def temp_path(path):
+    """Archivo temporal único junto a 'path', para escribirlo y luego reemplazar 'path' con os.replace."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                    prefix=os.path.basename(path) + '.', suffix='.tmp')
+    os.close(fd)
+    return tmp_path
+
+class DataCache:
+    """
+    Caché persistente en formato Feather (Arrow) para los CSV de videojuegos.
+
+    Cada CSV procesado se guarda junto a un archivo de metadatos con el mtime,
+    el tamaño y el hash SHA-1 del archivo original. Si el CSV cambia, la caché
+    se considera obsoleta y se reconstruye en la siguiente carga.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def _paths(self, source_path):
+        base_name = os.path.splitext(os.path.basename(source_path))[0]
+        data_path = os.path.join(self.cache_dir, f"{base_name}.feather")
+        meta_path = os.path.join(self.cache_dir, f"{base_name}.meta.json")
+        return data_path, meta_path
+
+    @staticmethod
+    def file_hash(path, block_size=1 << 20, size=None):
+        """
+        Calcula el SHA-1 de un archivo leyéndolo por bloques. Con 'size'
+        solo se usan los primeros 'size' bytes.
+        """
+        sha1 = hashlib.sha1()
+        remaining = size
+        with open(path, 'rb') as f:
+            while remaining is None or remaining > 0:
+                block = f.read(block_size if remaining is None else min(block_size, remaining))
+                if not block:
+                    break
+                sha1.update(block)
+                if remaining is not None:
+                    remaining -= len(block)
+        return sha1.hexdigest()
+
+    @staticmethod
+    def snapshot(source_path):
+        """
+        Lee 'source_path' de una sola vez y devuelve (bytes, huella). La
+        huella ({'mtime_ns', 'size', 'sha1'}) describe exactamente los bytes
+        devueltos, aunque el archivo siga creciendo mientras se procesan.
+        """
+        stat = os.stat(source_path)
+        with open(source_path, 'rb') as f:
+            data = f.read(stat.st_size)
+        return data, {'mtime_ns': stat.st_mtime_ns, 'size': len(data), 'sha1': hashlib.sha1(data).hexdigest()}
+
+    def _fingerprint(self, source_path, with_hash=True):
+        stat = os.stat(source_path)
+        fingerprint = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+        if with_hash:
+            fingerprint['sha1'] = self.file_hash(source_path)
+        return fingerprint
+
+    def _read_meta(self, meta_path):
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_valid(self, source_path, extra_key=''):
+        """
+        Indica si la caché de 'source_path' sigue vigente.
+        Si el mtime o el tamaño difieren se compara el hash, para no
+        invalidar la caché cuando el archivo solo fue tocado.
+        """
+        data_path, meta_path = self._paths(source_path)
+        meta = self._read_meta(meta_path)
+        if meta is None or not os.path.exists(data_path):
+            return False
+        if meta.get('extra_key') != extra_key:
+            return False
+
+        current = self._fingerprint(source_path, with_hash=False)
+        if current['mtime_ns'] == meta.get('mtime_ns') and current['size'] == meta.get('size'):
+            return True
+        if current['size'] != meta.get('size'):
+            return False
+        if self.file_hash(source_path) != meta.get('sha1'):
+            return False
+
+        # El contenido es el mismo: se actualiza el mtime para evitar rehashear.
+        meta['mtime_ns'] = current['mtime_ns']
+        self._write_meta(meta_path, meta)
+        return True
+
+    def fingerprint(self, source_path):
+        """
+        Huella (mtime, tamaño y SHA-1) del archivo original con el que se
+        escribió la caché, según los metadatos guardados (sin volver a
+        leerlo), o None si no hay caché para 'source_path'.
+        """
+        _, meta_path = self._paths(source_path)
+        meta = self._read_meta(meta_path)
+        if meta is None or 'sha1' not in meta:
+            return None
+        return {'mtime_ns': meta['mtime_ns'], 'size': meta['size'], 'sha1': meta['sha1']}
+
+    def load(self, source_path, extra_key=''):
+        """Devuelve el DataFrame cacheado o None si no existe o está obsoleto."""
+        if not self.is_valid(source_path, extra_key):
+            return None
+        data_path, _ = self._paths(source_path)
+        try:
+            return pd.read_feather(data_path)
+        except (ImportError, OSError, ValueError) as e:
+            print(f"ADVERTENCIA: No se pudo leer la caché '{data_path}': {e}")
+            return None
+
+    def store(self, source_path, df, fingerprint, extra_key=''):
+        """
+        Guarda 'df' como caché de 'source_path' de forma atómica.
+        'fingerprint' es la huella de los bytes con los que se construyó
+        'df' (ver snapshot), tomada antes de procesarlos: si el archivo
+        cambió entretanto, la caché queda obsoleta en lugar de marcarse
+        como válida para el archivo nuevo.
+        """
+        data_path, meta_path = self._paths(source_path)
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = temp_path(data_path)
+            df.reset_index(drop=True).to_feather(tmp_path)
+            os.replace(tmp_path, data_path)
+        except (ImportError, OSError, TypeError, ValueError) as e:
+            print(f"ADVERTENCIA: No se pudo escribir la caché para '{source_path}': {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+        meta = dict(fingerprint, extra_key=extra_key)
+        self._write_meta(meta_path, meta)
+        return True
+
+    def _write_meta(self, meta_path, meta):
+        tmp_path = temp_path(meta_path)
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            os.replace(tmp_path, meta_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
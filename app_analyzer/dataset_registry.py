@@ -0,0 +1,100 @@
+# app_analyzer/dataset_registry.py
+
+from collections import OrderedDict
+
+class PlatformDataset:
+    """
+    Catálogo de una plataforma junto con los índices construidos al cargarlo.
+    """
+
+    def __init__(self, platform, df, name_index=None, version=None, game_keys=None,
+                 row_checksums=None, source=None):
+        self.platform = platform
+        self.df = df
+        self.name_index = name_index
+        # Clave de juego (uint64) de cada fila; identifica el juego entre plataformas.
+        self.game_keys = game_keys
+        # Checksum de cada fila del CSV y huella {'mtime_ns', 'size', 'sha1'} de los bytes leídos,
+        # para recargar solo lo que cambie (DataManager.reload).
+        self.row_checksums = row_checksums
+        self.source = source
+        # Identifica los datos de origen; cambia si el CSV o el mapeo de géneros cambian.
+        self.version = version
+        # Índice de búsqueda aproximada; se construye la primera vez que se usa.
+        self.ranked_search = None
+        # Analítica de puntuaciones (RatingAnalytics); también se construye al usarla.
+        self.rating_analytics = None
+
+    def memory_usage(self):
+        """Memoria en bytes del DataFrame (incluye strings) y de sus índices."""
+        total = int(self.df.memory_usage(deep=True).sum())
+        if self.name_index is not None:
+            total += self.name_index.nbytes
+        if self.game_keys is not None:
+            total += self.game_keys.nbytes
+        if self.row_checksums is not None:
+            total += self.row_checksums.nbytes
+        if self.ranked_search is not None:
+            total += self.ranked_search.nbytes
+        if self.rating_analytics is not None:
+            total += self.rating_analytics.nbytes
+        return total
+
+class DatasetRegistry:
+    """
+    Registro en memoria de los catálogos cargados (PlatformDataset), uno por plataforma.
+
+    Mantiene los DataFrames en orden de uso (LRU) y descarta los menos
+    usados cuando la memoria total supera el presupuesto configurado.
+    El catálogo usado más recientemente nunca se descarta.
+    """
+
+    def __init__(self, memory_budget_mb=1024):
+        self.memory_budget = int(memory_budget_mb * 1024 * 1024)
+        self._datasets = OrderedDict()
+        self._sizes = {}
+
+    def __contains__(self, platform):
+        return platform in self._datasets
+
+    def __len__(self):
+        return len(self._datasets)
+
+    def get(self, platform):
+        """Devuelve el catálogo de 'platform' (o None) y lo marca como reciente."""
+        if platform not in self._datasets:
+            return None
+        self._datasets.move_to_end(platform)
+        return self._datasets[platform]
+
+    def put(self, platform, dataset):
+        """Registra el catálogo de 'platform' y aplica el presupuesto de memoria."""
+        self._datasets[platform] = dataset
+        self._datasets.move_to_end(platform)
+        self._sizes[platform] = dataset.memory_usage()
+        self._evict()
+
+    def remove(self, platform):
+        self._datasets.pop(platform, None)
+        self._sizes.pop(platform, None)
+
+    def clear(self):
+        self._datasets.clear()
+        self._sizes.clear()
+
+    def platforms(self):
+        """Plataformas cargadas, de la menos a la más recientemente usada."""
+        return list(self._datasets.keys())
+
+    def memory_usage(self):
+        """Memoria en bytes de cada catálogo cargado."""
+        return dict(self._sizes)
+
+    def total_memory(self):
+        return sum(self._sizes.values())
+
+    def _evict(self):
+        while len(self._datasets) > 1 and self.total_memory() > self.memory_budget:
+            platform, _ = self._datasets.popitem(last=False)
+            self._sizes.pop(platform, None)
+            print(f"Catálogo de {platform} descartado de memoria (presupuesto excedido).")
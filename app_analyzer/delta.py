@@ -0,0 +1,89 @@
+# app_analyzer/delta.py
+
+import io
+
+import numpy as np
+import pandas as pd
+
+from app_analyzer.schema import CATALOG_COLUMNS, coerce_ratings
+
+# Columna con la que la caché guarda el checksum de cada fila.
+CHECKSUM_COLUMN = 'row_checksum'
+
+def row_checksums(df):
+    """
+    Checksum uint64 de cada fila tal como viene del CSV (nombre, lista de
+    IDs de género sin traducir y puntuación). Debe calcularse antes de
+    decode_genres.
+    """
+    combined = np.zeros(len(df), dtype=np.uint64)
+    for column in CATALOG_COLUMNS:
+        if column not in df.columns:
+            continue
+        values = df[column]
+        if column == 'genres':
+            # Pocas listas distintas: se hashea cada una una sola vez.
+            codes, uniques = pd.factorize(values, use_na_sentinel=False)
+            hashes = pd.util.hash_array(np.asarray(uniques, dtype=object))[codes]
+        elif pd.api.types.is_float_dtype(values):
+            hashes = pd.util.hash_array(values.to_numpy())
+        else:
+            hashes = pd.util.hash_array(values.to_numpy(dtype=object))
+        combined = combined * np.uint64(1_000_003) ^ hashes
+    return combined
+
+def _occurrence_keys(checksums):
+    """
+    Hace únicos los checksums repetidos (filas idénticas) mezclando el
+    número de aparición, para emparejar filas una a una.
+    """
+    if not pd.Series(checksums).duplicated().any():
+        return checksums
+    order = np.argsort(checksums, kind='stable')
+    ordered = checksums[order]
+    starts = np.concatenate(([True], ordered[1:] != ordered[:-1]))[:len(ordered)]
+    run_start = np.maximum.accumulate(np.where(starts, np.arange(len(ordered)), 0))
+    occurrence = np.empty(len(ordered), dtype=np.uint64)
+    occurrence[order] = (np.arange(len(ordered)) - run_start).astype(np.uint64)
+    return checksums + occurrence * np.uint64(0x9E3779B97F4A7C15)
+
+def match_rows(old_checksums, new_checksums):
+    """
+    Compara dos versiones de un catálogo por checksum de fila. Devuelve
+    (keep, fresh): las filas antiguas que siguen igual y las filas nuevas
+    que no estaban (añadidas o modificadas).
+    """
+    old_keys = pd.Series(_occurrence_keys(old_checksums))
+    new_keys = pd.Series(_occurrence_keys(new_checksums))
+    # isin de pandas usa una tabla hash; np.isin ordenaría ambos arrays.
+    keep = old_keys.isin(new_keys).to_numpy()
+    fresh = ~new_keys.isin(old_keys).to_numpy()
+    return keep, fresh
+
+def read_appended_rows(data, start, read_options):
+    """
+    Lee solo las filas de 'data' (contenido del CSV) escritas a partir del
+    byte 'start' (que debe ser un inicio de línea), reutilizando la cabecera.
+    """
+    header = data[:data.find(b'\n') + 1]
+    return coerce_ratings(pd.read_csv(io.BytesIO(header + data[start:]), **read_options))
+
+def ends_with_newline(data, size):
+    """Indica si el byte 'size' - 1 de 'data' es un salto de línea."""
+    if size == 0:
+        return True
+    return data[size - 1:size] in (b'\n', b'\r')
+
+def concat_catalogs(old, new):
+    """
+    Une dos partes de un catálogo conservando las columnas categóricas
+    (pd.concat las convertiría a texto si sus categorías difieren).
+    """
+    if len(new) == 0:
+        return old.reset_index(drop=True)
+    result = pd.concat([old, new], ignore_index=True)
+    for column in old.columns:
+        if isinstance(old[column].dtype, pd.CategoricalDtype) and column in new.columns:
+            result[column] = pd.api.types.union_categoricals(
+                [old[column], new[column].astype('category')], ignore_order=True)
+    return result
@@ -0,0 +1,118 @@
+# app_analyzer/export.py
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from app_analyzer.data_cache import temp_path
+from app_analyzer.metrics import metrics
+from app_analyzer.streaming import ArrowFileSink
+
+# Formato -> extensión. 'jsonl' es JSON Lines: un objeto por línea.
+EXPORT_FORMATS = {'csv': '.csv', 'jsonl': '.jsonl', 'parquet': '.parquet'}
+# Columnas internas que no se exportan.
+INTERNAL_COLUMNS = ['genre_mask']
+EXPORT_CHUNKSIZE = 100_000
+
+def format_for_path(path):
+    """Formato de exportación según la extensión de 'path' (CSV por defecto)."""
+    extension = os.path.splitext(path)[1].lower()
+    for file_format, format_extension in EXPORT_FORMATS.items():
+        if extension == format_extension:
+            return file_format
+    if extension == '.json':
+        return 'jsonl'
+    return 'csv'
+
+class CsvFileSink:
+    """Escribe bloques de un DataFrame en un CSV; la cabecera va con el primero."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'w', encoding='utf-8', newline='')
+        self._header = True
+
+    def write(self, chunk):
+        chunk.to_csv(self._file, header=self._header, index=False)
+        self._header = False
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+class JsonLinesFileSink:
+    """Escribe bloques de un DataFrame como JSON Lines (un objeto por fila)."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'w', encoding='utf-8', newline='\n')
+
+    def write(self, chunk):
+        if len(chunk):
+            text = chunk.to_json(orient='records', lines=True, force_ascii=False)
+            self._file.write(text if text.endswith('\n') else text + '\n')
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+def open_sink(path, file_format):
+    """Sink con la interfaz write/close de ArrowFileSink para 'file_format'."""
+    if file_format == 'csv':
+        return CsvFileSink(path)
+    if file_format == 'jsonl':
+        return JsonLinesFileSink(path)
+    if file_format == 'parquet':
+        return ArrowFileSink(path, 'parquet')
+    raise ValueError(f"Formato de exportación no soportado: {file_format}")
+
+def export_frame(df, path, positions=None, file_format=None, columns=None,
+                 chunksize=EXPORT_CHUNKSIZE, progress=None):
+    """
+    Exporta las filas 'positions' de 'df' (todas si es None, en el orden
+    dado) a 'path' en CSV, JSON Lines o Parquet.
+
+    Las filas se toman y escriben de a 'chunksize', así que solo existe a
+    la vez la copia de un bloque, nunca la del resultado completo. Se
+    escribe primero a un archivo temporal que reemplaza al destino al
+    terminar, para no dejar exportaciones a medias; cada exportación usa
+    su propio temporal, así que dos a la vez no se pisan. 'progress'
+    recibe un mensaje por bloque. Devuelve el número de filas exportadas.
+    """
+    file_format = file_format or format_for_path(path)
+    if positions is None:
+        positions = np.arange(len(df), dtype=np.int64)
+    positions = np.asarray(positions, dtype=np.int64)
+    if columns is None:
+        columns = [column for column in df.columns if column not in INTERNAL_COLUMNS]
+    total = len(positions)
+    tmp_path = temp_path(path)
+    with metrics.measure('export', rows=total, format=file_format):
+        sink = None
+        try:
+            sink = open_sink(tmp_path, file_format)
+            if total == 0:
+                sink.write(df.iloc[:0][columns])
+            for start in range(0, total, chunksize):
+                sink.write(df.iloc[positions[start:start + chunksize]][columns])
+                if progress is not None:
+                    done = min(start + chunksize, total)
+                    progress(f"Exportadas {done} de {total} filas ({done * 100 // total}%)...")
+            sink.close()
+            os.replace(tmp_path, path)
+        except BaseException:
+            if sink is not None:
+                sink.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    return total
+
+def counts_frame(counts, value_name='games'):
+    """Conteos {género: n} o matriz género × plataforma como tabla exportable."""
+    if isinstance(counts, pd.DataFrame):
+        return counts.rename_axis(counts.index.name or 'genre').reset_index()
+    return pd.DataFrame({'genre': list(counts.keys()), value_name: list(counts.values())})
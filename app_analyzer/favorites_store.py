@@ -0,0 +1,115 @@
+# app_analyzer/favorites_store.py
+
+import os
+import sqlite3
+from urllib.request import pathname2url
+import pandas as pd
+
+def _to_sql_value(value):
+    """Convierte escalares de numpy/pandas a tipos que sqlite3 sabe guardar."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if hasattr(value, 'item'):
+        return value.item()
+    return value
+
+class SQLiteFavoritesStore:
+    """
+    Almacenamiento de favoritos en SQLite, indexado por la columna
+    'key_column' (la clave de juego).
+
+    Cada cambio es un upsert o un borrado de una sola fila, y los lotes se
+    escriben en una única transacción, así que un corte a mitad de un
+    guardado nunca deja el archivo a medio escribir.
+    """
+
+    def __init__(self, path, columns, key_column='game_key', migrate=None, read_only=False):
+        self.path = path
+        self.columns = list(columns)
+        self.key_column = key_column
+        if read_only:
+            # Solo lectura: no crea el archivo, no cambia el modo del diario ni migra nada.
+            uri = f"file:{pathname2url(os.path.abspath(path))}?mode=ro"
+            self.connection = sqlite3.connect(uri, uri=True)
+            self.migrated_rows = None
+            return
+        self.connection = sqlite3.connect(path)
+        # WAL permite escrituras atómicas baratas y lecturas durante la escritura.
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        # Filas migradas desde una tabla con un esquema anterior, o None si no hubo migración.
+        self.migrated_rows = self._migrate_legacy_table(migrate)
+        with self.connection:
+            self.connection.execute(self._create_sql('favorites', if_not_exists=True))
+
+    def _create_sql(self, table, if_not_exists=False):
+        column_defs = ", ".join(
+            f"{column} TEXT PRIMARY KEY" if column == self.key_column else f"{column}"
+            for column in self.columns
+        )
+        return f"CREATE TABLE {'IF NOT EXISTS ' if if_not_exists else ''}{table} ({column_defs})"
+
+    def _migrate_legacy_table(self, migrate):
+        """
+        Si la tabla existente no tiene la columna clave (p. ej. estaba
+        indexada por nombre), convierte sus filas con 'migrate' (DataFrame
+        antiguo -> DataFrame con 'columns') y reemplaza la tabla en una sola
+        transacción: un fallo a mitad deja la tabla anterior intacta.
+        Devuelve el número de filas migradas, o None si no hacía falta.
+        """
+        existing = self._existing_columns()
+        if not existing or self.key_column in existing:
+            return None
+        if migrate is None:
+            raise ValueError(f"La tabla de favoritos de '{self.path}' tiene un esquema anterior.")
+        legacy_df = pd.read_sql_query("SELECT * FROM favorites ORDER BY rowid", self.connection)
+        migrated = migrate(legacy_df).reindex(columns=self.columns)
+        placeholders = ", ".join("?" for _ in self.columns)
+        with self.connection:
+            # BEGIN explícito: sqlite3 no abre la transacción antes de un CREATE TABLE.
+            self.connection.execute("BEGIN")
+            self.connection.execute(self._create_sql('favorites_migrated'))
+            self.connection.executemany(
+                f"INSERT INTO favorites_migrated ({', '.join(self.columns)}) VALUES ({placeholders})",
+                [tuple(_to_sql_value(value) for value in row) for row in migrated.itertuples(index=False)])
+            self.connection.execute("DROP TABLE favorites")
+            self.connection.execute("ALTER TABLE favorites_migrated RENAME TO favorites")
+        return len(migrated)
+
+    def _existing_columns(self):
+        return [row[1] for row in self.connection.execute("PRAGMA table_info(favorites)")]
+
+    def load_all(self):
+        """
+        Devuelve todos los favoritos como DataFrame, en orden de inserción.
+        Las columnas que la tabla no tenga (solo posible en modo lectura,
+        con un esquema anterior sin migrar) quedan vacías.
+        """
+        existing = self._existing_columns()
+        selected = [column for column in self.columns if column in existing]
+        if not selected:
+            return pd.DataFrame(columns=self.columns)
+        query = f"SELECT {', '.join(selected)} FROM favorites ORDER BY rowid"
+        return pd.read_sql_query(query, self.connection).reindex(columns=self.columns)
+
+    def apply(self, upserts, deletes):
+        """
+        Aplica en una sola transacción una lista de registros (diccionarios)
+        a insertar o actualizar y una lista de claves a borrar.
+        """
+        placeholders = ", ".join("?" for _ in self.columns)
+        updates = ", ".join(f"{column}=excluded.{column}" for column in self.columns if column != self.key_column)
+        upsert_sql = (
+            f"INSERT INTO favorites ({', '.join(self.columns)}) VALUES ({placeholders}) "
+            f"ON CONFLICT({self.key_column}) DO UPDATE SET {updates}"
+        )
+        with self.connection:
+            if deletes:
+                self.connection.executemany(
+                    f"DELETE FROM favorites WHERE {self.key_column} = ?", [(key,) for key in deletes])
+            if upserts:
+                self.connection.executemany(
+                    upsert_sql, [tuple(_to_sql_value(record.get(column)) for column in self.columns) for record in upserts])
+
+    def close(self):
+        self.connection.close()
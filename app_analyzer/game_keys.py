@@ -0,0 +1,149 @@
+# app_analyzer/game_keys.py
+
+import numpy as np
+import pandas as pd
+
+from app_analyzer.name_index import normalize_names
+
+try:
+    import pyarrow  # noqa: F401
+    # El motor regex de Arrow es más rápido para comprobar qué nombres hay que reescribir.
+    CHECK_DTYPE = 'string[pyarrow]'
+except ImportError:  # pyarrow es opcional.
+    CHECK_DTYPE = object
+
+# Marcas combinantes que se eliminan: acentos latinos y marcas sobre símbolos.
+LATIN_MARKS = '[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]'
+# Marcas de otras escrituras (cirílico, hebreo, árabe, índicas, tailandés, kana)
+# que pueden quedar tras recomponer con NFC; no son \w, pero forman parte de la letra.
+SCRIPT_MARKS = '\u0483-\u0489\u0591-\u05c7\u0610-\u061a\u064b-\u065f\u0670\u0900-\u0dff\u0e31-\u0e4e\u3099\u309a'
+
+def canonical_names(names):
+    """
+    Forma canónica de los nombres para identificar un juego entre catálogos:
+    la normalización de la búsqueda (sin ™/®/©, sin acentos, minúsculas) y
+    además sin signos ni símbolos ("Half-Life™ 2" -> "half life 2"). Las
+    letras de otras escrituras se recomponen (NFC), así que "ポケモン" y
+    "ホケモン" siguen siendo juegos distintos.
+    """
+    return canonical_from_normalized(normalize_names(pd.Series(names, dtype=object)))
+
+def canonical_from_normalized(normalized):
+    """Como canonical_names, para nombres ya normalizados (p. ej. NameIndex.names)."""
+    canonical = pd.Series(normalized, dtype=object)
+    # Casi todos los nombres ya son canónicos; solo se reescriben los que tienen
+    # otros caracteres.
+    other = pd.Series(normalized, dtype=CHECK_DTYPE).str.contains('[^a-z0-9 ]').to_numpy(dtype=bool)
+    if other.any():
+        # En object para usar el motor 're' de Python, donde \w incluye letras no latinas.
+        canonical = canonical.copy()
+        canonical[other] = (
+            canonical[other]
+            .str.replace(LATIN_MARKS, '', regex=True)
+            .str.normalize('NFC')
+            .str.replace(f'[^\\w\\s{SCRIPT_MARKS}]|_', ' ', regex=True)
+            .str.replace(r'\s+', ' ', regex=True)
+            .str.strip()
+        )
+    return canonical
+
+def game_keys_from_canonical(canonical):
+    """Claves uint64 de nombres ya canónicos (hash estable entre ejecuciones)."""
+    return pd.util.hash_array(np.asarray(canonical, dtype=object))
+
+def game_keys(names):
+    """Clave de juego (uint64) de cada nombre; la misma en todas las plataformas."""
+    return game_keys_from_canonical(canonical_names(names))
+
+def game_key(name):
+    return int(game_keys([name])[0])
+
+def format_key(key):
+    """Clave como texto hexadecimal de 16 cifras (SQLite no guarda enteros sin signo de 64 bits)."""
+    return f"{int(key):016x}"
+
+def parse_key(text):
+    return int(text, 16)
+
+def key_value(key):
+    """Clave como entero: acepta el texto de format_key (el que guardan los favoritos) o un entero."""
+    return parse_key(key) if isinstance(key, str) else int(key)
+
+def first_occurrences(keys):
+    """Máscara de la primera fila de cada clave: quita duplicados sin bucles."""
+    return ~pd.Series(keys).duplicated().to_numpy()
+
+class GameKeyIndex:
+    """
+    Índice global de identidad de juegos: para cada clave, las plataformas
+    en las que aparece.
+
+    Guarda las claves distintas en un array junto con una máscara de bits
+    de plataformas, y un índice hash de pandas sobre las claves, así que
+    "¿en qué plataformas está este juego?" es una consulta O(1). Se
+    actualiza cada vez que se carga un catálogo y no se vacía cuando el
+    registro descarta un DataFrame, por lo que ocupa poco (12 bytes por
+    juego distinto) y recuerda todo lo cargado en la sesión.
+    """
+
+    def __init__(self, platforms):
+        self.platforms = list(platforms)
+        self.bits = {platform: np.uint32(1 << i) for i, platform in enumerate(self.platforms)}
+        self.keys = np.empty(0, dtype=np.uint64)
+        self.masks = np.empty(0, dtype=np.uint32)
+        self.indexed = set()
+        self._index = pd.Index(self.keys)
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def nbytes(self):
+        return self.keys.nbytes + self.masks.nbytes
+
+    def update(self, platform, keys):
+        """Registra las claves de 'platform', reemplazando las que tuviera antes."""
+        if platform not in self.bits:
+            self.bits[platform] = np.uint32(1 << len(self.platforms))
+            self.platforms.append(platform)
+        bit = self.bits[platform]
+        masks = self.masks & ~bit
+        new_keys = pd.unique(np.asarray(keys, dtype=np.uint64))
+        found = self._index.get_indexer(new_keys)
+        known = found >= 0
+        masks[found[known]] |= bit
+        self.keys = np.concatenate([self.keys, new_keys[~known]])
+        self.masks = np.concatenate([masks, np.full(int((~known).sum()), bit, dtype=np.uint32)])
+        self.indexed.add(platform)
+        self._compact()
+
+    def remove(self, platform):
+        if platform in self.bits:
+            self.masks = self.masks & ~self.bits[platform]
+            self.indexed.discard(platform)
+            self._compact()
+
+    def _compact(self):
+        # Las claves que ya no están en ninguna plataforma se descartan.
+        keep = self.masks != 0
+        if not keep.all():
+            self.keys, self.masks = self.keys[keep], self.masks[keep]
+        self._index = pd.Index(self.keys)
+
+    def platform_masks(self, keys):
+        """Máscara de plataformas de cada clave (0 si no se conoce)."""
+        found = self._index.get_indexer(np.asarray(keys, dtype=np.uint64))
+        if len(self.masks) == 0:
+            return np.zeros(len(found), dtype=np.uint32)
+        return np.where(found >= 0, self.masks[np.maximum(found, 0)], 0).astype(np.uint32)
+
+    def platforms_of_mask(self, mask):
+        return [platform for platform in self.platforms if mask & self.bits[platform]]
+
+    def platforms_for(self, key):
+        """Plataformas (ya indexadas) en las que aparece el juego con esta clave."""
+        try:
+            position = self._index.get_loc(np.uint64(key))
+        except KeyError:
+            return []
+        return self.platforms_of_mask(self.masks[position])
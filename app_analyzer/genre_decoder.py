@@ -0,0 +1,73 @@
+# app_analyzer/genre_decoder.py
+
+import numpy as np
+import pandas as pd
+
+# Lista de IDs con el formato de los CSV: "[4, 15, 31]" o "[]".
+GENRE_LIST_PATTERN = r'\[\s*(?:-?\d+\s*(?:,\s*-?\d+\s*)*,?\s*)?\]'
+
+NO_GENRE = "Sin género"
+UNKNOWN_GENRE = "Desconocido"
+INVALID_GENRE = "Género inválido"
+
+def explode_genre_ids(genre_lists):
+    """
+    Separa una Series de listas de IDs ("[4, 15]") en una fila por ID.
+    Devuelve una Series de enteros cuyo índice repite el de la fila original.
+    Las listas vacías no generan filas.
+    """
+    tokens = genre_lists.str.strip('[] ').str.split(',').explode().str.strip()
+    tokens = tokens[tokens.notna() & (tokens != '')]
+    return tokens.astype('int64')
+
+def decode_genre_ids(genres, genre_map):
+    """
+    Traduce en bloque una columna de listas de IDs de género ("[4, 15]").
+
+    Los catálogos repiten muchas veces las mismas combinaciones de géneros,
+    así que solo se decodifican los valores únicos y el resultado se reparte
+    a todas las filas con los códigos de factorize. Los IDs se separan con
+    split/explode, se traducen con un único map contra 'genre_map' y los
+    nombres se unen columna a columna, sin recorrer las filas en Python.
+
+    Devuelve una tupla (nombres, ids):
+      - nombres: Series categórica con los géneros unidos por ', ' para
+        mostrar; cada combinación distinta se guarda una sola vez.
+      - ids: Series con la lista de IDs enteros de cada fila.
+    """
+    codes, uniques = pd.factorize(genres, use_na_sentinel=True)
+    uniques = pd.Series(uniques, dtype=object).astype(str)
+    valid = uniques.str.fullmatch(GENRE_LIST_PATTERN).to_numpy(dtype=bool)
+
+    unique_names = np.full(len(uniques) + 1, INVALID_GENRE, dtype=object)
+    unique_ids = np.empty(len(uniques) + 1, dtype=object)
+    for position in range(len(unique_ids)):
+        unique_ids[position] = []
+    # La última posición corresponde a las filas nulas (código -1).
+    unique_names[-1] = NO_GENRE
+    unique_names[:-1][valid] = ''
+
+    ids = explode_genre_ids(uniques[valid])
+    if not ids.empty:
+        position = ids.groupby(level=0).cumcount().to_numpy()
+        rows = ids.index.to_numpy()
+        wide_ids = pd.Series(ids.to_numpy(), index=[rows, position]).unstack(fill_value=-1)
+        wide_names = wide_ids.apply(
+            lambda col: col.map(genre_map).fillna(UNKNOWN_GENRE).where(col != -1))
+
+        joined = wide_names[0]
+        for column in wide_names.columns[1:]:
+            next_name = wide_names[column]
+            joined = joined.where(next_name.isna(), joined + ', ' + next_name)
+
+        unique_names[wide_ids.index] = joined.to_numpy()
+        for position, row in zip(wide_ids.index, wide_ids.to_numpy().tolist()):
+            unique_ids[position] = [genre_id for genre_id in row if genre_id != -1]
+
+    codes = np.where(codes == -1, len(uniques), codes)
+    name_codes, categories = pd.factorize(unique_names)
+    index = genres.index
+    return (
+        pd.Series(pd.Categorical.from_codes(name_codes[codes], categories), index=index, name=genres.name),
+        pd.Series(unique_ids[codes], index=index, name='genre_ids', dtype=object),
+    )
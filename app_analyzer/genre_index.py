@@ -0,0 +1,101 @@
+# app_analyzer/genre_index.py
+
+import numpy as np
+import pandas as pd
+
+class GenreIndex:
+    """
+    Índice de géneros basado en máscaras de bits.
+
+    Cada ID de 'genre_map' recibe un bit (ordenados por ID) y cada juego
+    guarda en la columna 'genre_mask' la unión de los bits de sus géneros.
+    Así los conteos y filtros por combinaciones de géneros son operaciones
+    vectorizadas sobre un array de enteros, y las coincidencias son exactas
+    (por ejemplo "Strategy" ya no coincide con "Real Time Strategy (RTS)").
+    """
+    MAX_GENRES = 64
+
+    def __init__(self, genre_map):
+        genre_ids = sorted(genre_map.keys())
+        if len(genre_ids) > self.MAX_GENRES:
+            print(f"ADVERTENCIA: Solo se indexan los primeros {self.MAX_GENRES} géneros.")
+            genre_ids = genre_ids[:self.MAX_GENRES]
+        self.bits = {gid: np.uint64(1 << position) for position, gid in enumerate(genre_ids)}
+        self.positions = {gid: position for position, gid in enumerate(genre_ids)}
+        self.name_to_id = {name: gid for gid, name in genre_map.items() if gid in self.bits}
+
+    def build_masks(self, genre_ids):
+        """Calcula la máscara de cada fila a partir de la columna 'genre_ids'."""
+        masks = np.zeros(len(genre_ids), dtype=np.uint64)
+        exploded = pd.Series(genre_ids.to_numpy(), dtype=object).explode().dropna()
+        if exploded.empty:
+            return masks
+        bits = exploded.astype('int64').map(self.bits).dropna()
+        np.bitwise_or.at(masks, bits.index.to_numpy(), bits.to_numpy(dtype=np.uint64))
+        return masks
+
+    def explode(self, masks):
+        """
+        Forma larga de las máscaras: una fila (posición, genre_id) por cada
+        género de cada juego. Se recorre un género a la vez, de forma vectorizada.
+        """
+        positions = []
+        genre_ids = []
+        for gid, bit in self.bits.items():
+            rows = np.flatnonzero(masks & bit)
+            positions.append(rows)
+            genre_ids.append(np.full(len(rows), gid, dtype=np.int64))
+        if not positions:
+            return pd.DataFrame({'position': np.empty(0, dtype=np.int64), 'genre_id': np.empty(0, dtype=np.int64)})
+        return pd.DataFrame({'position': np.concatenate(positions), 'genre_id': np.concatenate(genre_ids)})
+
+    def mask_for(self, genre_names):
+        """
+        Une los bits de los géneros indicados por nombre.
+        Devuelve (máscara, hay_desconocidos).
+        """
+        mask = np.uint64(0)
+        unknown = False
+        for name in genre_names:
+            gid = self.name_to_id.get(name)
+            if gid is None:
+                unknown = True
+            else:
+                mask |= self.bits[gid]
+        return mask, unknown
+
+    def query(self, masks, all_of=(), any_of=(), none_of=()):
+        """
+        Devuelve un array booleano con las filas que tienen todos los géneros
+        de 'all_of', al menos uno de 'any_of' y ninguno de 'none_of'.
+        """
+        selected = np.ones(len(masks), dtype=bool)
+        if all_of:
+            required, unknown = self.mask_for(all_of)
+            if unknown:
+                return np.zeros(len(masks), dtype=bool)
+            selected &= (masks & required) == required
+        if any_of:
+            wanted, _ = self.mask_for(any_of)
+            selected &= (masks & wanted) != 0
+        if none_of:
+            excluded, _ = self.mask_for(none_of)
+            selected &= (masks & excluded) == 0
+        return selected
+
+    def count_all(self, masks):
+        """
+        Cuenta los juegos de cada género en una sola reducción.
+        Como hay pocas combinaciones distintas, se desempaquetan solo las
+        máscaras únicas y se ponderan por su frecuencia.
+        """
+        unique_masks, frequency = np.unique(masks, return_counts=True)
+        bit_matrix = np.unpackbits(
+            unique_masks.astype('<u8').view(np.uint8).reshape(-1, 8), axis=1, bitorder='little')
+        totals = frequency @ bit_matrix
+        return {gid: int(totals[position]) for gid, position in self.positions.items()}
+
+    def count(self, masks, genre_names):
+        """Número de juegos que tienen cada uno de los géneros indicados."""
+        totals = self.count_all(masks)
+        return {name: totals.get(self.name_to_id.get(name), 0) for name in genre_names}
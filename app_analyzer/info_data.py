@@ -1,17 +1,53 @@
 # app_analyzer/info_data.py
 
 import pandas as pd
+import numpy as np
+import io
+import hashlib
 import os
-import ast
+import threading
+from app_analyzer.catalog_query import QueryResult, facet_counts, plan_query, run_query
+from app_analyzer.cross_platform import genre_platform_stats, summarize_in_pool, STAT_COLUMNS
+from app_analyzer.data_cache import DataCache
+from app_analyzer.dataset_registry import DatasetRegistry, PlatformDataset
+from app_analyzer.delta import (
+    CHECKSUM_COLUMN, concat_catalogs, ends_with_newline, match_rows, read_appended_rows, row_checksums
+)
+from app_analyzer.export import counts_frame, export_frame
+from app_analyzer.game_keys import (
+    GameKeyIndex, canonical_from_normalized, first_occurrences, game_key, game_keys_from_canonical, key_value
+)
+from app_analyzer.genre_decoder import decode_genre_ids
+from app_analyzer.genre_index import GenreIndex
+from app_analyzer.metrics import metrics
+from app_analyzer.name_index import NameIndex, normalize_query
+from app_analyzer.query_cache import QueryCache
+from app_analyzer.ranked_search import RankedNameSearch
+from app_analyzer.rating_analytics import RatingAnalytics, numeric_ratings
+from app_analyzer.schema import coerce_ratings, read_csv_options
+from app_analyzer.streaming import StreamingCatalog
 
 class DataManager:
     """
     Gestiona la carga y búsqueda de datos desde los archivos CSV de videojuegos.
     """
-    def __init__(self):
-        self.df = pd.DataFrame()
-        self.base_path = "data_base_game"
+    # Se incrementa cuando cambian las columnas que se guardan en la caché.
+    CACHE_FORMAT = 5
+
+    PLATFORMS = ["PlayStation", "XBOX", "Nintendo", "PC"]
+
+    def __init__(self, memory_budget_mb=1024, base_path="data_base_game"):
+        self.base_path = base_path
         self.genre_map = {}
+        self.genre_map_key = ''
+        self.genre_index = None
+        self.cache = DataCache(os.path.join(self.base_path, ".cache"))
+        self.datasets = DatasetRegistry(memory_budget_mb)
+        self.query_cache = QueryCache()
+        # Plataformas de cada juego; sobrevive a que el registro descarte un catálogo.
+        self.game_index = GameKeyIndex(self.PLATFORMS)
+        # Los trabajos en segundo plano de la interfaz comparten este DataManager.
+        self._lock = threading.RLock()
         self.load_genres()
         print("DataManager listo. Mapeo de géneros cargado.")
 
@@ -24,6 +60,9 @@ class DataManager:
                 id_col = genres_df.columns[0]
                 name_col = genres_df.columns[1]
                 self.genre_map = pd.Series(genres_df[name_col].values, index=genres_df[id_col]).to_dict()
+                # La caché de cada plataforma depende también del mapeo de géneros.
+                self.genre_map_key = DataCache.file_hash(genres_csv_path)
+                self.genre_index = GenreIndex(self.genre_map)
             else:
                 print("ADVERTENCIA: 'genres.csv' no tiene las dos columnas esperadas.")
                 self.genre_map = {}
@@ -31,56 +70,631 @@ class DataManager:
             print("ADVERTENCIA: No se encontró 'genres.csv'. Se mostrarán los IDs.")
             self.genre_map = {}
 
-    def _map_genre_ids_to_names(self, genre_ids_str):
-        if not self.genre_map or pd.isna(genre_ids_str):
-            return "Sin género"
+    def _cache_key(self):
+        return f"{self.CACHE_FORMAT}:{self.genre_map_key}"
+
+    @staticmethod
+    def _report(progress, message):
+        print(message)
+        if progress is not None:
+            progress(message)
+
+    def load_new_data(self, platform, progress=None):
+        """
+        Carga el catálogo de 'platform' en el registro si aún no está en memoria.
+        Devuelve True si el catálogo queda disponible. 'progress' es un
+        callback opcional que recibe los mensajes de avance.
+        """
+        with self._lock:
+            if platform in self.datasets:
+                self.datasets.get(platform)
+                return True
+            return self._load(platform, progress)
+
+    def _load(self, platform, progress=None):
+        result = self._read_catalog(platform, progress)
+        if result is None:
+            return False
+        df, checksums, source = result
+        self._report(progress, f"Indexando nombres de {platform}...")
+        # La versión sale de la huella de los bytes leídos: si el CSV cambia
+        # durante la lectura, la siguiente carga tendrá otra versión.
+        self._register(platform, df, self._version(source), checksums, source)
+        return True
+
+    def dataset_version(self, platform):
+        """Versión de los datos de 'platform': mtime y tamaño del CSV más la clave de la caché."""
+        route_csv = self._route(platform)
         try:
-            genre_ids = ast.literal_eval(genre_ids_str)
-            genre_names = [self.genre_map.get(gid, "Desconocido") for gid in genre_ids]
-            return ', '.join(genre_names)
-        except (ValueError, SyntaxError):
-            return "Género inválido"
-
-    def load_new_data(self, platform):
-        route_csv = os.path.join(self.base_path, f"all_games_{platform}.csv")
+            stat = os.stat(route_csv)
+        except FileNotFoundError:
+            return None
+        return self._version({'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size})
+
+    def _version(self, source):
+        return f"{source['mtime_ns']}:{source['size']}:{self._cache_key()}"
+
+    def _route(self, platform):
+        return os.path.join(self.base_path, f"all_games_{platform}.csv")
+
+    def read_catalog(self, platform, progress=None):
+        """
+        Lee el catálogo de 'platform' (desde la caché o el CSV) sin
+        registrarlo en memoria. Devuelve None si el archivo no existe.
+        """
+        result = self._read_catalog(platform, progress)
+        return None if result is None else result[0]
+
+    def _read_catalog(self, platform, progress=None):
+        """
+        Como read_catalog, pero devuelve (catálogo, checksums de fila,
+        huella del CSV leído: {'mtime_ns', 'size', 'sha1'}).
+        """
+        route_csv = self._route(platform)
         try:
-            self.df = pd.read_csv(route_csv)
+            with metrics.measure('load_cache', platform=platform) as record:
+                cached_df = self.cache.load(route_csv, self._cache_key())
+                source = self.cache.fingerprint(route_csv) if cached_df is not None else None
+                record['rows'] = len(cached_df) if source is not None else 0
+            if source is not None:
+                self._report(progress, f"CSV de {platform} cargado desde la caché.")
+                checksums = cached_df.pop(CHECKSUM_COLUMN).to_numpy(dtype=np.uint64)
+                return cached_df, checksums, source
+
+            self._report(progress, f"Leyendo CSV de {platform}...")
+            with metrics.measure('read_csv', platform=platform) as record:
+                # Se parsean exactamente los bytes cuya huella se guarda.
+                data, source = DataCache.snapshot(route_csv)
+                df = coerce_ratings(pd.read_csv(io.BytesIO(data), **read_csv_options()))
+                del data
+                record['rows'] = len(df)
             print(f"CSV de {platform} cargado exitosamente.")
-            if self.genre_map and 'genres' in self.df.columns:
-                print("Traduciendo IDs de género a nombres...")
-                self.df['genres'] = self.df['genres'].apply(self._map_genre_ids_to_names)
+            with metrics.measure('row_checksums', rows=len(df), platform=platform):
+                checksums = row_checksums(df)
+            if self.genre_map and 'genres' in df.columns:
+                self._report(progress, "Traduciendo IDs de género a nombres...")
+                self.decode_genres(df)
                 print("Traducción completada.")
-            return True
+            self._store_cache(route_csv, df, checksums, source)
+            return df, checksums, source
         except FileNotFoundError:
             print(f"Error: No se encontró el archivo CSV en la ruta: {route_csv}")
-            self.df = pd.DataFrame()
-            return False
+            return None
+
+    def _store_cache(self, route_csv, df, checksums, source):
+        # Los checksums viajan en la caché como una columna más, pero no forman parte del catálogo.
+        df[CHECKSUM_COLUMN] = checksums
+        try:
+            self.cache.store(route_csv, df, source, self._cache_key())
+        finally:
+            del df[CHECKSUM_COLUMN]
 
-    def get_full_catalog(self):
-        return self.df
+    def decode_genres(self, df):
+        """
+        Traduce la columna 'genres' a nombres (categórica) y añade 'genre_mask',
+        la representación compacta de los IDs de género de cada juego.
+        """
+        if self.genre_map and 'genres' in df.columns:
+            with metrics.measure('decode_genres', rows=len(df)):
+                df['genres'], genre_ids = decode_genre_ids(df['genres'], self.genre_map)
+                df['genre_mask'] = self.genre_index.build_masks(genre_ids)
+        return df
 
-    def search_game_name(self, text_search):
+    def stream_catalog(self, platform, chunksize=100_000, sinks=(), progress=None):
+        """
+        Procesa el catálogo de 'platform' por bloques, con memoria acotada,
+        para archivos que no caben completos en memoria. Devuelve un
+        StreamingCatalog con los conteos por género, el histograma de
+        puntuaciones y el índice de nombres, o None si el archivo no existe.
+        """
+        route_csv = self._route(platform)
+        if not os.path.exists(route_csv):
+            print(f"Error: No se encontró el archivo CSV en la ruta: {route_csv}")
+            return None
+        catalog = StreamingCatalog(route_csv, self.decode_genres, self.genre_index, chunksize,
+                                   read_options=read_csv_options())
+        self._report(progress, f"Procesando {platform} por bloques de {chunksize} filas...")
+        return catalog.build(sinks, progress)
+
+    def _register(self, platform, df, version=None, checksums=None, source=None):
+        with metrics.measure('build_name_index', rows=len(df), platform=platform):
+            name_index = NameIndex(df['name']) if 'name' in df.columns else None
+        keys = None
+        if name_index is not None:
+            with metrics.measure('build_game_keys', rows=len(df), platform=platform):
+                keys = game_keys_from_canonical(canonical_from_normalized(name_index.names))
+                self.game_index.update(platform, keys)
+        self.datasets.put(platform, PlatformDataset(platform, df, name_index, version, keys, checksums, source))
+        # Los resultados guardados de otra versión de estos datos dejan de ser válidos.
+        self.query_cache.invalidate(platform, keep_version=version)
+
+    def reload(self, platform, progress=None):
+        """
+        Actualiza el catálogo de 'platform' con los cambios de su CSV,
+        procesando solo las filas nuevas o modificadas.
+
+        Si el archivo solo creció y su contenido anterior no cambió (mismo
+        SHA-1 de los bytes ya leídos), se leen solo los bytes añadidos. Si
+        no, se lee el CSV y se compara fila a fila por checksum; en ambos
+        casos solo se traducen los géneros de las filas nuevas, y el
+        DataFrame, las máscaras de géneros, el índice de nombres y las
+        claves de juego se parchean en lugar de reconstruirse. Las filas
+        conservadas mantienen su orden y las nuevas o modificadas pasan al
+        final.
+
+        Devuelve un diccionario con 'mode' ('full', 'unchanged', 'append',
+        'delta' o 'missing'), filas 'added', 'changed' y 'removed', y 'rows'
+        (total tras recargar).
+        """
+        with self._lock:
+            with metrics.measure('reload', platform=platform) as record:
+                report = self._reload(platform, progress)
+                record['rows'] = report['rows']
+                record['mode'] = report['mode']
+        self._report(progress, f"{platform} recargado: {report['added']} filas nuevas, "
+                               f"{report['changed']} modificadas y {report['removed']} eliminadas.")
+        return report
+
+    def _reload(self, platform, progress):
+        report = {'platform': platform, 'mode': 'unchanged', 'added': 0, 'changed': 0, 'removed': 0, 'rows': 0}
+        data = self.datasets.get(platform)
+        version = self.dataset_version(platform)
+        if version is None:
+            if data is not None:
+                report['removed'] = len(data.df)
+                self.datasets.remove(platform)
+                self.game_index.remove(platform)
+                self.query_cache.invalidate(platform)
+            report['mode'] = 'missing'
+            return report
+        if data is None or data.row_checksums is None or data.source is None or data.name_index is None:
+            # No hay una versión anterior que parchear: carga completa.
+            if data is not None:
+                self.datasets.remove(platform)
+            if self._load(platform, progress):
+                report['rows'] = report['added'] = len(self.datasets.get(platform).df)
+            report['mode'] = 'full'
+            return report
+        if version == data.version:
+            report['rows'] = len(data.df)
+            return report
+
+        # Una sola lectura del CSV: la comparación, las filas nuevas y la huella
+        # guardada se refieren a los mismos bytes.
+        content, source = DataCache.snapshot(self._route(platform))
+        version = self._version(source)
+        old_size = data.source['size']
+        if (len(content) >= old_size and ends_with_newline(content, old_size)
+                and hashlib.sha1(content[:old_size]).hexdigest() == data.source['sha1']):
+            self._report(progress, f"Leyendo las filas añadidas al CSV de {platform}...")
+            fresh_df = read_appended_rows(content, old_size, read_csv_options())
+            keep = np.ones(len(data.df), dtype=bool)
+            fresh_checksums = row_checksums(fresh_df)
+            report['mode'] = 'append'
+        else:
+            self._report(progress, f"Comparando el CSV de {platform} fila a fila...")
+            with metrics.measure('read_csv', platform=platform) as record:
+                full_df = coerce_ratings(pd.read_csv(io.BytesIO(content), **read_csv_options()))
+                record['rows'] = len(full_df)
+            checksums = row_checksums(full_df)
+            keep, fresh = match_rows(data.row_checksums, checksums)
+            fresh_df = full_df[fresh].reset_index(drop=True)
+            fresh_checksums = checksums[fresh]
+            report['mode'] = 'delta'
+
+        if keep.all() and len(fresh_df) == 0:
+            # Solo cambió el mtime (o nada relevante): basta con actualizar la versión.
+            data.version = version
+            data.source = source
+            self.query_cache.invalidate(platform, keep_version=version)
+            report['mode'] = 'unchanged'
+            report['rows'] = len(data.df)
+            return report
+        if len(fresh_df) and self.genre_map and 'genres' in fresh_df.columns:
+            self.decode_genres(fresh_df)
+        del content
+        report.update(self._patch(platform, data, keep, fresh_df, fresh_checksums, source, progress))
+        return report
+
+    def _patch(self, platform, data, keep, fresh_df, fresh_checksums, source, progress):
+        """Aplica el delta al catálogo registrado; devuelve los conteos del reporte."""
+        self._report(progress, f"Actualizando los índices de {platform}...")
+        kept_rows = int(keep.sum())
+        df = concat_catalogs(data.df[keep], fresh_df)
+        checksums = np.concatenate([data.row_checksums[keep], fresh_checksums])
+        with metrics.measure('patch_name_index', rows=len(fresh_df), platform=platform):
+            names = fresh_df['name'] if 'name' in fresh_df.columns else pd.Series([''] * len(fresh_df))
+            name_index = data.name_index.patch(keep, names)
+        new_keys = game_keys_from_canonical(canonical_from_normalized(name_index.names[kept_rows:]))
+        keys = np.concatenate([data.game_keys[keep], new_keys])
+        self.game_index.update(platform, keys)
+
+        # Una fila nueva cuyo juego coincide con una fila eliminada cuenta como modificada.
+        removed_keys = data.game_keys[~keep]
+        changed = min(int(np.isin(new_keys, removed_keys).sum()), len(removed_keys))
+
+        self._store_cache(self._route(platform), df, checksums, source)
+        version = self._version(source)
+        # Los índices perezosos (búsqueda aproximada, analítica) se reconstruyen al volver a usarse.
+        self.datasets.put(platform, PlatformDataset(platform, df, name_index, version, keys,
+                                                    checksums, source))
+        self.query_cache.invalidate(platform, keep_version=version)
+        return {'added': len(fresh_df) - changed, 'changed': changed,
+                'removed': len(removed_keys) - changed, 'rows': len(df)}
+
+    def _get_platform_data(self, platform):
+        with self._lock:
+            if not self.load_new_data(platform):
+                return None
+            return self.datasets.get(platform)
+
+    def get_dataset(self, platform):
+        """Devuelve el catálogo de 'platform', cargándolo si es necesario."""
+        data = self._get_platform_data(platform)
+        if data is None:
+            return pd.DataFrame()
+        return data.df
+
+    def get_full_catalog(self, platform):
+        return self.get_dataset(platform)
+
+    def search_positions(self, platform, text_search):
+        """
+        Posiciones de las filas cuyo nombre contiene 'text_search' de forma
+        literal, sin distinguir mayúsculas ni acentos.
+        """
+        data = self._get_platform_data(platform)
+        if data is None or data.name_index is None:
+            return np.empty(0, dtype=np.int64)
+        query = normalize_query(text_search)
+        if not query:
+            return data.name_index.search(query)
+        key = (platform, data.version, 'search', query)
+        with metrics.measure('search', platform=platform, query=text_search) as record:
+            found, positions = self.query_cache.get(key)
+            if not found:
+                positions = data.name_index.search(query)
+                self.query_cache.put(key, positions)
+            record['rows'] = len(positions)
+            record['cache'] = 'hit' if found else 'miss'
+        return positions
+
+    def search_game_name(self, platform, text_search):
         """
         Busca juegos por nombre. Si el texto está vacío, devuelve el catálogo completo.
         """
-        if self.df.empty:
+        data = self._get_platform_data(platform)
+        if data is None or data.df.empty:
             return pd.DataFrame()
         
         if not text_search:
-            return self.get_full_catalog()
+            return data.df
 
-        # Esta es la línea clave que filtra por nombre
-        if 'name' in self.df.columns:
-            result = self.df[self.df['name'].str.contains(text_search, case=False, na=False)]
-            return result
+        if data.name_index is not None:
+            return data.df.iloc[self.search_positions(platform, text_search)]
             
         return pd.DataFrame()
 
-    def count_games_by_genre(self, genres_to_count):
-        if self.df.empty or 'genres' not in self.df.columns:
+    def search_ranked_positions(self, platform, text_search, limit=50, progress=None):
+        """
+        Búsqueda aproximada: posiciones y puntuaciones de los 'limit' nombres
+        más parecidos a 'text_search', de mayor a menor relevancia. Tolera
+        erratas y reconoce iniciales ("ff7", "zelda botw").
+        """
+        empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64))
+        with self._lock:
+            data = self._get_platform_data(platform)
+            if data is None or data.name_index is None:
+                return empty
+            if data.ranked_search is None:
+                self._report(progress, f"Preparando la búsqueda aproximada de {platform}...")
+                with metrics.measure('build_ranked_index', rows=len(data.df), platform=platform):
+                    data.ranked_search = RankedNameSearch(data.name_index)
+                # Se vuelve a registrar para contabilizar la memoria del nuevo índice.
+                self.datasets.put(platform, data)
+        query = normalize_query(text_search)
+        if not query:
+            return empty
+        key = (platform, data.version, 'ranked', query, limit)
+        with metrics.measure('search_ranked', platform=platform, query=text_search) as record:
+            found, result = self.query_cache.get(key)
+            if not found:
+                result = data.ranked_search.search(query, limit)
+                self.query_cache.put(key, result)
+            record['rows'] = len(result[0])
+            record['cache'] = 'hit' if found else 'miss'
+        return result
+
+    def search_ranked(self, platform, text_search, limit=50):
+        """Como search_ranked_positions, pero devuelve las filas con una columna 'score'."""
+        positions, scores = self.search_ranked_positions(platform, text_search, limit)
+        df = self.get_dataset(platform)
+        if df.empty:
+            return pd.DataFrame()
+        result = df.iloc[positions].copy()
+        result['score'] = scores
+        return result
+
+    def count_games_by_genre(self, platform, genres_to_count):
+        data = self._get_platform_data(platform)
+        if data is None or data.df.empty or 'genre_mask' not in data.df.columns:
             return {}
-        genre_counts = {}
-        for genre in genres_to_count:
-            count = self.df['genres'].str.contains(genre, na=False).sum()
-            genre_counts[genre] = int(count)
-        return genre_counts
\ No newline at end of file
+        key = (platform, data.version, 'count', frozenset(genres_to_count))
+        with metrics.measure('count_genres', rows=len(data.df), platform=platform) as record:
+            found, counts = self.query_cache.get(key)
+            if not found:
+                counts = self.genre_index.count(data.df['genre_mask'].to_numpy(), genres_to_count)
+                self.query_cache.put(key, counts)
+            record['cache'] = 'hit' if found else 'miss'
+        return {genre: counts[genre] for genre in genres_to_count}
+
+    def filter_by_genres(self, platform, all_of=(), any_of=(), none_of=()):
+        """
+        Devuelve los juegos que tienen todos los géneros de 'all_of' (AND),
+        al menos uno de 'any_of' (OR) y ninguno de 'none_of' (NOT).
+        """
+        df = self.get_dataset(platform)
+        if df.empty or 'genre_mask' not in df.columns:
+            return pd.DataFrame()
+        with metrics.measure('filter_genres', platform=platform) as record:
+            selected = self.genre_index.query(df['genre_mask'].to_numpy(), all_of, any_of, none_of)
+            record['rows'] = int(selected.sum())
+        return df[selected]
+
+    def count_games_by_genre_query(self, platform, all_of=(), any_of=(), none_of=()):
+        """Cuenta los juegos que cumplen la misma consulta que filter_by_genres."""
+        data = self._get_platform_data(platform)
+        if data is None or data.df.empty or 'genre_mask' not in data.df.columns:
+            return 0
+        key = (platform, data.version, 'genre_query', frozenset(all_of), frozenset(any_of), frozenset(none_of))
+        found, count = self.query_cache.get(key)
+        if not found:
+            count = int(self.genre_index.query(data.df['genre_mask'].to_numpy(), all_of, any_of, none_of).sum())
+            self.query_cache.put(key, count)
+        return count
+
+    def query(self, platform, query, progress=None):
+        """
+        Ejecuta una CatalogQuery (texto, géneros y rango de puntuación) sobre
+        'platform' y devuelve un QueryResult con las posiciones de las filas
+        y las facetas por género y por puntuación.
+
+        Los predicados se evalúan del más selectivo al menos selectivo según
+        estimaciones que no recorren el catálogo, y cada uno usa su índice:
+        el de nombres, las puntuaciones ordenadas de RatingAnalytics
+        (búsqueda binaria) y las máscaras de géneros. El resultado queda en
+        la caché de consultas, así que repetir o deshacer un filtro no
+        vuelve a evaluarlo.
+        """
+        data = self._rating_analytics(platform, progress)
+        if data is None or data.name_index is None:
+            return QueryResult.empty()
+        key = (platform, data.version, 'query') + query.key()
+        with metrics.measure('query', platform=platform) as record:
+            found, result = self.query_cache.get(key)
+            if not found:
+                df = data.df
+                if 'genre_mask' in df.columns:
+                    masks = df['genre_mask'].to_numpy()
+                else:
+                    masks = np.zeros(len(df), dtype=np.uint64)
+                ratings = numeric_ratings(df)
+                plan = plan_query(query, data.rating_analytics, data.name_index, len(df))
+                positions = run_query(query, plan, masks, ratings, data.name_index, data.rating_analytics,
+                                      self.genre_index, lambda text: self.search_positions(platform, text))
+                genre_counts, rating_counts = facet_counts(positions, masks, ratings, self.genre_index, self.genre_map)
+                result = (positions, genre_counts, rating_counts, plan)
+                self.query_cache.put(key, result)
+            record['rows'] = len(result[0])
+            record['cache'] = 'hit' if found else 'miss'
+            record['plan'] = ' > '.join(result[3])
+        return QueryResult(*result)
+
+    def query_games(self, platform, query):
+        """Como query, pero devuelve directamente las filas del catálogo."""
+        result = self.query(platform, query)
+        df = self.get_dataset(platform)
+        if df.empty:
+            return pd.DataFrame()
+        return df.iloc[result.positions]
+
+    def unique_games(self, platform):
+        """Catálogo de 'platform' sin juegos repetidos (se queda la primera fila de cada clave)."""
+        data = self._get_platform_data(platform)
+        if data is None or data.game_keys is None:
+            return pd.DataFrame()
+        return data.df[first_occurrences(data.game_keys)]
+
+    def game_platforms(self, name=None, load=True, key=None):
+        """
+        Plataformas en las que está el juego 'name' o, si se indica 'key',
+        el juego con esa clave (el texto de format_key que guardan los
+        favoritos, o un entero). Con load=True se indexan antes las
+        plataformas que aún no se han cargado en esta sesión; si no, la
+        respuesta cubre solo las ya cargadas.
+        """
+        key = game_key(name) if key is None else key_value(key)
+        if load:
+            with self._lock:
+                for platform in self.PLATFORMS:
+                    if platform not in self.game_index.indexed:
+                        self.load_new_data(platform)
+        return self.game_index.platforms_for(key)
+
+    def find_game(self, platform, key):
+        """
+        Fila del juego con clave 'key' en 'platform' (la primera), o None.
+        'key' es el texto de format_key que guardan los favoritos, o un entero.
+        """
+        data = self._get_platform_data(platform)
+        if data is None or data.game_keys is None:
+            return None
+        positions = np.flatnonzero(data.game_keys == np.uint64(key_value(key)))
+        return data.df.iloc[positions[0]] if len(positions) else None
+
+    def game_catalog(self, platforms=None):
+        """
+        Catálogo combinado sin duplicados: una fila por juego distinto de
+        'platforms' (todas por defecto), con su clave ('game_key') y la
+        lista de plataformas donde aparece.
+        """
+        platforms = list(platforms or self.PLATFORMS)
+        frames, keys = [], []
+        for platform in platforms:
+            data = self._get_platform_data(platform)
+            if data is None or data.game_keys is None:
+                continue
+            first = first_occurrences(data.game_keys)
+            frames.append(data.df[first])
+            keys.append(data.game_keys[first])
+        if not frames:
+            return pd.DataFrame()
+        with metrics.measure('game_catalog', platforms=len(frames)) as record:
+            keys = np.concatenate(keys)
+            first = first_occurrences(keys)
+            catalog = pd.concat(frames, ignore_index=True)[first].reset_index(drop=True)
+            keys = keys[first]
+            masks = pd.Series(self.game_index.platform_masks(keys))
+            # Pocas combinaciones distintas: se traduce cada máscara una sola vez.
+            labels = {mask: ", ".join(self.game_index.platforms_of_mask(mask)) for mask in masks.unique()}
+            catalog.insert(0, 'game_key', keys)
+            catalog['platforms'] = masks.map(labels).to_numpy()
+            record['rows'] = len(catalog)
+        return catalog
+
+    def _rating_analytics(self, platform, progress=None):
+        """Catálogo de 'platform' con su RatingAnalytics, construida la primera vez."""
+        with self._lock:
+            data = self._get_platform_data(platform)
+            if data is None or data.df.empty:
+                return None
+            if data.rating_analytics is None:
+                self._report(progress, f"Preparando la analítica de puntuaciones de {platform}...")
+                with metrics.measure('build_rating_analytics', rows=len(data.df), platform=platform):
+                    data.rating_analytics = RatingAnalytics(data.df, self.genre_index, self.genre_map)
+                self.datasets.put(platform, data)
+            return data
+
+    def _rating_query(self, platform, kind, genres, compute, progress=None, extra=()):
+        data = self._rating_analytics(platform, progress)
+        if data is None:
+            return None
+        key = (platform, data.version, kind, None if genres is None else frozenset(genres)) + tuple(extra)
+        with metrics.measure(kind, platform=platform) as record:
+            found, result = self.query_cache.get(key)
+            if not found:
+                result = compute(data.rating_analytics)
+                self.query_cache.put(key, result)
+            record['rows'] = len(result)
+            record['cache'] = 'hit' if found else 'miss'
+        return result.copy()
+
+    def rating_summary(self, platform, genres=None, progress=None):
+        """
+        Estadísticas de puntuación de 'platform' por género: juegos, juegos
+        puntuados, media, mediana, desviación, extremos y percentiles. La
+        primera fila ("Todos") resume el catálogo completo; si 'genres' es
+        None se incluyen todos los géneros, y si está vacío solo esa fila.
+        """
+        result = self._rating_query(platform, 'rating_summary', genres,
+                                    lambda analytics: analytics.summary(genres), progress)
+        return pd.DataFrame() if result is None else result
+
+    def rating_histogram(self, platform, genres=None, progress=None):
+        """Juegos por intervalo de puntuación (filas) y género (columnas)."""
+        result = self._rating_query(platform, 'rating_histogram', genres,
+                                    lambda analytics: analytics.histogram(genres), progress)
+        return pd.DataFrame() if result is None else result
+
+    def top_rated(self, platform, genres=None, n=10, progress=None):
+        """Los 'n' juegos mejor puntuados de 'platform', en total y por género."""
+        result = self._rating_query(platform, 'top_rated', genres,
+                                    lambda analytics: analytics.top_rated(genres, n), progress, extra=(n,))
+        return pd.DataFrame() if result is None else result
+
+    def analyze_platforms(self, platforms=None, max_workers=None):
+        """
+        Estadísticas de géneros para varias plataformas a la vez.
+
+        Las plataformas que ya están en memoria se resumen aquí mismo; el
+        resto se carga y resume en paralelo en un pool de procesos. Devuelve
+        una tabla larga con una fila por género y plataforma: número de
+        juegos, proporción sobre la plataforma y estadísticas de puntuación.
+        El resultado se guarda en la caché de consultas con la versión de
+        cada plataforma, así que se recalcula en cuanto cambia alguna.
+        """
+        platforms = list(platforms or self.PLATFORMS)
+        with self._lock:
+            versions = tuple(self.datasets.get(platform).version if platform in self.datasets
+                             else self.dataset_version(platform) for platform in platforms)
+        key = (tuple(platforms), versions, 'analyze_platforms')
+        with metrics.measure('analyze_platforms', platforms=len(platforms)) as record:
+            found, stats = self.query_cache.get(key)
+            if not found:
+                stats = self._analyze_platforms(platforms, max_workers)
+                self.query_cache.put(key, stats)
+            record['rows'] = len(stats)
+            record['cache'] = 'hit' if found else 'miss'
+        return stats.copy()
+
+    def _analyze_platforms(self, platforms, max_workers):
+        results = {}
+        pending = []
+        with self._lock:
+            for platform in platforms:
+                data = self.datasets.get(platform)
+                if data is None:
+                    pending.append(platform)
+                else:
+                    results[platform] = genre_platform_stats(data.df, self.genre_index, self.genre_map, platform)
+
+        results.update(summarize_in_pool(self.base_path, pending, max_workers))
+        tables = [results[platform] for platform in platforms if results.get(platform) is not None]
+        if not tables:
+            return pd.DataFrame(columns=STAT_COLUMNS)
+        return pd.concat(tables, ignore_index=True)
+
+    def export_rows(self, platform, path, positions=None, file_format=None, progress=None):
+        """
+        Exporta a 'path' las filas 'positions' del catálogo de 'platform'
+        (todo el catálogo si es None) en CSV, JSON Lines o Parquet según la
+        extensión o 'file_format'. Se escribe por bloques directamente desde
+        el catálogo cargado, sin copiar el resultado. Devuelve las filas escritas.
+        """
+        data = self._get_platform_data(platform)
+        if data is None:
+            return 0
+        # Se guarda la referencia: una recarga crea un DataFrame nuevo y no altera este.
+        return export_frame(data.df, path, positions, file_format, progress=progress)
+
+    def export_search(self, platform, text_search, path, file_format=None, progress=None):
+        """Exporta el resultado de search_game_name (el catálogo completo si el texto está vacío)."""
+        positions = self.search_positions(platform, text_search) if text_search else None
+        return self.export_rows(platform, path, positions, file_format, progress)
+
+    def export_genre_counts(self, platform, genres_to_count, path, file_format=None, progress=None):
+        """Exporta el resultado de count_games_by_genre como tabla género / juegos."""
+        counts = self.count_games_by_genre(platform, genres_to_count)
+        return export_frame(counts_frame(counts), path, file_format=file_format, progress=progress)
+
+    def query_cache_stats(self):
+        """Estadísticas de la caché de consultas (aciertos, fallos, entradas, bytes)."""
+        return self.query_cache.stats()
+
+    def memory_report(self):
+        """
+        Memoria usada por cada plataforma cargada: bytes del DataFrame por
+        columna, de los índices y el total, en una tabla por plataforma.
+        """
+        rows = []
+        with self._lock:
+            for platform in self.datasets.platforms():
+                data = self.datasets.get(platform)
+                frame_bytes = data.df.memory_usage(deep=True, index=False)
+                total = data.memory_usage()
+                row = {'platform': platform, 'rows': len(data.df)}
+                row.update({f"{column}_bytes": int(size) for column, size in frame_bytes.items()})
+                row['index_bytes'] = total - int(frame_bytes.sum())
+                row['total_bytes'] = total
+                rows.append(row)
+        return pd.DataFrame(rows)
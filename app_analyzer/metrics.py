@@ -0,0 +1,155 @@
+# app_analyzer/metrics.py
+
+import contextlib
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+import pandas as pd
+
+try:
+    import psutil
+except ImportError:  # psutil es opcional: sin él no se mide la memoria del proceso.
+    psutil = None
+
+def _process_rss():
+    """Memoria residente del proceso en bytes, o None si no hay psutil."""
+    if psutil is None:
+        return None
+    return psutil.Process().memory_info().rss
+
+def _json_value(value):
+    # Escalares de numpy (filas, tiempos) a tipos nativos de JSON.
+    return value.item() if hasattr(value, 'item') else str(value)
+
+class Metrics:
+    """
+    Registro de tiempos de las operaciones costosas (carga, decodificación,
+    búsqueda, conteos, tabla, guardado).
+
+    Cada medición guarda la duración, el número de filas y la variación de
+    memoria del proceso. En modo de perfilado se añaden además el pico de
+    memoria de Python (tracemalloc) y las funciones más costosas (cProfile).
+    Es seguro usarlo desde los hilos de fondo; los oyentes reciben cada
+    registro en el hilo que lo generó.
+    """
+    MAX_RECORDS = 2000
+    PROFILE_LINES = 15
+
+    def __init__(self):
+        self._records = deque(maxlen=self.MAX_RECORDS)
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.profile_cpu = False
+        self.profile_memory = False
+
+    def set_profiling(self, cpu=False, memory=False):
+        """Activa o desactiva la captura con cProfile y/o tracemalloc."""
+        self.profile_cpu = cpu
+        self.profile_memory = memory
+        if not memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    @contextlib.contextmanager
+    def measure(self, operation, rows=None, **details):
+        """
+        Mide el bloque 'with'. Devuelve el registro para que el bloque pueda
+        completar 'rows' u otros detalles cuando los conozca:
+
+            with metrics.measure('search', platform=platform) as record:
+                positions = index.search(text)
+                record['rows'] = len(positions)
+        """
+        record = {'operation': operation, 'rows': rows, **details}
+        # Solo la medición más externa de cada hilo perfila: cProfile no admite anidarse.
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
+        profiler = cProfile.Profile() if self.profile_cpu and depth == 0 else None
+        trace_memory = self.profile_memory and depth == 0
+        if trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            traced_before = tracemalloc.get_traced_memory()[0]
+        rss_before = _process_rss()
+        record['started_at'] = time.time()
+        start = time.perf_counter()
+        if profiler is not None:
+            try:
+                profiler.enable()
+            except ValueError:
+                # Otro hilo ya está perfilando (Python 3.12+ solo admite un perfilador).
+                profiler = None
+        try:
+            yield record
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            record['seconds'] = time.perf_counter() - start
+            rss_after = _process_rss()
+            record['memory_delta_mb'] = (
+                (rss_after - rss_before) / 2**20 if rss_before is not None else None)
+            if trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                record['traced_delta_mb'] = (current - traced_before) / 2**20
+                record['traced_peak_mb'] = (peak - traced_before) / 2**20
+            if profiler is not None:
+                record['profile'] = self._profile_summary(profiler)
+            self._local.depth = depth
+            self._add(record)
+
+    def _profile_summary(self, profiler):
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats('cumulative').print_stats(self.PROFILE_LINES)
+        return output.getvalue()
+
+    def _add(self, record):
+        with self._lock:
+            self._records.append(record)
+        for callback in list(self._listeners):
+            callback(record)
+
+    def records(self):
+        with self._lock:
+            return list(self._records)
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+
+    def summary(self):
+        """Resumen por operación: llamadas, tiempo total/medio/máximo y filas."""
+        records = self.records()
+        if not records:
+            return pd.DataFrame(columns=['calls', 'total_s', 'mean_ms', 'max_ms', 'rows'])
+        df = pd.DataFrame(records)
+        df['rows'] = pd.to_numeric(df['rows'], errors='coerce')
+        summary = df.groupby('operation', sort=False).agg(
+            calls=('seconds', 'size'), total_s=('seconds', 'sum'),
+            mean_ms=('seconds', 'mean'), max_ms=('seconds', 'max'), rows=('rows', 'sum'),
+        )
+        summary[['mean_ms', 'max_ms']] *= 1000
+        return summary.sort_values('total_s', ascending=False)
+
+    def export_json(self, path):
+        """Guarda todos los registros y el resumen en un archivo JSON."""
+        summary = self.summary().reset_index().to_dict('records')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'records': self.records(), 'summary': summary}, f,
+                      ensure_ascii=False, indent=2, default=_json_value)
+
+# Registro compartido por DataManager, FavoritesManager y la interfaz.
+metrics = Metrics()
@@ -2,70 +2,214 @@
 
 import pandas as pd
 import os
+from app_analyzer.favorites_store import SQLiteFavoritesStore
+from app_analyzer.game_keys import format_key, game_key, game_keys
+from app_analyzer.metrics import metrics
 
 class FavoritesManager:
     """
     La función de esta clase es almacenar los juegos favoritos que añade el usuario.
+
+    Los favoritos se guardan en una base SQLite (favorites.db). Cada cambio
+    queda pendiente y se escribe como upsert/borrado de una fila; con
+    auto_flush=False los cambios se acumulan hasta llamar a flush(), lo que
+    permite a la interfaz agrupar varias ediciones en una sola escritura.
+
+    Cada favorito se identifica por su clave de juego (ver game_keys) en
+    hexadecimal y guarda la plataforma de la que se añadió; el género y la
+    puntuación no se copian, se consultan en el catálogo con esa clave
+    (DataManager.find_game). En memoria los favoritos son un diccionario
+    clave -> registro, así que buscar, editar o comprobar duplicados no
+    recorre la lista completa.
     """
 
-    def __init__(self, filepath='data_base_game/favorites.csv'):
+    COLUMNS = ['game_key', 'name', 'platform', 'personal_notes', 'personal_rating']
+
+    def __init__(self, filepath='data_base_game/favorites.db',
+                 legacy_csv_path='data_base_game/favorites.csv', auto_flush=True):
         self.filepath = filepath
-        self.columns = ['name', 'genres', 'rating', 'personal_notes', 'personal_rating']
-        self.favorites_df = pd.DataFrame(columns=self.columns)
+        self.legacy_csv_path = legacy_csv_path
+        self.auto_flush = auto_flush
+        self.columns = list(self.COLUMNS)
+        # clave -> registro (dict); conserva el orden de inserción.
+        self._records = {}
+        self._favorites_df = None
+        # clave -> registro (dict) a guardar, o None si hay que borrarlo.
+        self._pending = {}
+        # El CSV antiguo solo se importa cuando la base de datos se crea por primera vez.
+        self._import_legacy = not os.path.exists(self.filepath)
+        self.store = SQLiteFavoritesStore(self.filepath, self.columns, key_column='game_key',
+                                          migrate=self._keyed_records)
+        if self.store.migrated_rows is not None:
+            print(f"Se importaron {self.store.migrated_rows} favoritos desde la base de datos anterior.")
         self.load_favorites()
 
+    @staticmethod
+    def key_of(name):
+        """Clave (texto) con la que se guarda el juego 'name'."""
+        return format_key(game_key(name))
+
     def load_favorites(self):
-        """Carga los juegos favoritos desde el archivo CSV."""
-        if os.path.exists(self.filepath):
-            try:
-                self.favorites_df = pd.read_csv(self.filepath)
-                print("Juegos Favoritos cargados.")
-            except pd.errors.EmptyDataError:
-                print("Archivo de favoritos está vacío. Se continúa con una lista nueva.")
-                self.favorites_df = pd.DataFrame(columns=self.columns)
-        else:
-            print("No se encontró archivo de favoritos. Se creará uno nuevo.")
-            self.save_favorites()
-
-    # --- MÉTODO CORREGIDO ---
-    # El nombre ahora es plural para ser consistente.
+        """Carga los juegos favoritos desde la base de datos."""
+        if self._import_legacy and self.legacy_csv_path and os.path.exists(self.legacy_csv_path):
+            self._import_legacy_csv()
+            self._import_legacy = False
+        favorites_df = self._refresh_keys(self.clean(self.store.load_all()))
+        self._records = {record['game_key']: record for record in favorites_df.to_dict('records')}
+        self._favorites_df = None
+        print("Juegos Favoritos cargados.")
+
+    @staticmethod
+    def clean(favorites_df):
+        """Notas vacías en lugar de NaN y calificación entera (0 si falta)."""
+        favorites_df['personal_notes'] = favorites_df['personal_notes'].fillna('')
+        favorites_df['personal_rating'] = pd.to_numeric(
+            favorites_df['personal_rating'], errors='coerce').fillna(0).astype(int)
+        return favorites_df
+
+    def _refresh_keys(self, favorites_df):
+        """
+        Las claves se derivan del nombre: si la forma canónica cambió desde
+        que se guardaron, se reescriben (borrado de la clave antigua y
+        upsert de la nueva) en una sola transacción.
+        """
+        if favorites_df.empty:
+            return favorites_df
+        keys = pd.Series([format_key(key) for key in game_keys(favorites_df['name'])], index=favorites_df.index)
+        stale = favorites_df['game_key'] != keys
+        if not stale.any():
+            return favorites_df
+        old_keys = favorites_df.loc[stale, 'game_key'].tolist()
+        # Dos favoritos que ahora son el mismo juego se quedan en uno (el primero).
+        favorites_df = favorites_df.assign(game_key=keys).drop_duplicates('game_key')
+        upserts = favorites_df[favorites_df['game_key'].isin(set(keys[stale]))]
+        self.store.apply(upserts.to_dict('records'), old_keys)
+        print(f"Se actualizaron las claves de {int(stale.sum())} favoritos.")
+        return favorites_df
+
+    def _import_legacy_csv(self):
+        """Importa una sola vez el antiguo favorites.csv a la base de datos."""
+        try:
+            legacy_df = pd.read_csv(self.legacy_csv_path)
+        except pd.errors.EmptyDataError:
+            print("Archivo de favoritos está vacío. Se continúa con una lista nueva.")
+            return
+        self._import_records(legacy_df, f"'{self.legacy_csv_path}'")
+
+    def _keyed_records(self, legacy_df):
+        """Convierte favoritos guardados por nombre (CSV o esquema anterior) al esquema con claves."""
+        legacy_df = legacy_df.dropna(subset=['name']).copy()
+        legacy_df['game_key'] = [format_key(key) for key in game_keys(legacy_df['name'])]
+        return legacy_df.reindex(columns=self.columns).drop_duplicates('game_key')
+
+    def _import_records(self, legacy_df, source):
+        keyed_df = self._keyed_records(legacy_df)
+        self.store.apply(keyed_df.to_dict('records'), [])
+        print(f"Se importaron {len(keyed_df)} favoritos desde {source}.")
+
+    @property
+    def favorites_df(self):
+        """Vista en DataFrame de los favoritos; se reconstruye solo tras un cambio."""
+        if self._favorites_df is None:
+            self._favorites_df = pd.DataFrame(list(self._records.values()), columns=self.columns)
+        return self._favorites_df
+
     def save_favorites(self):
-        """Guarda la lista actual de favoritos en el archivo CSV."""
-        self.favorites_df.to_csv(self.filepath, index=False)
+        """Guarda los cambios pendientes (equivale a flush)."""
+        self.flush()
+
+    def flush(self):
+        """Escribe todos los cambios pendientes en una sola transacción."""
+        if not self._pending:
+            return
+        upserts = [record for record in self._pending.values() if record is not None]
+        deletes = [key for key, record in self._pending.items() if record is None]
+        with metrics.measure('save_favorites', rows=len(self._pending)):
+            self.store.apply(upserts, deletes)
+        self._pending.clear()
         print("Los juegos favoritos han sido guardados.")
 
+    def close(self):
+        self.flush()
+        self.store.close()
+
+    def _commit(self):
+        """Se llama una vez por operación (simple o masiva) que modificó favoritos."""
+        self._favorites_df = None
+        if self.auto_flush:
+            self.flush()
+
     def add_favorite(self, game_data):
-        if game_data['name'] in self.favorites_df['name'].values:
+        if self.add_favorites([game_data]) == 0:
             print(f"El juego '{game_data['name']}' ya está en favoritos.")
             return False
-        
-        game_data['personal_notes'] = ''
-        game_data['personal_rating'] = 0
-
-        new_favorite = pd.DataFrame([game_data])
-        self.favorites_df = pd.concat([self.favorites_df, new_favorite], ignore_index=True)
-        self.save_favorites() # La llamada ahora coincide
         return True
 
-    def remove_favorite(self, game_name):
-        self.favorites_df = self.favorites_df[self.favorites_df['name'] != game_name].reset_index(drop=True)
-        self.save_favorites() # La llamada ahora coincide
+    def add_favorites(self, games):
+        """
+        Agrega varios juegos de una vez ('name' y, opcionalmente, 'platform').
+        Devuelve cuántos eran nuevos.
+        """
+        games = list(games)
+        # Las claves se calculan todas juntas, no juego a juego.
+        keys = [format_key(key) for key in game_keys([game['name'] for game in games])] if games else []
+        added = 0
+        for game_data, key in zip(games, keys):
+            if key in self._records:
+                continue
+            record = {'game_key': key, 'name': game_data['name'], 'platform': game_data.get('platform'),
+                      'personal_notes': '', 'personal_rating': 0}
+            self._records[key] = record
+            self._pending[key] = record
+            added += 1
+        if added:
+            self._commit()
+        return added
+
+    def remove_favorite(self, key):
+        self.remove_favorites([key])
+
+    def remove_favorites(self, keys):
+        """Elimina varios juegos (por clave) de una vez. Devuelve cuántos existían."""
+        removed = 0
+        for key in keys:
+            if self._records.pop(key, None) is not None:
+                self._pending[key] = None
+                removed += 1
+        if removed:
+            self._commit()
+        return removed
 
     def get_all_favorites(self):
         return self.favorites_df
 
-    def get_favorite_details(self, game_name):
-        details = self.favorites_df[self.favorites_df['name'] == game_name]
-        if not details.empty:
-            return details.iloc[0]
+    def is_favorite(self, key):
+        return key in self._records
+
+    def get_favorite_details(self, key):
+        record = self._records.get(key)
+        if record is not None:
+            return pd.Series(record)
         return None
 
-    def update_favorite_details(self, game_name, notes, rating):
+    def update_favorite_details(self, key, notes, rating):
         """Actualiza las notas y la calificación de un juego favorito."""
-        idx = self.favorites_df.index[self.favorites_df['name'] == game_name].tolist()
-        if idx:
-            self.favorites_df.loc[idx[0], 'personal_notes'] = notes
-            self.favorites_df.loc[idx[0], 'personal_rating'] = rating
-            self.save_favorites() # La llamada ahora coincide
-            return True
-        return False
\ No newline at end of file
+        return self.update_favorites({key: (notes, rating)}) == 1
+
+    def update_favorites(self, updates):
+        """
+        Actualiza varios favoritos de una vez. 'updates' es un diccionario
+        clave -> (notas, calificación). Devuelve cuántos se actualizaron.
+        """
+        updated = 0
+        for key, (notes, rating) in updates.items():
+            record = self._records.get(key)
+            if record is None:
+                continue
+            record['personal_notes'] = notes
+            record['personal_rating'] = rating
+            self._pending[key] = record
+            updated += 1
+        if updated:
+            self._commit()
+        return updated
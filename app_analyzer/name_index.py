@@ -0,0 +1,197 @@
+# app_analyzer/name_index.py
+
+import numpy as np
+import pandas as pd
+
+SEPARATOR = 0x0A  # '\n' separa los nombres en el corpus y nunca forma parte de un trigrama.
+
+def normalize_names(names):
+    """
+    Normaliza una Series de nombres: sin ™/®/©, sin acentos, minúsculas y
+    espacios simples. Los símbolos de marca se quitan antes de NFKD, que
+    convertiría "™" en "TM".
+    """
+    return (
+        names.fillna('').astype(str)
+        .str.replace('[\u2122\u00ae\u00a9]', '', regex=True)
+        .str.normalize('NFKD')
+        .str.replace('[\u0300-\u036f]', '', regex=True)
+        .str.lower()
+        .str.replace(r'\s+', ' ', regex=True)
+        .str.strip()
+    )
+
+def normalize_query(text):
+    return normalize_names(pd.Series([text], dtype=object)).iloc[0]
+
+def _trigram_codes(data):
+    """Códigos enteros de todos los trigramas de bytes de 'data' (uint8)."""
+    data = data.astype(np.uint32)
+    return (data[:-2] << 16) | (data[1:-1] << 8) | data[2:]
+
+def _run_starts(values):
+    """Marca el primer elemento de cada tramo de valores iguales de un array ordenado."""
+    return np.concatenate(([True], values[1:] != values[:-1]))[:len(values)]
+
+class NameIndex:
+    """
+    Índice de trigramas para buscar juegos por nombre.
+
+    Los nombres normalizados se unen en un único corpus UTF-8 y, para cada
+    trigrama de bytes, se guarda la lista ordenada de filas que lo contienen.
+    Una búsqueda intersecta las listas de los trigramas de la consulta y
+    verifica los candidatos con una comparación literal (nunca regex), por
+    lo que su costo depende del número de coincidencias y no del tamaño del
+    catálogo. Si la consulta extiende la anterior, solo se revisan los
+    resultados previos.
+    """
+
+    def __init__(self, names):
+        normalized = normalize_names(pd.Series(names, dtype=object))
+        self.names = normalized.to_numpy(dtype=object)
+        self._names_bytes = int(normalized.memory_usage(deep=True))
+        # (consulta, resultado) de la última búsqueda, en una sola tupla para
+        # que se lea de forma consistente desde los hilos de la interfaz.
+        self._last = (None, None)
+        self._build()
+
+    def _build(self):
+        corpus = '\n'.join(self.names).encode('utf-8') + b'\n'
+        data = np.frombuffer(corpus, dtype=np.uint8)
+        row_of_byte = np.concatenate(([0], np.cumsum(data == SEPARATOR)[:-1])).astype(np.int32)
+
+        if len(data) < 3:
+            self.trigrams = np.empty(0, dtype=np.uint32)
+            self.offsets = np.zeros(1, dtype=np.int64)
+            self.postings = np.empty(0, dtype=np.int32)
+            return
+
+        codes = _trigram_codes(data)
+        rows = row_of_byte[:-2]
+        keep = (data[:-2] != SEPARATOR) & (data[1:-1] != SEPARATOR) & (data[2:] != SEPARATOR)
+        pairs = np.sort((codes[keep].astype(np.uint64) << 32) | rows[keep].astype(np.uint64))
+        pairs = pairs[_run_starts(pairs)]
+
+        pair_codes = (pairs >> 32).astype(np.uint32)
+        self.postings = (pairs & 0xFFFFFFFF).astype(np.int32)
+        starts = np.flatnonzero(_run_starts(pair_codes))
+        self.trigrams = pair_codes[starts]
+        self.offsets = np.append(starts, len(pair_codes)).astype(np.int64)
+
+    def patch(self, keep, new_names):
+        """
+        Índice nuevo con las filas de 'keep' (máscara booleana) renumeradas
+        en orden y 'new_names' añadidos al final. Solo se normalizan y
+        recorren los nombres nuevos: las listas de las filas conservadas se
+        renumeran y se copian a su nueva posición, sin volver a ordenarlas.
+        """
+        keep = np.asarray(keep, dtype=bool)
+        remap = np.cumsum(keep) - 1
+        remap[~keep] = -1
+        kept_rows = int(keep.sum())
+        # La renumeración conserva el orden dentro de cada lista.
+        rows = remap[self.postings]
+        valid = rows >= 0
+        kept_postings = rows[valid].astype(np.int32)
+        if len(self.trigrams):
+            old_counts = np.add.reduceat(valid.astype(np.int64), self.offsets[:-1])
+        else:
+            old_counts = np.empty(0, dtype=np.int64)
+        added = NameIndex(new_names)
+        new_counts = np.diff(added.offsets)
+
+        trigrams = np.union1d(self.trigrams, added.trigrams).astype(np.uint32)
+        old_slots = np.searchsorted(trigrams, self.trigrams)
+        new_slots = np.searchsorted(trigrams, added.trigrams)
+        counts_before = np.zeros(len(trigrams), dtype=np.int64)
+        counts_before[old_slots] = old_counts
+        counts = counts_before.copy()
+        counts[new_slots] += new_counts
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+
+        # Cada lista queda con las filas conservadas y, detrás, las nuevas (que son mayores).
+        postings = np.empty(offsets[-1], dtype=np.int32)
+        old_starts = np.concatenate(([0], np.cumsum(old_counts)[:-1])).astype(np.int64)
+        postings[np.repeat(offsets[old_slots] - old_starts, old_counts) + np.arange(len(kept_postings))] = kept_postings
+        postings[np.repeat(offsets[new_slots] + counts_before[new_slots] - added.offsets[:-1], new_counts)
+                 + np.arange(len(added.postings))] = added.postings + kept_rows
+
+        index = NameIndex.__new__(NameIndex)
+        index.names = np.concatenate([self.names[keep], added.names])
+        removed_bytes = int(pd.Series(self.names[~keep], dtype=object).memory_usage(deep=True, index=False))
+        index._names_bytes = self._names_bytes - removed_bytes + added._names_bytes
+        index._last = (None, None)
+        # Los trigramas que se quedaron sin filas desaparecen.
+        present = counts > 0
+        index.trigrams = trigrams[present]
+        index.offsets = np.concatenate(([0], np.cumsum(counts[present]))).astype(np.int64)
+        index.postings = postings
+        return index
+
+    @property
+    def nbytes(self):
+        return self._names_bytes + self.trigrams.nbytes + self.offsets.nbytes + self.postings.nbytes
+
+    def __len__(self):
+        return len(self.names)
+
+    def _posting(self, code):
+        position = np.searchsorted(self.trigrams, code)
+        if position == len(self.trigrams) or self.trigrams[position] != code:
+            return np.empty(0, dtype=np.int32)
+        return self.postings[self.offsets[position]:self.offsets[position + 1]]
+
+    def _candidates(self, query):
+        data = np.frombuffer(query.encode('utf-8'), dtype=np.uint8)
+        if len(data) < 3:
+            return None
+        lists = sorted((self._posting(code) for code in np.unique(_trigram_codes(data))), key=len)
+        candidates = lists[0]
+        for posting in lists[1:]:
+            if len(candidates) == 0:
+                break
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+        return candidates
+
+    def _verify(self, query, positions):
+        if positions is None:
+            names = pd.Series(self.names, dtype=object)
+            return np.flatnonzero(names.str.contains(query, regex=False).to_numpy(dtype=bool))
+        if len(positions) == 0:
+            return np.empty(0, dtype=np.int64)
+        names = pd.Series(self.names[positions], dtype=object)
+        return np.asarray(positions, dtype=np.int64)[names.str.contains(query, regex=False).to_numpy(dtype=bool)]
+
+    def estimate(self, query):
+        """
+        Cota superior, sin verificar candidatos, del número de filas que
+        contienen 'query' (ya normalizada): la lista de trigramas más corta.
+        """
+        data = np.frombuffer(query.encode('utf-8'), dtype=np.uint8)
+        if len(data) < 3:
+            return len(self.names)
+        return min(len(self._posting(code)) for code in np.unique(_trigram_codes(data)))
+
+    def contains(self, query, positions):
+        """Las filas de 'positions' cuyo nombre contiene 'query' (ya normalizada)."""
+        return self._verify(query, np.asarray(positions, dtype=np.int64))
+
+    def search(self, text):
+        """
+        Devuelve las posiciones (ordenadas) de las filas cuyo nombre contiene
+        'text' de forma literal, sin distinguir mayúsculas ni acentos.
+        """
+        query = normalize_query(text)
+        if not query:
+            return np.arange(len(self.names), dtype=np.int64)
+
+        last_query, last_result = self._last
+        if last_query and last_query in query:
+            # La nueva consulta extiende la anterior: basta con refinar su resultado.
+            candidates = last_result
+        else:
+            candidates = self._candidates(query)
+
+        result = self._verify(query, candidates)
+        self._last = (query, result)
+        return result
@@ -0,0 +1,98 @@
+# app_analyzer/query_cache.py
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+class QueryCache:
+    """
+    Caché LRU de resultados de consultas (búsquedas y conteos).
+
+    Las claves empiezan por (plataforma, versión del catálogo), así que un
+    resultado nunca se sirve para otros datos: al registrar una versión
+    nueva de una plataforma se descartan sus entradas anteriores. Se limita
+    tanto el número de entradas como los bytes de los arrays y tablas
+    (DataFrame o Series) guardados.
+    """
+
+    def __init__(self, max_entries=256, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _arrays(value):
+        if isinstance(value, np.ndarray):
+            return [value]
+        if isinstance(value, tuple):
+            return [item for item in value if isinstance(item, np.ndarray)]
+        return []
+
+    @staticmethod
+    def _frame_bytes(value):
+        if isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(deep=True).sum())
+        if isinstance(value, pd.Series):
+            return int(value.memory_usage(deep=True))
+        return 0
+
+    def _size(self, value):
+        items = value if isinstance(value, tuple) else (value,)
+        size = sum(array.nbytes for array in self._arrays(value))
+        size += sum(self._frame_bytes(item) for item in items)
+        return size or 64
+
+    def get(self, key):
+        """Devuelve (encontrado, valor) y actualiza las estadísticas."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        # Los arrays se comparten entre llamadas: se protegen contra escritura.
+        for array in self._arrays(value):
+            array.setflags(write=False)
+        size = self._size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._sizes[key] = size
+            while len(self._entries) > self.max_entries or sum(self._sizes.values()) > self.max_bytes:
+                old_key, _ = self._entries.popitem(last=False)
+                self._sizes.pop(old_key, None)
+
+    def invalidate(self, platform, keep_version=None):
+        """Descarta las entradas de 'platform' salvo las de 'keep_version'."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == platform and key[1] != keep_version]:
+                del self._entries[key]
+                self._sizes.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+
+    def stats(self):
+        """Aciertos, fallos, tasa de aciertos, entradas y bytes ocupados."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'entries': len(self._entries),
+                'bytes': sum(self._sizes.values()),
+            }
@@ -0,0 +1,160 @@
+# app_analyzer/ranked_search.py
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from app_analyzer.name_index import NameIndex, normalize_query, _trigram_codes
+
+ROMAN_NUMERALS = {
+    'ii': '2', 'iii': '3', 'iv': '4', 'v': '5', 'vi': '6', 'vii': '7', 'viii': '8',
+    'ix': '9', 'x': '10', 'xi': '11', 'xii': '12', 'xiii': '13', 'xiv': '14', 'xv': '15',
+}
+WORD_PATTERN = re.compile(r'[a-z0-9]+')
+
+def acronym(name):
+    """
+    Iniciales de un nombre normalizado; los números se conservan enteros y
+    los romanos se pasan a dígitos ("final fantasy vii" -> "ff7").
+    """
+    letters = []
+    for word in WORD_PATTERN.findall(name):
+        if word.isdigit():
+            letters.append(word)
+        elif word in ROMAN_NUMERALS:
+            letters.append(ROMAN_NUMERALS[word])
+        else:
+            letters.append(word[0])
+    return ''.join(letters)
+
+def edit_distance(a, b, limit):
+    """
+    Distancia de edición con transposiciones (OSA) entre 'a' y 'b'.
+    Devuelve limit + 1 en cuanto se sabe que la supera.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if previous2 is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+class RankedNameSearch:
+    """
+    Búsqueda aproximada y ordenada por relevancia sobre un NameIndex.
+
+    Los candidatos salen de las listas de trigramas ya construidas (los
+    nombres que comparten más trigramas con la consulta) y de un índice de
+    iniciales ("ff7", "botw"). La puntuación combina la similitud de
+    trigramas, coincidencias al inicio del nombre o de una palabra, las
+    iniciales y, para tolerar erratas, la distancia de edición entre las
+    palabras. Solo se puntúan en detalle unos pocos miles de candidatos,
+    así que el costo no crece con el tamaño del catálogo.
+    """
+    MAX_CANDIDATES = 5000
+    MAX_POSTINGS = 4_000_000
+    EDIT_CANDIDATES = 300
+
+    def __init__(self, name_index):
+        self.index = name_index
+        names = pd.Series(name_index.names, dtype=object)
+        self.lengths = names.str.len().to_numpy(dtype=np.int32)
+        # Las iniciales se calculan una vez por nombre distinto.
+        codes, uniques = pd.factorize(names)
+        self.acronyms = NameIndex(pd.Series(uniques).map(acronym).to_numpy(dtype=object)[codes])
+
+    @property
+    def nbytes(self):
+        return self.lengths.nbytes + self.acronyms.nbytes
+
+    def search(self, text, limit=50):
+        """Devuelve (posiciones, puntuaciones) de los 'limit' mejores resultados."""
+        query = normalize_query(text)
+        if not query:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        tokens = query.split(' ')
+
+        candidates, shared = self._trigram_candidates(query)
+        extra = [self.acronyms.search(token) for token in tokens if len(token) >= 2]
+        if len(query) < 3:
+            extra.append(self.index.search(query))
+        if extra:
+            extra = np.setdiff1d(np.concatenate(extra), candidates)[:self.MAX_CANDIDATES]
+            candidates = np.concatenate([candidates, extra])
+            shared = np.concatenate([shared, np.zeros(len(extra), dtype=np.int64)])
+        if len(candidates) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        scores = self._score(query, tokens, candidates, shared)
+        # Segunda pasada: distancia de edición solo para los mejores candidatos.
+        best = np.argsort(-scores, kind='stable')[:self.EDIT_CANDIDATES]
+        scores[best] += self._typo_bonus(tokens, candidates[best])
+
+        order = np.lexsort((self.lengths[candidates], -scores))[:limit]
+        return candidates[order].astype(np.int64), np.round(scores[order], 4)
+
+    def _trigram_candidates(self, query):
+        """Filas que comparten trigramas con la consulta y cuántos comparten."""
+        data = np.frombuffer(query.encode('utf-8'), dtype=np.uint8)
+        if len(data) < 3:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        lists = sorted((self.index._posting(code) for code in np.unique(_trigram_codes(data))), key=len)
+        # Los trigramas muy comunes ("the", "ing") se descartan si hay demasiadas filas.
+        total = 0
+        selected = []
+        for posting in lists:
+            if selected and total + len(posting) > self.MAX_POSTINGS:
+                break
+            selected.append(posting)
+            total += len(posting)
+        rows = np.sort(np.concatenate(selected))
+        if len(rows) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        starts = np.flatnonzero(np.concatenate(([True], rows[1:] != rows[:-1])))
+        candidates = rows[starts].astype(np.int64)
+        shared = np.diff(np.append(starts, len(rows)))
+        if len(candidates) > self.MAX_CANDIDATES:
+            keep = np.argsort(-shared, kind='stable')[:self.MAX_CANDIDATES]
+            candidates, shared = candidates[keep], shared[keep]
+        return candidates, shared
+
+    def _score(self, query, tokens, candidates, shared):
+        names = pd.Series(self.index.names[candidates], dtype=object)
+        acronyms = pd.Series(self.acronyms.names[candidates], dtype=object)
+        query_trigrams = max(len(query.encode('utf-8')) - 2, 1)
+        name_trigrams = np.maximum(self.lengths[candidates] - 2, 1)
+        # Similitud de Jaccard aproximada entre los trigramas de la consulta y del nombre.
+        scores = shared / (query_trigrams + name_trigrams - shared)
+        scores = scores + 1.0 * names.str.contains(query, regex=False).to_numpy(dtype=bool)
+        scores = scores + 0.5 * names.str.startswith(query).to_numpy(dtype=bool)
+        for token in tokens:
+            word_start = names.str.startswith(token) | names.str.contains(' ' + token, regex=False)
+            scores = scores + 0.3 * word_start.to_numpy(dtype=bool)
+            if len(token) >= 2:
+                scores = scores + 0.4 * acronyms.str.contains(token, regex=False).to_numpy(dtype=bool)
+        return scores.astype(np.float64)
+
+    def _typo_bonus(self, tokens, candidates):
+        """Premia las palabras de la consulta que aparecen con alguna errata."""
+        bonus = np.zeros(len(candidates), dtype=np.float64)
+        typo_tokens = [token for token in tokens if len(token) >= 4]
+        if not typo_tokens:
+            return bonus
+        for i, position in enumerate(candidates):
+            words = self.index.names[position].split(' ')
+            for token in typo_tokens:
+                limit = 1 if len(token) <= 5 else 2
+                distance = min(edit_distance(token, word, limit) for word in words)
+                if 0 < distance <= limit:
+                    bonus[i] += 0.3 * (1 - distance / (limit + 1))
+        return bonus
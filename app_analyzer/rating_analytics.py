@@ -0,0 +1,154 @@
+# app_analyzer/rating_analytics.py
+
+import numpy as np
+import pandas as pd
+
+from app_analyzer.streaming import RATING_BINS
+
+RATING_BIN_LABELS = [f"{low}-{high}" for low, high in zip(RATING_BINS[:-1], RATING_BINS[1:])]
+PERCENTILES = [0.1, 0.25, 0.5, 0.75, 0.9]
+# Nombre de la fila/columna que resume el catálogo completo.
+ALL_GENRES = "Todos"
+ALL_GENRES_ID = -1
+
+SUMMARY_COLUMNS = ['genre', 'games', 'rated_games', 'rating_mean', 'rating_median', 'rating_std',
+                   'rating_min', 'rating_max'] + [f"p{int(q * 100)}" for q in PERCENTILES]
+
+def numeric_ratings(df):
+    """Puntuaciones como float64 (NaN si faltan), sin copiar si ya son numéricas."""
+    if 'rating' not in df.columns:
+        return np.full(len(df), np.nan)
+    ratings = df['rating']
+    if not pd.api.types.is_float_dtype(ratings):
+        ratings = pd.to_numeric(ratings, errors='coerce')
+    return ratings.to_numpy(dtype=np.float64, na_value=np.nan)
+
+class RatingAnalytics:
+    """
+    Analítica de puntuaciones de un catálogo: resumen estadístico,
+    histograma y mejores juegos por género.
+
+    Al construirse, las puntuaciones se convierten a números una sola vez y
+    se genera la forma larga (juego, género) a partir de las máscaras de
+    géneros, más un grupo ALL_GENRES con el catálogo completo. Todo queda
+    agrupado por género y con la puntuación descendente (sin puntuación al final),
+    así que cada consulta solo recorre los tramos de los géneros pedidos:
+    el top-N es el principio del tramo y los percentiles salen de datos ya
+    ordenados.
+    """
+
+    def __init__(self, df, genre_index, genre_map):
+        ratings = numeric_ratings(df)
+        # Un solo orden global por puntuación descendente (NaN al final); al
+        # filtrar cada género sobre ese orden, sus filas ya salen ordenadas.
+        order = np.argsort(-ratings, kind='stable')
+        groups = [ALL_GENRES_ID]
+        positions = [order]
+        genre_ids = [np.full(len(df), ALL_GENRES_ID, dtype=np.int16)]
+        if genre_index is not None and 'genre_mask' in df.columns:
+            masks = df['genre_mask'].to_numpy()[order]
+            for gid, bit in genre_index.bits.items():
+                rows = order[np.flatnonzero(masks & bit)]
+                groups.append(gid)
+                positions.append(rows)
+                genre_ids.append(np.full(len(rows), gid, dtype=np.int16))
+        self.positions = np.concatenate(positions).astype(np.int32)
+        self.genre_ids = np.concatenate(genre_ids)
+        self.ratings = ratings[self.positions]
+        self.names = df['name'].to_numpy(dtype=object) if 'name' in df.columns else np.full(len(df), None)
+
+        self.genre_names = {ALL_GENRES_ID: ALL_GENRES, **genre_map}
+        self.name_to_id = {name: gid for gid, name in self.genre_names.items()}
+        # Tramo [inicio, fin) de cada género en los arrays anteriores.
+        sizes = [len(rows) for rows in positions]
+        ends = np.cumsum(sizes)
+        self._spans = {int(gid): (int(end - size), int(end)) for gid, size, end in zip(groups, sizes, ends)}
+        # Puntuaciones del catálogo completo negadas (ascendentes) para buscar rangos por bisección.
+        _, _, rated = self._slice(ALL_GENRES_ID)
+        self._ascending_keys = -self.ratings[:rated]
+
+    @property
+    def nbytes(self):
+        return (self.positions.nbytes + self.genre_ids.nbytes + self.ratings.nbytes
+                + self._ascending_keys.nbytes)
+
+    def genre_size(self, name):
+        """Número de juegos del género 'name' (0 si no existe)."""
+        start, end = self._spans.get(self.name_to_id.get(name), (0, 0))
+        return end - start
+
+    def rating_span(self, min_rating=None, max_rating=None):
+        """
+        Tramo [inicio, fin) del catálogo completo con puntuación entre
+        'min_rating' y 'max_rating' (incluidos), por búsqueda binaria.
+        Las posiciones de esas filas son positions[inicio:fin].
+        """
+        keys = self._ascending_keys
+        start = 0 if max_rating is None else int(np.searchsorted(keys, -max_rating, side='left'))
+        end = len(keys) if min_rating is None else int(np.searchsorted(keys, -min_rating, side='right'))
+        return start, max(start, end)
+
+    def _genre_ids(self, genres):
+        """IDs a resumir: ALL_GENRES más los géneros pedidos (o todos si es None)."""
+        if genres is None:
+            return [gid for gid in self._spans if gid in self.genre_names]
+        return [ALL_GENRES_ID] + [self.name_to_id[name] for name in genres if name in self.name_to_id]
+
+    def _slice(self, gid):
+        """(inicio, fin, juegos puntuados) del tramo del género 'gid'."""
+        start, end = self._spans.get(gid, (0, 0))
+        values = self.ratings[start:end]
+        rated = int(np.count_nonzero(~np.isnan(values)))
+        return start, end, rated
+
+    def summary(self, genres=None):
+        """
+        Por género (y ALL_GENRES): juegos, juegos puntuados, media, mediana,
+        desviación, mínimo, máximo y percentiles.
+        """
+        rows = []
+        for gid in self._genre_ids(genres):
+            start, end, rated = self._slice(gid)
+            # Orden ascendente para los percentiles.
+            values = self.ratings[start:start + rated][::-1]
+            row = {'genre': self.genre_names[gid], 'games': end - start, 'rated_games': rated}
+            if rated:
+                row.update(
+                    rating_mean=values.mean(), rating_median=np.median(values),
+                    rating_std=values.std(ddof=1) if rated > 1 else np.nan,
+                    rating_min=values[0], rating_max=values[-1],
+                )
+                row.update({f"p{int(q * 100)}": value
+                            for q, value in zip(PERCENTILES, np.quantile(values, PERCENTILES))})
+            rows.append(row)
+        return pd.DataFrame(rows).reindex(columns=SUMMARY_COLUMNS)
+
+    def histogram(self, genres=None):
+        """
+        Juegos por intervalo de puntuación (filas 0-10 ... 90-100) y por
+        género (columnas, ALL_GENRES incluido). Los juegos sin puntuación no cuentan.
+        """
+        columns = {}
+        for gid in self._genre_ids(genres):
+            start, _, rated = self._slice(gid)
+            bins = np.digitize(self.ratings[start:start + rated], RATING_BINS[1:-1])
+            columns[self.genre_names[gid]] = np.bincount(bins, minlength=len(RATING_BIN_LABELS))
+        return pd.DataFrame(columns, index=RATING_BIN_LABELS)
+
+    def top_rated(self, genres=None, n=10):
+        """Los 'n' juegos mejor puntuados de cada género (y de ALL_GENRES)."""
+        parts = []
+        for gid in self._genre_ids(genres):
+            start, _, rated = self._slice(gid)
+            count = min(n, rated)
+            positions = self.positions[start:start + count].astype(np.int64)
+            parts.append(pd.DataFrame({
+                'genre': self.genre_names[gid],
+                'rank': np.arange(1, count + 1),
+                'name': self.names[positions],
+                'rating': self.ratings[start:start + count],
+                'position': positions,
+            }))
+        if not parts:
+            return pd.DataFrame(columns=['genre', 'rank', 'name', 'rating', 'position'])
+        return pd.concat(parts, ignore_index=True)
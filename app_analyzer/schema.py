@@ -0,0 +1,45 @@
+# app_analyzer/schema.py
+
+import pandas as pd
+
+# Esquema declarado de los archivos all_games_<plataforma>.csv.
+# La aplicación solo usa estas columnas; el resto no se carga.
+CATALOG_COLUMNS = ['name', 'genres', 'rating']
+
+# 'genres' se lee como texto y luego se traduce a una columna categórica.
+# 'rating' también se lee como texto y se convierte después con coerce_ratings,
+# para que un valor no numérico ("N/A", "tbd"...) no impida cargar el catálogo.
+CATALOG_DTYPES = {
+    'name': str,
+    'genres': str,
+    'rating': str,
+}
+
+# Texto usado en los CSV para los juegos sin puntuación.
+MISSING_RATING = "Missing"
+
+def read_csv_options(**extra):
+    """
+    Argumentos de pd.read_csv para el esquema del catálogo. 'usecols' es
+    una función para tolerar archivos a los que les falte alguna columna.
+    """
+    options = {
+        'usecols': lambda column: column in CATALOG_COLUMNS,
+        'dtype': CATALOG_DTYPES,
+        'na_values': {'rating': [MISSING_RATING]},
+    }
+    options.update(extra)
+    return options
+
+def coerce_ratings(df):
+    """
+    Convierte 'rating' (leída como texto) a float64. Lo que no sea un
+    número queda como NaN, igual que MISSING_RATING.
+    """
+    if 'rating' in df.columns:
+        try:
+            # Caso habitual (solo números y MISSING_RATING): conversión directa, más rápida.
+            df['rating'] = df['rating'].astype('float64')
+        except (TypeError, ValueError):
+            df['rating'] = pd.to_numeric(df['rating'], errors='coerce').astype('float64')
+    return df
@@ -0,0 +1,158 @@
+# app_analyzer/streaming.py
+
+import numpy as np
+import pandas as pd
+
+from app_analyzer.name_index import NameIndex
+from app_analyzer.schema import coerce_ratings
+
+# Límites de los intervalos del histograma de puntuaciones (0-100 de 10 en 10).
+RATING_BINS = np.arange(0, 101, 10)
+
+class ArrowFileSink:
+    """
+    Escribe los bloques de un catálogo en un archivo Feather (Arrow IPC) o
+    Parquet a medida que llegan, sin juntar todo el catálogo en memoria.
+    Requiere pyarrow. El esquema se fija con el primer bloque; las columnas
+    categóricas se escriben como texto porque sus categorías cambian de un
+    bloque a otro.
+    """
+
+    def __init__(self, path, file_format='feather'):
+        if file_format not in ('feather', 'parquet'):
+            raise ValueError(f"Formato no soportado: {file_format}")
+        self.path = path
+        self.file_format = file_format
+        self.schema = None
+        self._writer = None
+
+    def write(self, chunk):
+        import pyarrow as pa
+        categorical = chunk.select_dtypes('category').columns
+        if len(categorical):
+            chunk = chunk.astype({column: str for column in categorical})
+        table = pa.Table.from_pandas(chunk, schema=self.schema, preserve_index=False)
+        if self._writer is None:
+            self.schema = table.schema
+            if self.file_format == 'parquet':
+                import pyarrow.parquet as pq
+                self._writer = pq.ParquetWriter(self.path, self.schema)
+            else:
+                self._writer = pa.ipc.new_file(self.path, self.schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+class StreamingCatalog:
+    """
+    Lectura por bloques de un all_games_<plataforma>.csv que no cabe en memoria.
+
+    Una pasada sobre el archivo decodifica los géneros de cada bloque y
+    mantiene solo los agregados que necesita la aplicación: conteo por
+    género, histograma de puntuaciones, la máscara de géneros de cada fila
+    (8 bytes por juego) y un índice de nombres por bloque. Los bloques
+    pueden además enviarse a sinks (por ejemplo ArrowFileSink) para
+    generar los formatos en disco en la misma pasada.
+    """
+
+    def __init__(self, csv_path, decode=None, genre_index=None, chunksize=100_000, read_options=None):
+        self.csv_path = csv_path
+        self.decode = decode
+        self.genre_index = genre_index
+        self.chunksize = chunksize
+        # Con tipos explícitos (ver schema.read_csv_options) todos los bloques tienen el mismo esquema.
+        self.read_options = read_options or {}
+        self.rows = 0
+        self.missing_ratings = 0
+        self.rating_histogram = np.zeros(len(RATING_BINS) - 1, dtype=np.int64)
+        self.genre_masks = np.empty(0, dtype=np.uint64)
+        self.genre_counts = {}
+        self.name_indexes = []
+
+    def chunks(self):
+        """Genera los bloques del CSV ya decodificados."""
+        reader = pd.read_csv(self.csv_path, chunksize=self.chunksize, **self.read_options)
+        for chunk in reader:
+            chunk = coerce_ratings(chunk)
+            if self.decode is not None:
+                chunk = self.decode(chunk)
+            yield chunk.reset_index(drop=True)
+
+    def build(self, sinks=(), progress=None):
+        """Recorre el archivo una vez y calcula todos los agregados."""
+        self.rows = 0
+        self.missing_ratings = 0
+        self.rating_histogram[:] = 0
+        masks = []
+        self.genre_counts = {}
+        self.name_indexes = []
+        for chunk in self.chunks():
+            if 'rating' in chunk.columns:
+                ratings = pd.to_numeric(chunk['rating'], errors='coerce')
+                self.missing_ratings += int(ratings.isna().sum())
+                self.rating_histogram += np.histogram(ratings.dropna(), bins=RATING_BINS)[0]
+            if 'genre_mask' in chunk.columns:
+                chunk_masks = chunk['genre_mask'].to_numpy(dtype=np.uint64)
+                masks.append(chunk_masks)
+                for gid, count in self.genre_index.count_all(chunk_masks).items():
+                    self.genre_counts[gid] = self.genre_counts.get(gid, 0) + count
+            if 'name' in chunk.columns:
+                self.name_indexes.append((self.rows, NameIndex(chunk['name'])))
+            for sink in sinks:
+                sink.write(chunk)
+            self.rows += len(chunk)
+            if progress is not None:
+                progress(f"Procesadas {self.rows} filas de {self.csv_path}...")
+        for sink in sinks:
+            sink.close()
+        self.genre_masks = np.concatenate(masks) if masks else np.empty(0, dtype=np.uint64)
+        return self
+
+    def memory_usage(self):
+        """Memoria en bytes de los agregados (no incluye el catálogo, que queda en disco)."""
+        return (self.genre_masks.nbytes + self.rating_histogram.nbytes
+                + sum(index.nbytes for _, index in self.name_indexes))
+
+    def count_games_by_genre(self, genres_to_count):
+        if self.genre_index is None or not self.genre_counts:
+            return {}
+        name_to_id = self.genre_index.name_to_id
+        return {name: self.genre_counts.get(name_to_id.get(name), 0) for name in genres_to_count}
+
+    def genre_positions(self, all_of=(), any_of=(), none_of=()):
+        """Posiciones de las filas que cumplen una consulta AND/OR/NOT de géneros."""
+        if self.genre_index is None:
+            return np.empty(0, dtype=np.int64)
+        return np.flatnonzero(self.genre_index.query(self.genre_masks, all_of, any_of, none_of))
+
+    def search_positions(self, text_search):
+        """Posiciones (globales) de las filas cuyo nombre contiene 'text_search'."""
+        found = [offset + index.search(text_search) for offset, index in self.name_indexes]
+        return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+    def rating_distribution(self):
+        """Histograma de puntuaciones como Series indexada por intervalo."""
+        labels = [f"{low}-{high}" for low, high in zip(RATING_BINS[:-1], RATING_BINS[1:])]
+        return pd.Series(self.rating_histogram, index=labels, name='games')
+
+    def fetch_rows(self, positions):
+        """Lee del disco solo las filas indicadas, recorriendo el archivo por bloques."""
+        positions = np.sort(np.asarray(positions, dtype=np.int64))
+        if len(positions) == 0:
+            return pd.DataFrame()
+        parts = []
+        offset = 0
+        for chunk in self.chunks():
+            end = offset + len(chunk)
+            selected = positions[(positions >= offset) & (positions < end)] - offset
+            if len(selected):
+                parts.append(chunk.iloc[selected])
+            offset = end
+            if offset > positions[-1]:
+                break
+        if not parts:
+            return pd.DataFrame()
+        return pd.concat(parts, ignore_index=True)
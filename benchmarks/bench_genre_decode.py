@@ -0,0 +1,79 @@
+# benchmarks/bench_genre_decode.py
+#
+# Compara la decodificación vectorizada de géneros con la versión anterior,
+# que aplicaba ast.literal_eval fila por fila.
+#
+# Uso (desde la raíz del proyecto):
+#   python -m benchmarks.bench_genre_decode --rows 200000
+
+import argparse
+import ast
+import os
+import random
+import time
+
+import pandas as pd
+
+from app_analyzer.genre_decoder import decode_genre_ids
+
+def legacy_map_genre_ids_to_names(genre_ids_str, genre_map):
+    """Implementación original de DataManager._map_genre_ids_to_names."""
+    if not genre_map or pd.isna(genre_ids_str):
+        return "Sin género"
+    try:
+        genre_ids = ast.literal_eval(genre_ids_str)
+        genre_names = [genre_map.get(gid, "Desconocido") for gid in genre_ids]
+        return ', '.join(genre_names)
+    except (ValueError, SyntaxError):
+        return "Género inválido"
+
+def load_genre_map(base_path="data_base_game"):
+    genres_df = pd.read_csv(os.path.join(base_path, "genres.csv"))
+    return pd.Series(genres_df.iloc[:, 1].values, index=genres_df.iloc[:, 0]).to_dict()
+
+def make_genre_column(rows, genre_ids, seed=0):
+    """Columna sintética con el mismo formato que 'genres' en all_games_*.csv."""
+    rng = random.Random(seed)
+    values = []
+    for _ in range(rows):
+        roll = rng.random()
+        if roll < 0.05:
+            values.append(None)
+        elif roll < 0.08:
+            values.append("[]")
+        else:
+            values.append(str(rng.sample(genre_ids, rng.randint(1, 4))))
+    return pd.Series(values, name='genres')
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de decodificación de géneros.")
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    genre_map = load_genre_map()
+    genres = make_genre_column(args.rows, list(genre_map.keys()))
+
+    legacy_time, legacy_names = best_of(
+        lambda: genres.apply(legacy_map_genre_ids_to_names, genre_map=genre_map), args.repeat)
+    vector_time, (names, _) = best_of(
+        lambda: decode_genre_ids(genres, genre_map), args.repeat)
+
+    if not legacy_names.astype(object).equals(names.astype(object)):
+        raise SystemExit("ERROR: los resultados de ambas implementaciones no coinciden.")
+
+    print(f"Filas: {args.rows}")
+    print(f"apply + ast.literal_eval: {legacy_time:.3f} s")
+    print(f"decode_genre_ids:         {vector_time:.3f} s")
+    print(f"Aceleración:              {legacy_time / vector_time:.1f}x")
+
+if __name__ == "__main__":
+    main()
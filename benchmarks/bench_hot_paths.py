@@ -0,0 +1,200 @@
+# benchmarks/bench_hot_paths.py
+#
+# Mide tiempo y pico de memoria de los caminos críticos de DataManager,
+# FavoritesManager y la tabla del Catálogo sobre un catálogo generado con
+# benchmarks.generate_catalog. Guarda los resultados en JSON y, si se
+# indica una referencia, marca las regresiones.
+#
+# Uso (desde la raíz del proyecto):
+#   python -m benchmarks.generate_catalog --rows 1M --platforms PC
+#   python -m benchmarks.bench_hot_paths --data-dir benchmarks/data/1M --output antes.json
+#   python -m benchmarks.bench_hot_paths --data-dir benchmarks/data/1M --baseline antes.json
+#
+# El pico de memoria se mide con tracemalloc: incluye lo que reservan
+# Python, numpy y pandas, pero no los buffers internos de pyarrow.
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform as platform_info
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from app_analyzer.catalog_query import CatalogQuery
+from app_analyzer.data_cache import DataCache
+from app_analyzer.game_keys import format_key, game_keys
+from app_analyzer.info_data import DataManager
+from app_analyzer.my_favorite_game import FavoritesManager
+from app_analyzer.name_index import NameIndex
+from app_analyzer.schema import coerce_ratings, read_csv_options
+
+SEARCH_QUERIES = {'search_common': "dragon", 'search_rare': "cafe reloaded 11", 'search_short': "z"}
+COUNT_GENRES = ["Strategy", "Sport", "Arcade"]
+COMBINED_QUERY = CatalogQuery("dragon", any_of=COUNT_GENRES[:2], min_rating=80)
+
+def quiet(func):
+    """Ejecuta 'func' sin los mensajes de progreso de los gestores."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func()
+
+def measure(func, repeat):
+    """Devuelve (mejor tiempo en s, pico de memoria en MB) de 'func'."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        quiet(func)
+        timings.append(time.perf_counter() - start)
+    # Ejecución aparte para la memoria: tracemalloc ralentiza la medición de tiempo.
+    tracemalloc.start()
+    try:
+        quiet(func)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(timings), peak / 2**20
+
+def search_uncached(manager, platform, query):
+    # Se vacía la caché de consultas y se olvida la última búsqueda para medir la búsqueda completa.
+    manager.query_cache.clear()
+    manager.datasets.get(platform).name_index._last = (None, None)
+    return manager.search_game_name(platform, query)
+
+def count_uncached(manager, platform, genres):
+    manager.query_cache.clear()
+    return manager.count_games_by_genre(platform, genres)
+
+def build_cases(manager, platform, work_dir):
+    """Lista de (nombre, función) a medir; cada función es independiente."""
+    route_csv = os.path.join(manager.base_path, f"all_games_{platform}.csv")
+    raw = coerce_ratings(pd.read_csv(route_csv, **read_csv_options()))
+    quiet(lambda: manager.load_new_data(platform))
+    df = manager.get_full_catalog(platform)
+    cold_cache_dir = os.path.join(work_dir, "cold_cache")
+    cold_manager = quiet(lambda: DataManager(base_path=manager.base_path))
+    cold_manager.cache = DataCache(cold_cache_dir)
+
+    def read_cold():
+        # Caché vacía en cada ejecución: lectura del CSV, decodificación y escritura de la caché.
+        shutil.rmtree(cold_cache_dir, ignore_errors=True)
+        cold_manager.read_catalog(platform)
+
+    cases = [
+        ('load_csv_cold', read_cold),
+        ('load_cached', lambda: manager.read_catalog(platform)),
+        ('decode_genres', lambda: manager.decode_genres(raw.copy())),
+        ('build_name_index', lambda: NameIndex(df['name'])),
+    ]
+    for name, query in SEARCH_QUERIES.items():
+        cases.append((name, lambda query=query: search_uncached(manager, platform, query)))
+    # Los casos *_cached miden el acierto en la caché de consultas: la primera
+    # repetición la llena y se guarda el mejor tiempo (hace falta --repeat 2 o más).
+    cases.append(('search_common_cached',
+                  lambda: manager.search_game_name(platform, SEARCH_QUERIES['search_common'])))
+    cases += [
+        ('count_games_by_genre', lambda: count_uncached(manager, platform, COUNT_GENRES)),
+        ('count_genres_cached', lambda: manager.count_games_by_genre(platform, COUNT_GENRES)),
+        ('filter_by_genres', lambda: manager.filter_by_genres(platform, all_of=COUNT_GENRES[:1],
+                                                              none_of=COUNT_GENRES[1:])),
+    ]
+
+    def query_uncached():
+        # Sin caché de consultas: se evalúan los predicados y las facetas cada vez.
+        manager.query_cache.clear()
+        manager.datasets.get(platform).name_index._last = (None, None)
+        manager.query(platform, COMBINED_QUERY)
+    quiet(lambda: manager.query(platform, COMBINED_QUERY))
+    cases.append(('query_combined', query_uncached))
+
+    try:
+        from gui.catalog_model import CatalogTableModel
+    except ImportError:
+        print("PyQt6 no está instalado: se omite populate_table.")
+    else:
+        def populate_table():
+            model = CatalogTableModel()
+            model.set_data(df)
+            model.sort(2)
+        cases.append(('populate_table', populate_table))
+
+    favorites = df[['name']].head(1000).assign(platform=platform).to_dict('records')
+    updated_keys = [format_key(key) for key in game_keys([game['name'] for game in favorites[:100]])]
+
+    def favorites_bulk():
+        path = os.path.join(work_dir, f"favorites_{time.perf_counter_ns()}.db")
+        manager = FavoritesManager(filepath=path, legacy_csv_path=None, auto_flush=False)
+        manager.add_favorites(favorites)
+        manager.update_favorites({key: ("nota", 5) for key in updated_keys})
+        manager.flush()
+        manager.close()
+    cases.append(('favorites_bulk_1000', favorites_bulk))
+    return cases
+
+def compare(results, baseline, threshold):
+    """Nombres de los casos cuyo tiempo supera la referencia por más de 'threshold'."""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference and result['seconds'] > reference['seconds'] * threshold:
+            regressions.append(name)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de los caminos críticos.")
+    parser.add_argument('--data-dir', default=os.path.join("benchmarks", "data", "100k"))
+    parser.add_argument('--platform', default="PC")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--only', nargs='+', help="Medir solo estos casos.")
+    parser.add_argument('--output', help="Archivo JSON donde guardar los resultados.")
+    parser.add_argument('--baseline', help="JSON de una ejecución anterior para comparar.")
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help="Factor de tiempo a partir del cual se marca una regresión.")
+    args = parser.parse_args()
+
+    manager = quiet(lambda: DataManager(base_path=args.data_dir))
+    work_dir = tempfile.mkdtemp(prefix="bench_hot_paths_")
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+
+    results = {}
+    try:
+        cases = build_cases(manager, args.platform, work_dir)
+        rows = len(manager.get_full_catalog(args.platform))
+        print(f"{rows} filas de {args.platform} ({args.data_dir})")
+        print(f"{'caso':<22} {'tiempo':>10} {'pico mem':>10} {'referencia':>11}")
+        for name, func in cases:
+            if args.only and name not in args.only:
+                continue
+            seconds, peak_mb = measure(func, args.repeat)
+            results[name] = {'seconds': seconds, 'peak_mb': peak_mb}
+            reference = baseline.get(name)
+            ratio = f"{seconds / reference['seconds']:.2f}x" if reference else ""
+            print(f"{name:<22} {seconds * 1000:8.1f} ms {peak_mb:7.1f} MB {ratio:>11}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.output:
+        report = {
+            'rows': rows,
+            'platform': args.platform,
+            'python': platform_info.python_version(),
+            'pandas': pd.__version__,
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Resultados guardados en {args.output}")
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        raise SystemExit(f"Regresiones (> {args.threshold:.2f}x): {', '.join(regressions)}")
+
+if __name__ == "__main__":
+    main()
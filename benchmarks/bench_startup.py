@@ -0,0 +1,116 @@
+# benchmarks/bench_startup.py
+#
+# Informe de tiempos de arranque, para detectar regresiones:
+#   1. Tiempo de import de los módulos de entrada (python -X importtime),
+#      con los módulos más lentos y un aviso si se importa matplotlib.
+#   2. Tiempo hasta que GameExplorer es visible y hasta el primer catálogo
+#      (Qt en modo offscreen, sin abrir ventanas reales).
+#
+# Uso (desde la raíz del proyecto):
+#   python -m benchmarks.bench_startup --top 15
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ENTRY_MODULES = ['gui.gui_start', 'gui.gui_game_explorer', 'app_analyzer.info_data', 'app_analyzer.cli']
+HEAVY_MODULES = ['matplotlib', 'matplotlib.pyplot']
+
+def import_times(module):
+    """
+    Importa 'module' en un intérprete nuevo con -X importtime.
+    Devuelve una lista de (módulo, microsegundos acumulados).
+    """
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, cwd=os.getcwd(),
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        rows.append((name.strip(), int(cumulative)))
+    return rows
+
+def report_imports(top):
+    print("== Tiempo de import ==")
+    for module in ENTRY_MODULES:
+        try:
+            rows = import_times(module)
+        except RuntimeError as e:
+            print(f"{module:<28} no se pudo importar: {e}")
+            continue
+        total = dict(rows).get(module, 0)
+        loaded = {name for name, _ in rows}
+        heavy = [name for name in HEAVY_MODULES if name in loaded]
+        warning = f"  (¡importa {', '.join(heavy)}!)" if heavy else ""
+        print(f"{module:<28} {total / 1000:8.1f} ms{warning}")
+        top_level = {}
+        for name, cumulative in rows:
+            root = name.split('.')[0]
+            if root != module.split('.')[0]:
+                top_level[root] = max(top_level.get(root, 0), cumulative)
+        for name, cumulative in sorted(top_level.items(), key=lambda item: -item[1])[:top]:
+            print(f"    {name:<24} {cumulative / 1000:8.1f} ms")
+
+def report_window(timeout):
+    """Mide el arranque de GameExplorer con Qt en modo offscreen."""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    started = time.perf_counter()
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtWidgets import QApplication
+    from app_analyzer.info_data import DataManager
+    from app_analyzer.my_favorite_game import FavoritesManager
+    from gui.gui_game_explorer import GameExplorer
+    imported = time.perf_counter()
+
+    # Los favoritos van a una base de datos temporal, no a la del proyecto.
+    work_dir = tempfile.mkdtemp(prefix="bench_startup_")
+    favorites = FavoritesManager(filepath=os.path.join(work_dir, "favorites.db"),
+                                 legacy_csv_path=None, auto_flush=False)
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = GameExplorer(DataManager(), favorites_manager=favorites)
+    window.show()
+    app.processEvents()
+    shown = time.perf_counter()
+
+    deadline = shown + timeout
+    while window.catalog_model.rowCount() == 0 and time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    loaded = time.perf_counter()
+
+    print("== Arranque de GameExplorer ==")
+    print(f"imports                      {(imported - started) * 1000:8.1f} ms")
+    print(f"ventana visible              {(shown - started) * 1000:8.1f} ms")
+    if window.catalog_model.rowCount():
+        print(f"primer catálogo              {(loaded - started) * 1000:8.1f} ms ({window.catalog_model.rowCount()} filas)")
+    else:
+        print(f"primer catálogo              sin datos tras {timeout:.0f} s")
+    print(f"matplotlib importado         {'sí' if 'matplotlib' in sys.modules else 'no'}")
+
+    window.close()
+    QTimer.singleShot(0, app.quit)
+    app.exec()
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Informe de tiempos de arranque.")
+    parser.add_argument('--top', type=int, default=10, help="Módulos más lentos a mostrar por entrada.")
+    parser.add_argument('--timeout', type=float, default=60.0, help="Segundos máximos de espera por el catálogo.")
+    parser.add_argument('--skip-window', action='store_true', help="Solo medir los imports.")
+    args = parser.parse_args()
+
+    report_imports(args.top)
+    if not args.skip_window:
+        report_window(args.timeout)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# benchmarks/generate_catalog.py
+#
+# Genera catálogos sintéticos all_games_<plataforma>.csv con el mismo
+# formato que los reales (id, name, genres, rating, platforms), usando los
+# IDs de genres.csv. Sirve para medir el rendimiento sin los datos reales.
+#
+# Uso (desde la raíz del proyecto):
+#   python -m benchmarks.generate_catalog --rows 100k --output-dir benchmarks/data/100k
+#   python -m benchmarks.generate_catalog --rows 10M --platforms PC
+
+import argparse
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+
+PLATFORMS = ["PlayStation", "XBOX", "Nintendo", "PC"]
+CHUNK_ROWS = 500_000
+
+# Palabras para componer nombres con aspecto real (incluye acentos para
+# ejercitar la normalización de la búsqueda).
+PREFIXES = [
+    "Super", "Legend of", "Final", "Dark", "Street", "Mega", "Tiny", "Grand", "Shadow", "Crystal",
+    "Pokémon", "Señor", "Little", "Iron", "Neon", "Ancient", "Galactic", "Royal", "Wild", "Mystic",
+]
+NOUNS = [
+    "Zelda", "Mario", "Quest", "Racer", "Fantasy", "Warriors", "Kingdom", "Souls", "Odyssey", "Arena",
+    "Dungeon", "Café", "Empire", "Legends", "Tactics", "Hunter", "Island", "Knights", "Galaxy", "Chronicles",
+    "Raiders", "Drift", "Heroes", "Frontier", "Manor", "Rhythm", "Puzzle", "Strike", "Dragon", "Academy",
+]
+SUFFIXES = [
+    "", "", "", "Deluxe", "Remastered", "HD", "Origins", "Reloaded", "Returns", "Online",
+    "Edition", "Saga", "Tournament", "Unleashed", "Collection", "Turbo",
+]
+
+def parse_rows(text):
+    """Acepta números como 100000, 100k, 1M o 10M."""
+    text = str(text).strip().lower().replace('_', '')
+    multiplier = 1
+    if text.endswith('k'):
+        multiplier, text = 1_000, text[:-1]
+    elif text.endswith('m'):
+        multiplier, text = 1_000_000, text[:-1]
+    return int(float(text) * multiplier)
+
+def load_genre_ids(genres_csv):
+    genres_df = pd.read_csv(genres_csv)
+    return genres_df.iloc[:, 0].astype('int64').to_numpy()
+
+def _pick(rng, words, size):
+    return pd.Series(np.asarray(words, dtype=object)[rng.integers(0, len(words), size)])
+
+def make_chunk(rng, start, rows, genre_ids, missing_rate):
+    """Un bloque de 'rows' juegos con IDs consecutivos a partir de 'start'."""
+    # Nombres: prefijo + sustantivo + sufijo opcional + número de secuela.
+    names = _pick(rng, PREFIXES, rows) + " " + _pick(rng, NOUNS, rows)
+    suffixes = _pick(rng, SUFFIXES, rows)
+    names = names.where(suffixes == "", names + " " + suffixes)
+    sequels = pd.Series(rng.integers(2, 12, rows)).astype(str)
+    names = names.where(rng.random(rows) > 0.3, names + " " + sequels)
+
+    # Géneros: de 0 a 4 IDs distintos por juego y algunos vacíos.
+    per_game = min(4, len(genre_ids))
+    order = np.argsort(rng.random((rows, len(genre_ids)), dtype=np.float32), axis=1)[:, :per_game]
+    chosen = pd.DataFrame(genre_ids[order]).astype(str)
+    counts = rng.choice(np.arange(per_game + 1), size=rows, p=_genre_count_weights(per_game))
+    genres = "[" + chosen[0]
+    for column in range(1, per_game):
+        genres = genres.where(counts <= column, genres + ", " + chosen[column])
+    genres = genres.where(counts > 0, "[") + "]"
+    genres = genres.where(rng.random(rows) > 0.02, None)
+
+    ratings = np.clip(rng.normal(68, 14, rows), 1, 100).round(2)
+    rating = pd.Series(ratings).map('{:.2f}'.format)
+    rating = rating.where(rng.random(rows) > missing_rate, "Missing")
+
+    return pd.DataFrame({
+        'id': np.arange(start, start + rows),
+        'name': names,
+        'genres': genres,
+        'rating': rating,
+        'platforms': "[1]",
+    })
+
+def _genre_count_weights(per_game):
+    weights = np.array([0.05, 0.35, 0.3, 0.2, 0.1][:per_game + 1])
+    return weights / weights.sum()
+
+def generate(output_dir, rows, genres_csv, platforms=PLATFORMS, seed=0, missing_rate=0.3):
+    """Escribe un all_games_<plataforma>.csv de 'rows' filas por plataforma."""
+    os.makedirs(output_dir, exist_ok=True)
+    if os.path.abspath(os.path.dirname(genres_csv)) != os.path.abspath(output_dir):
+        shutil.copy(genres_csv, os.path.join(output_dir, "genres.csv"))
+    genre_ids = load_genre_ids(genres_csv)
+    paths = []
+    for offset, platform in enumerate(platforms):
+        rng = np.random.default_rng(seed + offset)
+        path = os.path.join(output_dir, f"all_games_{platform}.csv")
+        start_time = time.perf_counter()
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            for start in range(0, rows, CHUNK_ROWS):
+                chunk = make_chunk(rng, start, min(CHUNK_ROWS, rows - start), genre_ids, missing_rate)
+                chunk.to_csv(f, index=False, header=start == 0)
+        print(f"{path}: {rows} filas en {time.perf_counter() - start_time:.1f} s")
+        paths.append(path)
+    return paths
+
+def main():
+    parser = argparse.ArgumentParser(description="Generador de catálogos sintéticos.")
+    parser.add_argument('--rows', default='100k', help="Filas por plataforma: 10k, 100k, 1M, 10M...")
+    parser.add_argument('--output-dir', help="Por defecto, benchmarks/data/<rows>.")
+    parser.add_argument('--genres', default=os.path.join("data_base_game", "genres.csv"))
+    parser.add_argument('--platforms', nargs='+', default=PLATFORMS)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--missing-rate', type=float, default=0.3, help="Proporción de puntuaciones 'Missing'.")
+    args = parser.parse_args()
+
+    rows = parse_rows(args.rows)
+    output_dir = args.output_dir or os.path.join("benchmarks", "data", args.rows)
+    generate(output_dir, rows, args.genres, args.platforms, args.seed, args.missing_rate)
+
+if __name__ == "__main__":
+    main()
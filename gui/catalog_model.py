@@ -0,0 +1,111 @@
+# gui/catalog_model.py
+
+import numpy as np
+import pandas as pd
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from app_analyzer.schema import MISSING_RATING
+
+class CatalogTableModel(QAbstractTableModel):
+    """
+    Modelo de tabla respaldado por un DataFrame para la pestaña Catálogo.
+
+    La vista solo pide los datos de las filas visibles, así que no se crea
+    ningún objeto Qt por celda. Las filas mostradas son un array de
+    posiciones sobre el DataFrame: buscar o cambiar de plataforma solo
+    reemplaza ese array, y ordenar lo reordena con pandas.
+    """
+    COLUMNS = [('name', "Nombre"), ('genres', "Género"), ('rating', "Puntuación")]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._df = pd.DataFrame()
+        self._columns = {}
+        self._positions = np.empty(0, dtype=np.int64)
+        # Posiciones en el orden recibido (por ejemplo, por relevancia), sin ordenar.
+        self._base_positions = self._positions
+        self._sort_column = None
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    def set_data(self, df, positions=None):
+        """Muestra las filas 'positions' de 'df' (todas si es None)."""
+        self.beginResetModel()
+        if df is None:
+            df = pd.DataFrame()
+        if df is not self._df:
+            self._df = df
+            self._columns = {
+                name: df[name].to_numpy(dtype=object) for name, _ in self.COLUMNS if name in df.columns
+            }
+        if positions is None:
+            positions = np.arange(len(df), dtype=np.int64)
+        self._positions = np.asarray(positions, dtype=np.int64)
+        self._base_positions = self._positions
+        if self._sort_column is not None:
+            self._positions = self._sorted_positions(self._sort_column, self._sort_order)
+        self.endResetModel()
+
+    def clear(self):
+        self.set_data(pd.DataFrame())
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._positions)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        column = self._columns.get(self.COLUMNS[index.column()][0])
+        if column is None:
+            return None
+        value = column[self._positions[index.row()]]
+        if pd.isna(value):
+            return MISSING_RATING if self.COLUMNS[index.column()][0] == 'rating' else None
+        return str(value)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section][1]
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        if column < 0:
+            # Sin columna de orden: se vuelve al orden en que llegaron las filas.
+            self._sort_column = None
+            self._positions = self._base_positions
+        else:
+            self._sort_column = column
+            self._sort_order = order
+            self._positions = self._sorted_positions(column, order)
+        self.layoutChanged.emit()
+
+    def _sorted_positions(self, column, order):
+        name = self.COLUMNS[column][0]
+        if name not in self._columns or len(self._positions) == 0:
+            return self._positions
+        values = pd.Series(self._columns[name][self._positions], index=self._positions)
+        if name == 'rating':
+            values = pd.to_numeric(values, errors='coerce')
+        else:
+            values = values.astype(str).str.lower()
+        ascending = order == Qt.SortOrder.AscendingOrder
+        return values.sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+
+    def row_data(self, row):
+        """Datos de la fila visible 'row' como diccionario, o None si no existe."""
+        if row < 0 or row >= len(self._positions):
+            return None
+        position = self._positions[row]
+        return {name: self._columns[name][position] for name in self._columns}
+
+    def shown_rows(self):
+        """(DataFrame, posiciones) de las filas visibles, en el orden en que se muestran."""
+        return self._df, self._positions
@@ -0,0 +1,106 @@
+# gui/chart_panel.py
+
+import numpy as np
+import pandas as pd
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+
+class ComparisonChart(QWidget):
+    """
+    Gráfico de barras embebido en la pestaña Análisis.
+
+    La figura se crea una sola vez (matplotlib se importa al dibujar el
+    primer gráfico) y sus barras se reutilizan: si cambian los datos pero
+    no la forma (géneros × series), solo se actualizan alturas, etiquetas
+    y título.
+    """
+    COLORS = ['#f06292', '#ba68c8', '#64b5f6', '#81c784']
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.figure = None
+        self.canvas = None
+        self.ax = None
+        self._containers = []
+        self._shape = None
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+    @property
+    def has_chart(self):
+        return self._shape is not None
+
+    def _ensure_canvas(self):
+        if self.canvas is not None:
+            return
+        # Figure en lugar de pyplot: no abre ventanas ni queda registrada globalmente.
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+        self.figure = Figure(figsize=(8, 4), tight_layout=True)
+        self.canvas = FigureCanvasQTAgg(self.figure)
+        self.canvas.setMinimumHeight(280)
+        self.ax = self.figure.add_subplot()
+        self.layout().addWidget(self.canvas)
+
+    @staticmethod
+    def _as_frame(data, platform):
+        """Diccionario {género: conteo} o matriz género × plataforma -> DataFrame."""
+        if isinstance(data, pd.DataFrame):
+            return data
+        return pd.DataFrame({platform: pd.Series(data, dtype='int64')})
+
+    def plot(self, data, platform, title=None):
+        """Dibuja o actualiza el gráfico con los conteos de 'platform'."""
+        self._ensure_canvas()
+        frame = self._as_frame(data, platform)
+        shape = (len(frame.index), len(frame.columns))
+        if shape != self._shape:
+            self._build(frame)
+            self._shape = shape
+        else:
+            for container, column in zip(self._containers, frame.columns):
+                container.set_label(str(column))
+                for rect, height in zip(container.patches, frame[column].to_numpy()):
+                    rect.set_height(height)
+            if len(frame.columns) > 1:
+                self.ax.legend()
+        positions = np.arange(len(frame.index))
+        self.ax.set_xticks(positions, [str(genre) for genre in frame.index], rotation=45, ha='right')
+        top = frame.to_numpy().max() if frame.size else 0
+        self.ax.set_ylim(0, top * 1.1 if top else 1)
+        self.ax.set_title(title or f'Comparativa de Géneros en {platform}')
+        self.canvas.draw_idle()
+
+    def _build(self, frame):
+        """Crea las barras desde cero (solo cuando cambia la forma de los datos)."""
+        self.ax.clear()
+        series = len(frame.columns)
+        width = 0.8 / max(series, 1)
+        positions = np.arange(len(frame.index))
+        self._containers = []
+        for i, column in enumerate(frame.columns):
+            offset = (i - (series - 1) / 2) * width
+            container = self.ax.bar(positions + offset, frame[column].to_numpy(), width,
+                                    label=str(column), color=self.COLORS[i % len(self.COLORS)])
+            self._containers.append(container)
+        if series > 1:
+            self.ax.legend()
+        self.ax.set_ylabel('Cantidad de Juegos')
+
+    def export(self, path):
+        """
+        Guarda el gráfico actual en PNG o SVG (según la extensión). Para
+        comparativas con muchos géneros se ensancha la figura al exportar.
+        """
+        if not self.has_chart:
+            return False
+        original_size = self.figure.get_size_inches()
+        categories = self._shape[0] * max(self._shape[1], 1)
+        width = max(original_size[0], 0.35 * categories + 2)
+        try:
+            self.figure.set_size_inches(width, max(original_size[1], 5))
+            self.figure.savefig(path, dpi=150, bbox_inches='tight')
+        finally:
+            self.figure.set_size_inches(*original_size)
+            self.canvas.draw_idle()
+        return True
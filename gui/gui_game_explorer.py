@@ -1,33 +1,70 @@
 # gui/gui_game_explorer.py
 
 import sys
+import time
 import pandas as pd
-import matplotlib.pyplot as plt
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
-    QLabel, QLineEdit, QPushButton, QTableWidget, QComboBox,
+    QLabel, QLineEdit, QPushButton, QTableView, QComboBox,
     QTabWidget, QListWidget, QTextEdit, QSlider, QHBoxLayout,
-    QTableWidgetItem, QStatusBar, QListWidgetItem
+    QStatusBar, QListWidgetItem, QFileDialog, QCheckBox, QSpinBox
 )
 from PyQt6.QtGui import QIcon, QColor
 # Se añade QTimer para la búsqueda optimizada
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from app_analyzer.my_favorite_game import FavoritesManager
+from gui.catalog_model import CatalogTableModel
+from gui.chart_panel import ComparisonChart
+from gui.metrics_panel import MetricsPanel
+from gui.workers import JobRunner
+from app_analyzer.catalog_query import CatalogQuery
+from app_analyzer.cross_platform import to_matrix
+from app_analyzer.export import EXPORT_FORMATS, counts_frame, export_frame
+from app_analyzer.metrics import metrics
+from app_analyzer.rating_analytics import ALL_GENRES
+
+ALL_PLATFORMS = "Todas las plataformas"
+# Resultados que muestra la búsqueda aproximada.
+RANKED_LIMIT = 200
+# Filtros del diálogo de exportación -> formato.
+EXPORT_FILTERS = {
+    "CSV (*.csv)": 'csv',
+    "JSON Lines (*.jsonl)": 'jsonl',
+    "Parquet (*.parquet)": 'parquet',
+}
 
 class GameExplorer(QMainWindow):
-    def __init__(self, data_manager):
+    # Las mediciones llegan desde cualquier hilo; la señal las pasa al hilo de la interfaz.
+    metric_recorded = pyqtSignal(object)
+
+    def __init__(self, data_manager, favorites_manager=None):
         super().__init__()
         self.data_manager = data_manager
-        self.favorites_manager = FavoritesManager()
+        # Tiempos de arranque: ventana visible y primer catálogo mostrado.
+        self._created_at = time.perf_counter()
+        self._first_show_reported = False
+        self._first_data_reported = False
+        # Los cambios en favoritos se agrupan y se guardan tras una pausa (ver favorites_timer).
+        self.favorites_manager = favorites_manager or FavoritesManager(auto_flush=False)
 
         self.analysis_data = None
         self.analysis_platform = None
+        self.analysis_title = None
+        # Tabla del último análisis (conteos o puntuaciones), lista para exportar.
+        self.analysis_table = None
+
+        # Las cargas, búsquedas y análisis corren en segundo plano.
+        self.jobs = JobRunner(self)
 
         self.setWindowTitle("GameExplorer - Tu biblioteca de videojuegos")
         self.setGeometry(100, 100, 900, 600)
 
         self.initUI()
         self.apply_styles()
+        self.jobs.progress.connect(self.show_progress)
+        self.metric_recorded.connect(self.on_metric_recorded)
+        self._metrics_listener = self.metric_recorded.emit
+        metrics.add_listener(self._metrics_listener)
         
         # --- NUEVO: Configuración del temporizador para la búsqueda ---
         self.search_timer = QTimer(self)
@@ -35,9 +72,14 @@ class GameExplorer(QMainWindow):
         self.search_timer.setInterval(300)     # Espera 300ms después de la última letra
         self.search_timer.timeout.connect(self.search_games)
 
-        # Carga inicial
+        self.favorites_timer = QTimer(self)
+        self.favorites_timer.setSingleShot(True)
+        self.favorites_timer.setInterval(1000)
+        self.favorites_timer.timeout.connect(self.favorites_manager.flush)
+
+        # Carga inicial: se lanza cuando la ventana ya está pintada, en segundo plano.
         self.platform_selector.setCurrentIndex(0)
-        self.platform_changed(self.platform_selector.currentText())
+        QTimer.singleShot(0, lambda: self.platform_changed(self.platform_selector.currentText()))
         self.populate_favorites_list()
 
     def initUI(self):
@@ -47,9 +89,14 @@ class GameExplorer(QMainWindow):
         self.tabs.addTab(self.tab_catalogo(), "Catálogo")
         self.tabs.addTab(self.tab_favoritos(), "Mis Juegos")
         self.tabs.addTab(self.tab_analisis(), "Análisis")
+        self.metrics_panel = MetricsPanel()
+        self.tabs.addTab(self.metrics_panel, "Rendimiento")
         self.tabs.addTab(self.tab_acerca(), "Acerca de")
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
+        # Última operación medida, siempre visible a la derecha de la barra de estado.
+        self.metrics_label = QLabel()
+        self.status_bar.addPermanentWidget(self.metrics_label)
 
 
     def tab_catalogo(self):
@@ -63,26 +110,84 @@ class GameExplorer(QMainWindow):
         platform_layout.addWidget(platform_label)
         platform_layout.addWidget(self.platform_selector)
         platform_layout.addStretch()
+        # Aplica los cambios del CSV (filas añadidas, modificadas o borradas) sin recargarlo entero.
+        self.reload_button = QPushButton("🔄 Recargar")
+        self.reload_button.clicked.connect(self.reload_catalog)
+        platform_layout.addWidget(self.reload_button)
 
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Buscar por nombre del juego...")
         
         # --- MODIFICADO: La señal ahora activa el temporizador ---
         self.search_input.textChanged.connect(self.on_search_text_changed)
-        
-        self.table = QTableWidget(0, 3)
-        self.table.setHorizontalHeaderLabels(["Nombre", "Género", "Puntuación"])
+        # Búsqueda aproximada: tolera erratas e iniciales y ordena por relevancia.
+        self.ranked_checkbox = QCheckBox(f"Búsqueda aproximada ({RANKED_LIMIT} mejores)")
+        self.ranked_checkbox.toggled.connect(self.search_games)
+        search_layout = QHBoxLayout()
+        search_layout.addWidget(self.search_input)
+        search_layout.addWidget(self.ranked_checkbox)
+
+        # Filtros por géneros (basta uno) y puntuación; junto a cada género, cuántos resultados lo tienen.
+        self.filter_genre_list = QListWidget()
+        self.filter_genre_list.setMaximumHeight(110)
+        for genre_name in sorted(self.data_manager.genre_map.values()):
+            item = QListWidgetItem(genre_name)
+            item.setData(Qt.ItemDataRole.UserRole, genre_name)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Unchecked)
+            self.filter_genre_list.addItem(item)
+        self.filter_genre_list.itemChanged.connect(self.on_search_text_changed)
+        self.min_rating_input = QSpinBox()
+        self.min_rating_input.setRange(0, 100)
+        self.min_rating_input.setSpecialValueText("Sin mínimo")
+        self.min_rating_input.valueChanged.connect(self.on_search_text_changed)
+        self.max_rating_input = QSpinBox()
+        self.max_rating_input.setRange(0, 100)
+        self.max_rating_input.setValue(100)
+        self.max_rating_input.valueChanged.connect(self.on_search_text_changed)
+        clear_filters_button = QPushButton("Quitar Filtros")
+        clear_filters_button.clicked.connect(self.clear_filters)
+        self.rating_facets_label = QLabel()
+        self.rating_facets_label.setWordWrap(True)
+        self.rating_facets_label.setStyleSheet("font-weight: normal;")
+        rating_layout = QVBoxLayout()
+        rating_layout.addWidget(QLabel("Puntuación mínima:"))
+        rating_layout.addWidget(self.min_rating_input)
+        rating_layout.addWidget(QLabel("Puntuación máxima:"))
+        rating_layout.addWidget(self.max_rating_input)
+        rating_layout.addWidget(clear_filters_button)
+        self.filters_widget = QWidget()
+        filters_layout = QHBoxLayout(self.filters_widget)
+        filters_layout.setContentsMargins(0, 0, 0, 0)
+        filters_layout.addWidget(self.filter_genre_list, 1)
+        filters_layout.addLayout(rating_layout)
+        filters_layout.addWidget(self.rating_facets_label, 1)
+        self.ranked_checkbox.toggled.connect(lambda ranked: self.filters_widget.setEnabled(not ranked))
+
+        self.catalog_model = CatalogTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.catalog_model)
+        self.table.setSortingEnabled(True)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        # El ajuste de columnas solo mide una muestra de filas, no el catálogo completo.
+        self.table.horizontalHeader().setResizeContentsPrecision(200)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)
 
         add_button = QPushButton("Agregar a Favoritos")
         add_button.clicked.connect(self.add_selected_to_favorites)
+        # Exporta las filas mostradas (búsqueda y orden incluidos).
+        self.export_results_button = QPushButton("💾 Exportar Resultados")
+        self.export_results_button.clicked.connect(self.export_catalog_results)
+        catalog_buttons_layout = QHBoxLayout()
+        catalog_buttons_layout.addWidget(add_button)
+        catalog_buttons_layout.addWidget(self.export_results_button)
 
         layout.addLayout(platform_layout)
-        layout.addWidget(self.search_input)
+        layout.addLayout(search_layout)
+        layout.addWidget(self.filters_widget)
         layout.addWidget(self.table)
-        layout.addWidget(add_button)
+        layout.addLayout(catalog_buttons_layout)
         tab.setLayout(layout)
         return tab
 
@@ -94,10 +199,98 @@ class GameExplorer(QMainWindow):
     def search_games(self):
         """
         Esta función ahora es llamada por el temporizador, no directamente.
+        La búsqueda corre en segundo plano y cancela la anterior si sigue en curso.
         """
+        platform = self.platform_selector.currentText()
         search_text = self.search_input.text()
-        results_df = self.data_manager.search_game_name(search_text)
-        self.populate_table(results_df)
+        ranked = self.ranked_checkbox.isChecked() and bool(search_text.strip())
+        self.jobs.submit(
+            'search', self._search_job, platform, search_text, ranked, self.catalog_query(),
+            on_result=self.on_search_finished, with_progress=True,
+        )
+
+    def catalog_query(self):
+        """CatalogQuery con el texto de búsqueda y los filtros de la pestaña Catálogo."""
+        genres = [self.filter_genre_list.item(i).data(Qt.ItemDataRole.UserRole)
+                  for i in range(self.filter_genre_list.count())
+                  if self.filter_genre_list.item(i).checkState() == Qt.CheckState.Checked]
+        min_rating = self.min_rating_input.value()
+        max_rating = self.max_rating_input.value()
+        return CatalogQuery(
+            self.search_input.text(), any_of=genres,
+            min_rating=min_rating if min_rating > 0 else None,
+            max_rating=max_rating if max_rating < 100 else None,
+        )
+
+    def clear_filters(self):
+        self.filter_genre_list.blockSignals(True)
+        for i in range(self.filter_genre_list.count()):
+            self.filter_genre_list.item(i).setCheckState(Qt.CheckState.Unchecked)
+        self.filter_genre_list.blockSignals(False)
+        self.min_rating_input.setValue(0)
+        self.max_rating_input.setValue(100)
+        self.search_timer.start()
+
+    def _search_job(self, platform, search_text, ranked, query, progress=None):
+        """Se ejecuta en un hilo de fondo: carga la plataforma si hace falta y busca."""
+        if not self.data_manager.load_new_data(platform, progress=progress):
+            return platform, None, None, ranked, query
+        catalog = self.data_manager.get_full_catalog(platform)
+        facets = None
+        if ranked:
+            positions, _ = self.data_manager.search_ranked_positions(
+                platform, search_text, RANKED_LIMIT, progress=progress)
+        elif query.has_genres or query.has_rating:
+            facets = self.data_manager.query(platform, query, progress=progress)
+            positions = facets.positions
+        else:
+            positions = self.data_manager.search_positions(platform, search_text)
+        return platform, catalog, positions, ranked, facets
+
+    def on_search_finished(self, result):
+        platform, catalog, positions, ranked, facets = result
+        if catalog is None:
+            self.catalog_model.clear()
+            self.status_bar.showMessage(f"Error al cargar datos de {platform}", 5000)
+            return
+        # Las facetas solo se muestran con filtros: salen de la misma consulta que
+        # filtró la tabla, así que una búsqueda solo por texto no recorre el catálogo.
+        self.show_facets(facets)
+        if ranked:
+            # Los resultados llegan ordenados por relevancia: se quita el orden por columna.
+            self.table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.populate_table(catalog, positions)
+        if ranked:
+            self.status_bar.showMessage(f"Mostrando los {len(positions)} juegos más parecidos de {platform}", 5000)
+        else:
+            self.status_bar.showMessage(f"Mostrando {len(positions)} juegos de {platform}", 5000)
+        if not self._first_data_reported:
+            self._first_data_reported = True
+            print(f"Arranque: primer catálogo ({platform}) listo en {time.perf_counter() - self._created_at:.2f} s")
+
+    def show_facets(self, result):
+        """Muestra junto a cada género y en el resumen de puntuaciones cuántos resultados hay."""
+        genre_counts = {} if result is None else result.genre_counts
+        self.filter_genre_list.blockSignals(True)
+        for i in range(self.filter_genre_list.count()):
+            item = self.filter_genre_list.item(i)
+            genre = item.data(Qt.ItemDataRole.UserRole)
+            item.setText(f"{genre} ({genre_counts[genre]})" if genre in genre_counts else genre)
+        self.filter_genre_list.blockSignals(False)
+        if result is None:
+            self.rating_facets_label.clear()
+            return
+        facets = ", ".join(f"{label}: <b>{count}</b>" for label, count in result.rating_counts.items() if count)
+        self.rating_facets_label.setText(f"<b>Resultados por puntuación:</b><br>{facets}")
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._first_show_reported:
+            self._first_show_reported = True
+            print(f"Arranque: ventana visible en {time.perf_counter() - self._created_at:.2f} s")
+
+    def show_progress(self, message):
+        self.status_bar.showMessage(message)
 
     # ... (El resto de la clase, como tab_favoritos, tab_analisis, etc., se mantiene sin cambios)
     def tab_favoritos(self):
@@ -133,7 +326,7 @@ class GameExplorer(QMainWindow):
         platform_layout = QHBoxLayout()
         platform_label = QLabel("1. Selecciona la Consola:")
         self.analysis_platform_selector = QComboBox()
-        self.analysis_platform_selector.addItems(["PlayStation", "XBOX", "Nintendo", "PC"])
+        self.analysis_platform_selector.addItems(["PlayStation", "XBOX", "Nintendo", "PC", ALL_PLATFORMS])
         platform_layout.addWidget(platform_label)
         platform_layout.addWidget(self.analysis_platform_selector)
         genres_label = QLabel("2. Selecciona los Géneros:")
@@ -153,7 +346,18 @@ class GameExplorer(QMainWindow):
         self.generate_chart_button.clicked.connect(self.generate_comparison_chart)
         self.generate_chart_button.setEnabled(False)
         buttons_layout.addWidget(self.analyze_button)
+        self.rating_analysis_button = QPushButton("⭐ Analizar Puntuaciones")
+        self.rating_analysis_button.clicked.connect(self.perform_rating_analysis)
+        buttons_layout.addWidget(self.rating_analysis_button)
+        self.export_chart_button = QPushButton("💾 Exportar Gráfico")
+        self.export_chart_button.clicked.connect(self.export_chart)
+        self.export_chart_button.setEnabled(False)
+        self.export_analysis_button = QPushButton("💾 Exportar Tabla")
+        self.export_analysis_button.clicked.connect(self.export_analysis_results)
+        self.export_analysis_button.setEnabled(False)
         buttons_layout.addWidget(self.generate_chart_button)
+        buttons_layout.addWidget(self.export_chart_button)
+        buttons_layout.addWidget(self.export_analysis_button)
         self.analysis_results_label = QLabel("Resultados del análisis aparecerán aquí.")
         self.analysis_results_label.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.analysis_results_label.setStyleSheet("font-weight: normal; margin-top: 10px;")
@@ -162,6 +366,8 @@ class GameExplorer(QMainWindow):
         layout.addWidget(self.analysis_genre_list)
         layout.addLayout(buttons_layout)
         layout.addWidget(self.analysis_results_label)
+        self.chart = ComparisonChart()
+        layout.addWidget(self.chart, 1)
         tab.setLayout(layout)
         return tab
 
@@ -182,22 +388,27 @@ class GameExplorer(QMainWindow):
         tab.setLayout(layout)
         return tab
 
+    def _favorite_from_row(self, row):
+        row_data = self.catalog_model.row_data(row)
+        name = row_data.get('name')
+        return {'name': '' if pd.isna(name) else str(name), 'platform': self.platform_selector.currentText()}
+
     def add_selected_to_favorites(self):
         selected_rows = self.table.selectionModel().selectedRows()
         if not selected_rows:
             self.status_bar.showMessage("Por favor, selecciona un juego del catálogo primero.", 4000)
             return
-        row_index = selected_rows[0].row()
-        game_data = {
-            'name': self.table.item(row_index, 0).text(),
-            'genres': self.table.item(row_index, 1).text(),
-            'rating': self.table.item(row_index, 2).text()
-        }
-        if self.favorites_manager.add_favorite(game_data):
-            self.status_bar.showMessage(f"'{game_data['name']}' añadido a favoritos.", 4000)
+        games = [self._favorite_from_row(index.row()) for index in selected_rows]
+        added = self.favorites_manager.add_favorites(games)
+        if added:
+            self.favorites_timer.start()
             self.populate_favorites_list()
+        if len(games) > 1:
+            self.status_bar.showMessage(f"{added} de {len(games)} juegos añadidos a favoritos.", 4000)
+        elif added:
+            self.status_bar.showMessage(f"'{games[0]['name']}' añadido a favoritos.", 4000)
         else:
-            self.status_bar.showMessage(f"'{game_data['name']}' ya estaba en favoritos.", 4000)
+            self.status_bar.showMessage(f"'{games[0]['name']}' ya estaba en favoritos.", 4000)
 
     def remove_selected_favorite(self):
         selected_item = self.fav_list.currentItem()
@@ -205,7 +416,8 @@ class GameExplorer(QMainWindow):
             self.status_bar.showMessage("Por favor, selecciona un juego de tu lista de favoritos.", 4000)
             return
         game_name = selected_item.text()
-        self.favorites_manager.remove_favorite(game_name)
+        self.favorites_manager.remove_favorite(selected_item.data(Qt.ItemDataRole.UserRole))
+        self.favorites_timer.start()
         self.status_bar.showMessage(f"'{game_name}' eliminado de favoritos.", 4000)
         self.populate_favorites_list()
         self.notes_area.clear()
@@ -215,16 +427,18 @@ class GameExplorer(QMainWindow):
         self.fav_list.clear()
         favorites = self.favorites_manager.get_all_favorites()
         if favorites is not None and not favorites.empty:
-            for game_name in favorites['name']:
-                self.fav_list.addItem(QListWidgetItem(game_name))
+            for key, game_name in zip(favorites['game_key'], favorites['name']):
+                item = QListWidgetItem(game_name)
+                # El texto es solo para mostrar; el favorito se identifica por su clave.
+                item.setData(Qt.ItemDataRole.UserRole, key)
+                self.fav_list.addItem(item)
 
     def display_favorite_details(self, current_item, previous_item):
         if not current_item:
             self.notes_area.clear()
             self.rating_slider.setValue(0)
             return
-        game_name = current_item.text()
-        details = self.favorites_manager.get_favorite_details(game_name)
+        details = self.favorites_manager.get_favorite_details(current_item.data(Qt.ItemDataRole.UserRole))
         if details is not None:
             self.notes_area.setText(str(details.get('personal_notes', '')))
             self.rating_slider.setValue(int(details.get('personal_rating', 0)))
@@ -237,56 +451,180 @@ class GameExplorer(QMainWindow):
         game_name = selected_item.text()
         notes = self.notes_area.toPlainText()
         rating = self.rating_slider.value()
-        if self.favorites_manager.update_favorite_details(game_name, notes, rating):
+        key = selected_item.data(Qt.ItemDataRole.UserRole)
+        if self.favorites_manager.update_favorite_details(key, notes, rating):
+            self.favorites_timer.start()
             self.status_bar.showMessage(f"Cambios para '{game_name}' guardados.", 4000)
         else:
             self.status_bar.showMessage("Error al guardar los cambios.", 4000)
 
-    def platform_changed(self, platform_name):
-        success = self.data_manager.load_new_data(platform_name)
-        if success:
+    def reload_catalog(self):
+        platform = self.platform_selector.currentText()
+        self.reload_button.setEnabled(False)
+        self.jobs.submit(
+            'reload', self.data_manager.reload, platform,
+            on_result=self.on_reload_finished, on_error=self.on_reload_failed,
+            message=f"Buscando cambios en el catálogo de {platform}...", with_progress=True,
+        )
+
+    def on_reload_failed(self, message):
+        self.reload_button.setEnabled(True)
+        self.status_bar.showMessage(f"Error al recargar: {message}", 5000)
+
+    def on_reload_finished(self, report):
+        self.reload_button.setEnabled(True)
+        platform = report['platform']
+        if report['mode'] == 'unchanged':
+            self.status_bar.showMessage(f"El catálogo de {platform} no tiene cambios.", 4000)
+            return
+        self.status_bar.showMessage(
+            f"{platform} recargado: {report['added']} nuevos, {report['changed']} modificados, "
+            f"{report['removed']} eliminados ({report['rows']} en total).", 6000)
+        if platform == self.platform_selector.currentText():
             self.search_games()
-            self.status_bar.showMessage(f"Mostrando juegos de {platform_name}", 5000)
-        else:
-            self.table.setRowCount(0)
-            self.status_bar.showMessage(f"Error al cargar datos de {platform_name}", 5000)
+
+    def platform_changed(self, platform_name):
+        self.search_timer.stop()
+        self.status_bar.showMessage(f"Cargando juegos de {platform_name}...")
+        self.search_games()
     
-    def populate_table(self, dataframe):
+    def populate_table(self, dataframe, positions=None):
+        """Muestra en la tabla las filas 'positions' de 'dataframe' (todas si es None)."""
         if dataframe is None or dataframe.empty:
-            self.table.setRowCount(0)
+            self.catalog_model.clear()
             return
-        self.table.blockSignals(True)
-        self.table.setRowCount(len(dataframe))
-        column_map = {'name': 0, 'genres': 1, 'rating': 2}
-        for row_idx, row_data in dataframe.iterrows():
-            for col_name, col_idx in column_map.items():
-                if col_name in row_data and pd.notna(row_data[col_name]):
-                    item = QTableWidgetItem(str(row_data[col_name]))
-                    self.table.setItem(row_idx, col_idx, item)
-        self.table.blockSignals(False)
-        self.table.resizeColumnsToContents()
+        with metrics.measure('populate_table') as record:
+            self.catalog_model.set_data(dataframe, positions)
+            self.table.resizeColumnsToContents()
+            record['rows'] = self.catalog_model.rowCount()
 
     def perform_analysis(self):
         platform = self.analysis_platform_selector.currentText()
-        self.data_manager.load_new_data(platform)
-        self.status_bar.showMessage(f"Analizando base de datos de {platform}...", 3000)
-        selected_genres = []
-        for i in range(self.analysis_genre_list.count()):
-            item = self.analysis_genre_list.item(i)
-            if item.checkState() == Qt.CheckState.Checked:
-                selected_genres.append(item.text())
+        selected_genres = self.selected_analysis_genres()
         if not selected_genres:
             self.analysis_results_label.setText("Por favor, selecciona al menos un género.")
             self.generate_chart_button.setEnabled(False)
             return
-        counts = self.data_manager.count_games_by_genre(selected_genres)
+        # Los conteos vienen de la caché de consultas de DataManager, ligada a la versión de los datos.
+        self.analyze_button.setEnabled(False)
+        self.jobs.submit(
+            'analysis', self._analysis_job, platform, selected_genres,
+            on_result=self.on_analysis_finished, on_error=self.on_analysis_failed,
+            message=f"Analizando base de datos de {platform}...", with_progress=True,
+        )
+
+    def _analysis_job(self, platform, selected_genres, progress=None):
+        """Se ejecuta en un hilo de fondo."""
+        if platform == ALL_PLATFORMS:
+            if progress is not None:
+                progress("Analizando todas las plataformas en paralelo...")
+            stats = self.data_manager.analyze_platforms()
+            matrix = to_matrix(stats[stats['genre'].isin(selected_genres)])
+            return platform, selected_genres, (matrix.fillna(0).astype(int) if not matrix.empty else None)
+        if not self.data_manager.load_new_data(platform, progress=progress):
+            return platform, selected_genres, None
+        return platform, selected_genres, self.data_manager.count_games_by_genre(platform, selected_genres)
+
+    def on_analysis_failed(self, message):
+        self.analyze_button.setEnabled(True)
+        self.status_bar.showMessage(f"Error en el análisis: {message}", 5000)
+
+    def on_analysis_finished(self, result):
+        self.analyze_button.setEnabled(True)
+        platform, selected_genres, counts = result
+        if counts is None:
+            self.status_bar.showMessage(f"Error al cargar datos de {platform}", 5000)
+            return
+        self.status_bar.showMessage(f"Análisis de {platform} completado.", 3000)
         self.analysis_data = counts
         self.analysis_platform = platform
-        results_text = f"<b>Conteo de juegos en {platform}:</b><br><br>"
-        for genre, count in counts.items():
-            results_text += f"• {genre}: <b>{count}</b> juegos<br>"
+        self.analysis_title = None
+        self.analysis_table = counts_frame(counts)
+        self.export_analysis_button.setEnabled(True)
+        if platform == ALL_PLATFORMS:
+            results_text = "<b>Conteo de juegos por plataforma:</b><br><br>"
+            for genre, row in counts.iterrows():
+                per_platform = ", ".join(f"{name}: <b>{count}</b>" for name, count in row.items())
+                results_text += f"• {genre}: {per_platform}<br>"
+        else:
+            results_text = f"<b>Conteo de juegos en {platform}:</b><br><br>"
+            for genre, count in counts.items():
+                results_text += f"• {genre}: <b>{count}</b> juegos<br>"
         self.analysis_results_label.setText(results_text)
         self.generate_chart_button.setEnabled(True)
+        # Si ya hay un gráfico a la vista, se actualiza en el sitio.
+        if self.chart.has_chart:
+            self.generate_comparison_chart()
+
+    def selected_analysis_genres(self):
+        return [self.analysis_genre_list.item(i).text() for i in range(self.analysis_genre_list.count())
+                if self.analysis_genre_list.item(i).checkState() == Qt.CheckState.Checked]
+
+    def perform_rating_analysis(self):
+        """Puntuaciones del catálogo completo y de los géneros marcados (puede no haber ninguno)."""
+        platform = self.analysis_platform_selector.currentText()
+        self.rating_analysis_button.setEnabled(False)
+        self.jobs.submit(
+            'rating_analysis', self._rating_analysis_job, platform, self.selected_analysis_genres(),
+            on_result=self.on_rating_analysis_finished, on_error=self.on_rating_analysis_failed,
+            message=f"Analizando puntuaciones de {platform}...", with_progress=True,
+        )
+
+    def _rating_analysis_job(self, platform, selected_genres, progress=None):
+        """Se ejecuta en un hilo de fondo. Devuelve (plataforma, resúmenes, mejores, histograma)."""
+        platforms = self.data_manager.PLATFORMS if platform == ALL_PLATFORMS else [platform]
+        summaries, tops, histograms = {}, {}, {}
+        for name in platforms:
+            summary = self.data_manager.rating_summary(name, selected_genres, progress=progress)
+            if summary.empty:
+                continue
+            summaries[name] = summary
+            tops[name] = self.data_manager.top_rated(name, selected_genres, n=3)
+            histograms[name] = self.data_manager.rating_histogram(name, selected_genres)
+        if not summaries:
+            return platform, None, None, None
+        if platform == ALL_PLATFORMS:
+            # Con varias plataformas se compara la distribución del catálogo completo de cada una.
+            histogram = pd.DataFrame({name: frame[ALL_GENRES] for name, frame in histograms.items()})
+        else:
+            histogram = histograms[platform]
+        return platform, summaries, tops, histogram
+
+    def on_rating_analysis_failed(self, message):
+        self.rating_analysis_button.setEnabled(True)
+        self.status_bar.showMessage(f"Error en el análisis de puntuaciones: {message}", 5000)
+
+    def on_rating_analysis_finished(self, result):
+        self.rating_analysis_button.setEnabled(True)
+        platform, summaries, tops, histogram = result
+        if summaries is None:
+            self.status_bar.showMessage(f"Error al cargar datos de {platform}", 5000)
+            return
+        self.status_bar.showMessage(f"Análisis de puntuaciones de {platform} completado.", 3000)
+        results_text = ""
+        for name, summary in summaries.items():
+            results_text += f"<b>Puntuaciones en {name}:</b><br>"
+            for row in summary.itertuples(index=False):
+                if not row.rated_games:
+                    results_text += f"• {row.genre}: {row.games} juegos, ninguno puntuado<br>"
+                    continue
+                results_text += (
+                    f"• {row.genre}: media <b>{row.rating_mean:.1f}</b>, mediana {row.rating_median:.1f}, "
+                    f"p10-p90 {row.p10:.1f}-{row.p90:.1f} ({row.rated_games} de {row.games} puntuados)<br>")
+            best = tops[name][tops[name]['genre'] == ALL_GENRES]
+            if not best.empty:
+                names = ", ".join(f"{game.name} ({game.rating:g})" for game in best.itertuples(index=False))
+                results_text += f"Mejor puntuados: {names}<br>"
+            results_text += "<br>"
+        self.analysis_results_label.setText(results_text)
+        self.analysis_data = histogram
+        self.analysis_platform = platform
+        self.analysis_title = f'Distribución de Puntuaciones en {platform}'
+        self.analysis_table = pd.concat(
+            [summary.assign(platform=name) for name, summary in summaries.items()], ignore_index=True)
+        self.export_analysis_button.setEnabled(True)
+        self.generate_chart_button.setEnabled(True)
+        self.generate_comparison_chart()
 
     def update_genre_item_style(self, item):
         if item.checkState() == Qt.CheckState.Checked:
@@ -295,17 +633,81 @@ class GameExplorer(QMainWindow):
             item.setBackground(QColor("transparent"))
             
     def generate_comparison_chart(self):
-        if not self.analysis_data:
+        if self.analysis_data is None or len(self.analysis_data) == 0:
+            return
+        self.chart.plot(self.analysis_data, self.analysis_platform, self.analysis_title)
+        self.export_chart_button.setEnabled(True)
+
+    def export_chart(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Exportar gráfico", f"comparativa_{self.analysis_platform}.png",
+            "Imagen PNG (*.png);;Imagen SVG (*.svg)")
+        if not path:
+            return
+        try:
+            self.chart.export(path)
+            self.status_bar.showMessage(f"Gráfico exportado a {path}", 4000)
+        except (OSError, ValueError) as e:
+            self.status_bar.showMessage(f"Error al exportar el gráfico: {e}", 5000)
+
+    def ask_export_path(self, title, default_name):
+        """Pide el archivo de destino; devuelve (ruta, formato) o (None, None)."""
+        path, selected_filter = QFileDialog.getSaveFileName(
+            self, title, f"{default_name}.csv", ";;".join(EXPORT_FILTERS))
+        if not path:
+            return None, None
+        file_format = EXPORT_FILTERS.get(selected_filter, 'csv')
+        if not path.lower().endswith(EXPORT_FORMATS[file_format]):
+            path += EXPORT_FORMATS[file_format]
+        return path, file_format
+
+    def export_catalog_results(self):
+        df, positions = self.catalog_model.shown_rows()
+        if df.empty or len(positions) == 0:
+            self.status_bar.showMessage("No hay resultados que exportar.", 4000)
+            return
+        platform = self.platform_selector.currentText()
+        path, file_format = self.ask_export_path("Exportar resultados", f"catalogo_{platform}")
+        if path:
+            self.start_export('export', self.export_results_button, df, path, file_format, positions)
+
+    def export_analysis_results(self):
+        if self.analysis_table is None or self.analysis_table.empty:
             return
-        genres = list(self.analysis_data.keys())
-        counts = list(self.analysis_data.values())
-        fig, ax = plt.subplots(figsize=(10, 6))
-        ax.bar(genres, counts, color='#f06292')
-        ax.set_ylabel('Cantidad de Juegos')
-        ax.set_title(f'Comparativa de Géneros en {self.analysis_platform}')
-        ax.tick_params(axis='x', rotation=45)
-        fig.tight_layout()
-        plt.show()
+        path, file_format = self.ask_export_path("Exportar tabla", f"analisis_{self.analysis_platform}")
+        if path:
+            self.start_export('export_analysis', self.export_analysis_button,
+                              self.analysis_table, path, file_format)
+
+    def start_export(self, channel, button, df, path, file_format, positions=None):
+        """Exporta en segundo plano, por bloques y con avance en la barra de estado."""
+        button.setEnabled(False)
+
+        def finished(rows):
+            button.setEnabled(True)
+            self.status_bar.showMessage(f"{rows} filas exportadas a {path}", 5000)
+
+        def failed(message):
+            button.setEnabled(True)
+            self.status_bar.showMessage(f"Error al exportar: {message}", 5000)
+
+        self.jobs.submit(
+            channel, export_frame, df, path, positions, file_format,
+            on_result=finished, on_error=failed,
+            message=f"Exportando {len(df) if positions is None else len(positions)} filas...",
+            with_progress=True,
+        )
+
+    def on_metric_recorded(self, record):
+        self.metrics_label.setText(f"⏱ {MetricsPanel.describe(record)}")
+        self.metrics_panel.mark_dirty()
+
+    def closeEvent(self, event):
+        metrics.remove_listener(self._metrics_listener)
+        self.jobs.cancel_all()
+        self.favorites_timer.stop()
+        self.favorites_manager.close()
+        super().closeEvent(event)
 
     def apply_styles(self):
         self.setStyleSheet(
@@ -327,7 +729,7 @@ class GameExplorer(QMainWindow):
                 border-radius: 6px; font-weight: bold;
             }
             QPushButton:hover { background-color: #d81b60; }
-            QTableWidget { background-color: white; border: 1px solid #e91e63; }
+            QTableView { background-color: white; border: 1px solid #e91e63; }
             QListWidget { background-color: white; border: 1px solid #e91e63; }
             QStatusBar { background-color: #fce4ec; color: #880e4f; }
             """
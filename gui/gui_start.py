@@ -8,9 +8,8 @@ from PyQt6.QtWidgets import QApplication, QWidget, QLabel, QPushButton, QVBoxLay
 from PyQt6.QtGui import QFont, QColor, QPalette, QPixmap
 from PyQt6.QtCore import Qt
 
-# Asumimos que los otros archivos están en las carpetas correctas
-from .gui_game_explorer import GameExplorer
-from app_analyzer.info_data import DataManager
+# GameExplorer y DataManager (pandas, pyarrow...) se importan al pulsar
+# "Iniciar", para que la bienvenida aparezca sin esperar a esos módulos.
 
 class Inicio(QWidget):
     def __init__(self):
@@ -81,6 +80,8 @@ class Inicio(QWidget):
         self.boton_iniciar.setStyleSheet("background-color: #cccccc; color: #666666;")
 
     def abrir_game_explorer(self):
+        from app_analyzer.info_data import DataManager
+        from .gui_game_explorer import GameExplorer
         self.manager = DataManager()
         self.ventana_secundaria = GameExplorer(self.manager)
         self.ventana_secundaria.show()
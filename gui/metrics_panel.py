@@ -0,0 +1,99 @@
+# gui/metrics_panel.py
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QCheckBox, QTextEdit, QFileDialog
+)
+from app_analyzer.metrics import metrics
+
+class MetricsPanel(QWidget):
+    """
+    Pestaña de rendimiento: resumen de tiempos por operación, últimas
+    mediciones y el perfil de la última operación perfilada. El texto se
+    regenera como mucho dos veces por segundo, aunque lleguen muchas
+    mediciones seguidas.
+    """
+    RECENT = 15
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._dirty = False
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(500)
+        self.refresh_timer.timeout.connect(self.refresh_if_dirty)
+        self.refresh_timer.start()
+
+        self.cpu_checkbox = QCheckBox("Perfilar CPU (cProfile)")
+        self.memory_checkbox = QCheckBox("Perfilar memoria (tracemalloc)")
+        self.cpu_checkbox.toggled.connect(self.update_profiling)
+        self.memory_checkbox.toggled.connect(self.update_profiling)
+        export_button = QPushButton("Exportar JSON")
+        export_button.clicked.connect(self.export_json)
+        clear_button = QPushButton("Limpiar")
+        clear_button.clicked.connect(self.clear)
+
+        options_layout = QHBoxLayout()
+        options_layout.addWidget(self.cpu_checkbox)
+        options_layout.addWidget(self.memory_checkbox)
+        options_layout.addStretch()
+        options_layout.addWidget(export_button)
+        options_layout.addWidget(clear_button)
+
+        self.report_area = QTextEdit()
+        self.report_area.setReadOnly(True)
+        self.report_area.setFont(QFont("Consolas", 9))
+        self.report_area.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel("Tiempos de las operaciones de esta sesión:"))
+        layout.addLayout(options_layout)
+        layout.addWidget(self.report_area)
+        self.setLayout(layout)
+        self.refresh()
+
+    def mark_dirty(self):
+        self._dirty = True
+
+    def refresh_if_dirty(self):
+        if self._dirty and self.isVisible():
+            self.refresh()
+
+    def refresh(self):
+        self._dirty = False
+        summary = metrics.summary()
+        records = metrics.records()
+        lines = ["== Resumen por operación ==", summary.to_string(float_format='{:.2f}'.format)
+                 if not summary.empty else "(sin mediciones)", "", "== Últimas operaciones =="]
+        for record in records[-self.RECENT:][::-1]:
+            lines.append(self.describe(record))
+        profiled = next((record for record in reversed(records) if 'profile' in record), None)
+        if profiled is not None:
+            lines += ["", f"== Perfil de '{profiled['operation']}' ==", profiled['profile']]
+        self.report_area.setPlainText("\n".join(lines))
+
+    @staticmethod
+    def describe(record):
+        """Una línea legible por medición, también usada en la barra de estado."""
+        text = f"{record['operation']}: {record['seconds'] * 1000:.0f} ms"
+        if record.get('rows') is not None:
+            text += f" · {record['rows']} filas"
+        if record.get('cache') == 'hit':
+            text += " · desde caché"
+        if record.get('memory_delta_mb') is not None:
+            text += f" · {record['memory_delta_mb']:+.1f} MB"
+        if record.get('traced_peak_mb') is not None:
+            text += f" · pico {record['traced_peak_mb']:.1f} MB"
+        return text
+
+    def update_profiling(self):
+        metrics.set_profiling(cpu=self.cpu_checkbox.isChecked(), memory=self.memory_checkbox.isChecked())
+
+    def export_json(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Exportar métricas", "metricas.json", "JSON (*.json)")
+        if path:
+            metrics.export_json(path)
+
+    def clear(self):
+        metrics.clear()
+        self.refresh()
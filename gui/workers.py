@@ -0,0 +1,137 @@
+# gui/workers.py
+
+import itertools
+import threading
+import traceback
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+class WorkerSignals(QObject):
+    """Señales que un trabajo emite desde el hilo de fondo hacia la interfaz."""
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+    progress = pyqtSignal(int, str)
+    # El trabajo se canceló antes de empezar (ya fuera de la cola del pool).
+    skipped = pyqtSignal(int)
+
+class Job(QRunnable):
+    """
+    Ejecuta una función en el QThreadPool.
+    Si la función acepta el argumento 'progress', recibe un callback para
+    informar mensajes de avance.
+    """
+
+    def __init__(self, job_id, fn, args, kwargs, with_progress=False):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.job_id = job_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.with_progress = with_progress
+        self.cancelled = threading.Event()
+        self.signals = WorkerSignals()
+
+    def report(self, message):
+        if not self.cancelled.is_set():
+            self.signals.progress.emit(self.job_id, message)
+
+    def run(self):
+        if self.cancelled.is_set():
+            self.signals.skipped.emit(self.job_id)
+            return
+        try:
+            if self.with_progress:
+                result = self.fn(*self.args, progress=self.report, **self.kwargs)
+            else:
+                result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.failed.emit(self.job_id, str(e))
+            return
+        self.signals.finished.emit(self.job_id, result)
+
+class JobRunner(QObject):
+    """
+    Cola de trabajos en segundo plano para la interfaz.
+
+    Cada trabajo pertenece a un canal ('load', 'search', 'analysis', ...).
+    Al enviar un trabajo nuevo a un canal, el anterior se cancela: si aún no
+    empezó se retira del pool y, si ya está corriendo, su resultado se
+    descarta al terminar. Los resultados llegan al hilo de la interfaz a
+    través de señales.
+    """
+    progress = pyqtSignal(str)
+
+    def __init__(self, parent=None, pool=None):
+        super().__init__(parent)
+        self.pool = pool or QThreadPool.globalInstance()
+        self._ids = itertools.count(1)
+        self._current = {}
+        self._jobs = {}
+
+    def submit(self, channel, fn, *args, on_result=None, on_error=None,
+               message=None, with_progress=False, **kwargs):
+        """Envía 'fn(*args, **kwargs)' al pool y cancela el trabajo previo del canal."""
+        self.cancel(channel)
+        job = Job(next(self._ids), fn, args, kwargs, with_progress)
+        job.signals.finished.connect(self._on_finished)
+        job.signals.failed.connect(self._on_failed)
+        job.signals.progress.connect(self._on_progress)
+        job.signals.skipped.connect(self._forget)
+        self._current[channel] = job.job_id
+        self._jobs[job.job_id] = (channel, job, on_result, on_error)
+        if message:
+            self.progress.emit(message)
+        self.pool.start(job)
+        return job.job_id
+
+    def cancel(self, channel):
+        job_id = self._current.pop(channel, None)
+        if job_id is None or job_id not in self._jobs:
+            return
+        _, job, _, _ = self._jobs[job_id]
+        job.cancelled.set()
+        if self.pool.tryTake(job):
+            self._forget(job_id)
+
+    def cancel_all(self):
+        for channel in list(self._current):
+            self.cancel(channel)
+
+    def is_busy(self):
+        return bool(self._current)
+
+    def _is_current(self, job_id):
+        if job_id not in self._jobs:
+            return False
+        channel = self._jobs[job_id][0]
+        return self._current.get(channel) == job_id
+
+    def _forget(self, job_id):
+        self._jobs.pop(job_id, None)
+
+    def _on_finished(self, job_id, result):
+        current = self._is_current(job_id)
+        entry = self._jobs.get(job_id)
+        if current:
+            self._current.pop(entry[0], None)
+        self._forget(job_id)
+        if current and entry[2] is not None:
+            entry[2](result)
+
+    def _on_failed(self, job_id, message):
+        current = self._is_current(job_id)
+        entry = self._jobs.get(job_id)
+        if current:
+            self._current.pop(entry[0], None)
+        self._forget(job_id)
+        if not current:
+            return
+        if entry[3] is not None:
+            entry[3](message)
+        else:
+            self.progress.emit(f"Error: {message}")
+
+    def _on_progress(self, job_id, message):
+        if self._is_current(job_id):
+            self.progress.emit(message)
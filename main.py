@@ -1,13 +1,18 @@
 import sys
+import multiprocessing
 ## Primero instala las dependencias necesarias:
 ## pip install PyQt6
 ## pip install pandas
 ## pip install matplotlib
+## pip install pyarrow   (opcional: caché de datos en formato Feather)
+## pip install psutil    (opcional: memoria del proceso en la pestaña Rendimiento)
 
 from PyQt6.QtWidgets import QApplication
 from gui.gui_start import Inicio
 
 if __name__ == "__main__":
+    # Necesario para el pool de procesos del análisis entre plataformas en el .exe
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     ventana_de_bienvenida = Inicio()
     ventana_de_bienvenida.show()
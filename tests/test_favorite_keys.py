@@ -0,0 +1,54 @@
+# tests/test_favorite_keys.py
+#
+# Las claves que guarda FavoritesManager (texto hexadecimal de format_key)
+# deben servir tal cual para consultar el catálogo con DataManager.
+
+import pytest
+
+from app_analyzer.game_keys import game_key, parse_key
+from app_analyzer.info_data import DataManager
+from app_analyzer.my_favorite_game import FavoritesManager
+
+CATALOGS = {
+    'PC': ['Half-Life™ 2', 'Café Racer', 'Dragon Quest'],
+    'XBOX': ['Half-Life 2', 'Night Racer'],
+}
+
+@pytest.fixture
+def manager(tmp_path):
+    with open(tmp_path / "genres.csv", 'w', encoding='utf-8') as f:
+        f.write("genre_id,genre\n1,Action\n")
+    for platform, names in CATALOGS.items():
+        with open(tmp_path / f"all_games_{platform}.csv", 'w', encoding='utf-8') as f:
+            f.write("id,name,genres,rating,platforms\n")
+            f.writelines(f'{i},{name},"[1]",{50 + i},"[6]"\n' for i, name in enumerate(names))
+    return DataManager(base_path=str(tmp_path))
+
+@pytest.fixture
+def favorites(tmp_path):
+    favorites = FavoritesManager(filepath=str(tmp_path / "favorites.db"), legacy_csv_path=None)
+    yield favorites
+    favorites.close()
+
+def test_stored_key_resolves_in_catalog(tmp_path, manager, favorites):
+    favorites.add_favorite({'name': 'Half-Life™ 2', 'platform': 'PC'})
+    favorites.close()
+    # La clave se lee de la base de datos, tal como la guardó FavoritesManager.
+    stored = FavoritesManager(filepath=str(tmp_path / "favorites.db"), legacy_csv_path=None)
+    key = stored.get_all_favorites()['game_key'].iloc[0]
+    stored.close()
+    assert isinstance(key, str)
+
+    row = manager.find_game('PC', key)
+    assert row is not None and row['name'] == 'Half-Life™ 2'
+    assert sorted(manager.game_platforms(key=key)) == ['PC', 'XBOX']
+    assert sorted(manager.game_platforms(key=key, load=False)) == ['PC', 'XBOX']
+    assert manager.find_game('XBOX', key)['name'] == 'Half-Life 2'
+
+def test_key_forms_agree(manager):
+    key = FavoritesManager.key_of('Dragon Quest')
+    assert manager.find_game('PC', key)['name'] == 'Dragon Quest'
+    assert manager.find_game('PC', parse_key(key))['name'] == 'Dragon Quest'
+    assert manager.game_platforms('Dragon Quest') == manager.game_platforms(key=key) == ['PC']
+    assert manager.game_platforms(key=game_key('Dragon Quest')) == ['PC']
+    assert manager.find_game('XBOX', key) is None
@@ -0,0 +1,29 @@
+# tests/test_query_cache.py
+
+import numpy as np
+import pandas as pd
+
+from app_analyzer.query_cache import QueryCache
+
+def table(rows):
+    return pd.DataFrame({'name': [f"Juego número {i}" for i in range(rows)], 'rating': np.arange(rows, dtype=float)})
+
+def test_dataframes_count_against_byte_budget():
+    frame = table(10_000)
+    size = int(frame.memory_usage(deep=True).sum())
+    cache = QueryCache(max_bytes=size * 2 + size // 2)
+    for name in 'abc':
+        cache.put(('PC', 'v1', name), table(10_000))
+    stats = cache.stats()
+    assert stats['entries'] == 2
+    assert stats['bytes'] <= cache.max_bytes
+    assert not cache.get(('PC', 'v1', 'a'))[0]
+
+def test_sizes_arrays_series_and_tuples():
+    cache = QueryCache()
+    positions = np.arange(1000, dtype=np.int64)
+    series = table(100)['name']
+    cache.put(('PC', 'v1', 'search'), positions)
+    cache.put(('PC', 'v1', 'query'), (positions.copy(), {}, {}, []))
+    cache.put(('PC', 'v1', 'names'), series)
+    assert cache.stats()['bytes'] == 2 * positions.nbytes + int(series.memory_usage(deep=True))
@@ -0,0 +1,138 @@
+# tests/test_reload.py
+#
+# DataManager.reload parchea el catálogo (DataFrame, índice de nombres,
+# máscaras de géneros y claves de juego) en lugar de reconstruirlo. Tras
+# cada tipo de cambio en el CSV, las búsquedas y los conteos deben ser los
+# mismos que con una carga desde cero del mismo archivo.
+
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from app_analyzer.delta import match_rows
+from app_analyzer.info_data import DataManager
+from app_analyzer.name_index import NameIndex
+
+PLATFORM = 'PC'
+GENRES = {1: 'Action', 2: 'Adventure', 3: 'Puzzle', 4: 'Racing'}
+WORDS = ['Dragon', 'Quest', 'Drago', 'Café', 'Racer', 'Puzzle', 'Night', 'Pokémon']
+SEARCHES = ['', 'dra', 'drag', 'dragon', 'dragon q', 'cafe', 'poke', 'z', 'qu', 'night racer']
+GENRE_SETS = [['Action'], ['Adventure', 'Puzzle'], list(GENRES.values())]
+
+def catalog_lines(count, start=0):
+    lines = []
+    for i in range(start, start + count):
+        name = f"{WORDS[i % len(WORDS)]} {WORDS[(i * 3) % len(WORDS)]} {i}"
+        genres = [gid for gid in GENRES if (i + gid) % 3 == 0] or [4]
+        rating = '' if i % 7 == 0 else f"{(i * 13) % 100}.5"
+        lines.append(f'{i},{name},"{genres}",{rating},"[6]"\n')
+    return lines
+
+def write_catalog(base_path, lines):
+    with open(os.path.join(base_path, f"all_games_{PLATFORM}.csv"), 'w', encoding='utf-8') as f:
+        f.write("id,name,genres,rating,platforms\n")
+        f.writelines(lines)
+
+def fresh_manager(base_path):
+    """DataManager que lee el CSV desde cero (sin la caché en disco)."""
+    shutil.rmtree(os.path.join(base_path, '.cache'), ignore_errors=True)
+    manager = DataManager(base_path=str(base_path))
+    assert manager.load_new_data(PLATFORM)
+    return manager
+
+def names(manager, positions):
+    # reload deja las filas nuevas o modificadas al final: se comparan los nombres, no las posiciones.
+    return sorted(manager.get_dataset(PLATFORM)['name'].iloc[positions].tolist())
+
+def assert_same_catalog(reloaded, base_path):
+    fresh = fresh_manager(base_path)
+    assert len(reloaded.get_dataset(PLATFORM)) == len(fresh.get_dataset(PLATFORM))
+    for text in SEARCHES:
+        assert names(reloaded, reloaded.search_positions(PLATFORM, text)) == \
+            names(fresh, fresh.search_positions(PLATFORM, text)), text
+    for genres in GENRE_SETS:
+        assert reloaded.count_games_by_genre(PLATFORM, genres) == fresh.count_games_by_genre(PLATFORM, genres)
+    assert sorted(reloaded.datasets.get(PLATFORM).game_keys.tolist()) == \
+        sorted(fresh.datasets.get(PLATFORM).game_keys.tolist())
+
+@pytest.fixture
+def base_path(tmp_path):
+    with open(tmp_path / "genres.csv", 'w', encoding='utf-8') as f:
+        f.write("genre_id,genre\n")
+        f.writelines(f"{gid},{name}\n" for gid, name in GENRES.items())
+    write_catalog(tmp_path, catalog_lines(200))
+    return tmp_path
+
+@pytest.fixture
+def manager(base_path):
+    manager = DataManager(base_path=str(base_path))
+    assert manager.load_new_data(PLATFORM)
+    # Deja una búsqueda previa en el índice, para que la siguiente intente refinarla.
+    manager.search_positions(PLATFORM, 'dra')
+    return manager
+
+def test_reload_append(base_path, manager):
+    write_catalog(base_path, catalog_lines(200) + catalog_lines(30, start=200))
+    report = manager.reload(PLATFORM)
+    assert report['mode'] == 'append'
+    assert report['rows'] == 230
+    assert_same_catalog(manager, base_path)
+
+def test_reload_modify(base_path, manager):
+    lines = catalog_lines(200)
+    lines[5] = '5,Dragon Night Reloaded 5,"[1, 2]",77.0,"[6]"\n'
+    lines[120] = lines[120].replace('"[6]"', '"[6, 1]"')
+    write_catalog(base_path, lines)
+    report = manager.reload(PLATFORM)
+    assert report['mode'] == 'delta'
+    assert report['rows'] == 200
+    assert_same_catalog(manager, base_path)
+
+def test_reload_delete(base_path, manager):
+    lines = catalog_lines(200)
+    del lines[150:160]
+    del lines[3]
+    write_catalog(base_path, lines)
+    report = manager.reload(PLATFORM)
+    assert report['mode'] == 'delta'
+    assert report['removed'] == 11
+    assert report['rows'] == 189
+    assert_same_catalog(manager, base_path)
+
+def test_reload_duplicate_rows(base_path, manager):
+    lines = catalog_lines(200)
+    write_catalog(base_path, lines + lines[:3] + [lines[10]])
+    manager.reload(PLATFORM)
+    assert_same_catalog(manager, base_path)
+    # Quitar una de las copias solo elimina esa fila.
+    write_catalog(base_path, lines + lines[:3])
+    report = manager.reload(PLATFORM)
+    assert report['rows'] == 203
+    assert_same_catalog(manager, base_path)
+
+def test_name_index_patch_matches_rebuild():
+    names = np.array([line.split(',')[1] for line in catalog_lines(300)], dtype=object)
+    index = NameIndex(names)
+    index.search('dra')
+    keep = np.ones(len(names), dtype=bool)
+    keep[[0, 7, 150, 299]] = False
+    keep[40:60] = False
+    new_names = ['Drago Café Deluxe', 'Pokémon Dragon', 'Zzz']
+    patched = index.patch(keep, new_names)
+    rebuilt = NameIndex(np.concatenate([names[keep], np.array(new_names, dtype=object)]))
+    assert patched.names.tolist() == rebuilt.names.tolist()
+    assert np.array_equal(patched.trigrams, rebuilt.trigrams)
+    assert np.array_equal(patched.offsets, rebuilt.offsets)
+    assert np.array_equal(patched.postings, rebuilt.postings)
+    # La búsqueda refinada no puede reutilizar el resultado del índice anterior.
+    for text in ['drag', 'dragon', 'cafe', 'zz']:
+        assert np.array_equal(patched.search(text), rebuilt.search(text)), text
+
+def test_match_rows_pairs_duplicates():
+    old = np.array([1, 2, 2, 3], dtype=np.uint64)
+    new = np.array([2, 3, 4, 2, 2], dtype=np.uint64)
+    keep, fresh = match_rows(old, new)
+    assert keep.tolist() == [False, True, True, True]
+    assert fresh.tolist() == [False, False, True, False, True]